@@ -0,0 +1,12 @@
+from extremal.problems.spec import LP
+
+# The problem is defined in extremal/problems/spec.py, this script only runs it. It can also
+# be run with python -m extremal Spec --params ...
+
+###########################
+# input function calls here
+###########################
+
+LP('intersecting & diameter <= 3 over 2^[6], maximize diversity')
+#LP('antichain & diameter <= 4 over 2^[8], maximize size')
+#LP('no_disjoint_triangles 2 over ([6] choose 2), maximize size')
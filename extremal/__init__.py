@@ -0,0 +1,4 @@
+# Shared helpers and problem classes for the scripts which verify the conjectures and theorems
+# in https://arxiv.org/abs/1903.05495. The problem classes are in extremal/problems, the scripts
+# at the top of the repository only run them, so run the scripts (or python -m extremal) from
+# the top of the repository.
@@ -0,0 +1,64 @@
+# Command line interface of the problem classes. Run it from the top of the repository, e.g.
+#
+#     python -m extremal --list
+#     python -m extremal Conjecture_3.10 --params 9
+#     python -m extremal Conjecture_3.8 --params 8 4 "[[1,1,1,1,0,0,0,0],[0,0,0,0,1,1,1,1]]" "[2,1]" solver=mis
+#     python -m extremal Theorem_3.11 --params n=4 k=2 K_sizes=[4,4,4,4] --check
+#     python -m extremal Conjecture_3.10 --use Layers --params 30
+#
+# The parameters are those of the LP class of the problem, given in order or as name=value, and
+# are read as python literals (a value which is not a literal, such as mis above, is a string).
+# With --use another class of the problem is run instead of LP, e.g. the layer LP bound Layers.
+# With --check the parameters are only checked, with --cached the cached model of the parameters
+# is looked up and with --estimate the size of the model is predicted (see extremal/sizes.py);
+# none of them builds a model or imports gurobi.
+
+import argparse
+import os
+
+from extremal.problems import PROBLEMS, bind_arguments, load_problem, model_arguments, parse_params, problem_name
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m extremal', description = 'Build and solve a problem class.')
+    parser.add_argument('problem', nargs = '?', help = 'problem class, i.e. the name of its script (e.g. Conjecture_3.10)')
+    parser.add_argument('--params', nargs = '*', default = [], help = 'parameters of the LP class, in order or as name=value')
+    parser.add_argument('--use', default = 'LP', help = 'class of the problem to run instead of LP (e.g. Layers)')
+    parser.add_argument('--list', action = 'store_true', help = 'list the problem classes and their parameters')
+    parser.add_argument('--check', action = 'store_true', help = 'only check the parameters')
+    parser.add_argument('--cached', action = 'store_true', help = 'only look up the cached model of the parameters')
+    parser.add_argument('--estimate', action = 'store_true', help = 'only predict the size and memory of the model')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        import inspect
+        for problem in PROBLEMS:
+            print('{}{}'.format(problem, inspect.signature(load_problem(problem))))
+        return
+    if args.problem is None:
+        parser.error('a problem class is required (see --list)')
+
+    try:
+        problem = problem_name(args.problem)
+        params, keyword_params = parse_params(args.params)
+        arguments = bind_arguments(problem, params, keyword_params, args.use)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+
+    if args.check:
+        print('{}({})'.format(problem, ', '.join('{} = {!r}'.format(name, value) for name, value in arguments.items())))
+        return
+    if args.cached and args.use == 'LP':
+        from extremal.cache import model_path
+        path = model_path(problem, model_arguments(problem, params, keyword_params))
+        print('{} {}'.format('cached' if os.path.exists(path) else 'not cached', path))
+        return
+    if args.estimate and args.use == 'LP':
+        from extremal.sizes import describe, estimate
+        print('{}: {}'.format(problem, describe(estimate(problem, model_arguments(problem, params, keyword_params)))))
+        return
+    load_problem(problem, args.use)(*params, **keyword_params)
+
+
+if __name__ == '__main__':
+    main()
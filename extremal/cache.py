@@ -0,0 +1,193 @@
+# The following functions keep a cache of the built models, so that a model is only built once
+# for every problem class and parameters: building a model in python (e.g. the chain constraints
+# of Conjecture_3.2 or the disjoint triangles of Theorem_3.11) is often slower than solving it.
+# A built model is written as a compressed MPS file whose name is the sha256 of the problem
+# class, the parameters of the LP class which change the built model (not the choice of the
+# solver, and cuts = 'callback' is the model without cuts) and the sources of its module and of
+# the modules of the package it imports, so a changed problem or generator never reads the models
+# of its old version. Later runs, also with other solver settings (the gurobi parameters are not
+# part of the file, they are set after loading), read that file instead of enumerating the
+# constraints again.
+#
+# The cache is the directory .model_cache at the top of the repository, or the directory given
+# by the environment variable EXTREMAL_CACHE_DIR. Its size is limited by EXTREMAL_CACHE_MAX_BYTES
+# (4 GiB by default): when it is exceeded, the least recently used models are removed. Setting
+# it to 0 turns the cache off. A compressed MPS file cannot be memory-mapped, gurobi reads it
+# as a stream.
+
+import ast
+import hashlib
+import json
+import os
+
+from extremal.problems import problem_file
+
+# the directory with the scripts
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# location of the cache
+CACHE_DIR = os.environ.get('EXTREMAL_CACHE_DIR', os.path.join(REPOSITORY, '.model_cache'))
+
+# maximum total size of the cache in bytes
+MAX_CACHE_BYTES = int(os.environ.get('EXTREMAL_CACHE_MAX_BYTES', 4*2**30))
+
+# extension of the cached models, gurobi compresses the file by its extension
+EXTENSION = '.mps.gz'
+
+
+# function which returns the file of a module of the package extremal, or None if it is not one
+def module_file(module):
+    if module != 'extremal' and not module.startswith('extremal.'):
+        return None
+    path = os.path.join(REPOSITORY, *module.split('.'))
+    for candidate in (path + '.py', os.path.join(path, '__init__.py')):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+# function which returns the source files a problem class is built from: the file of its module
+# and of every module of the package extremal it imports, directly or through other modules
+# (e.g. the generators of extremal/cliques.py or extremal/specs.py), in a fixed order
+def source_files(problem):
+    files = set()
+    waiting = [problem_file(problem)]
+    while waiting:
+        path = waiting.pop()
+        if path in files:
+            continue
+        files.add(path)
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                # from extremal import params imports the module extremal.params
+                modules = [node.module] + ['{}.{}'.format(node.module, alias.name) for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                module_path = module_file(module)
+                if module_path is not None and module_path not in files:
+                    waiting.append(module_path)
+    return sorted(files)
+
+
+# function which returns the key of the model of a problem class built with the given
+# parameters: the sha256 of the class, the parameters and the sources it is built from, so that
+# a fix in a generator also changes the key
+def model_key(problem, arguments):
+    digest = hashlib.sha256()
+    digest.update(json.dumps([problem, repr(tuple(arguments))]).encode())
+    for path in source_files(problem):
+        digest.update(os.path.relpath(path, REPOSITORY).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# function which returns the path of the cached model of a problem class
+def model_path(problem, arguments):
+    return os.path.join(CACHE_DIR, problem + '-' + model_key(problem, arguments) + EXTENSION)
+
+
+# function which returns the cached model of a problem class built with the given parameters,
+# or None if it is not in the cache
+def load_model(problem, arguments):
+    if MAX_CACHE_BYTES <= 0:
+        return None
+    path = model_path(problem, arguments)
+    if not os.path.exists(path):
+        return None
+    import gurobipy as gp
+    # the modification time of a cached model is the time it was last used
+    os.utime(path)
+    return gp.read(path)
+
+
+# function which writes a built model to the cache and then removes the least recently used
+# models until the cache is within its size limit. A model larger than the limit is not cached
+def store_model(model, problem, arguments):
+    if MAX_CACHE_BYTES <= 0:
+        return
+    os.makedirs(CACHE_DIR, exist_ok = True)
+    path = model_path(problem, arguments)
+    # the file is written under another name first, so that another run never reads half a model
+    temporary = os.path.join(CACHE_DIR, 'tmp-{}-{}'.format(os.getpid(), os.path.basename(path)))
+    model.update()
+    model.write(temporary)
+    if os.path.getsize(temporary) > MAX_CACHE_BYTES:
+        os.remove(temporary)
+        return
+    os.replace(temporary, path)
+    enforce_size_limit(keep = path)
+
+
+# function which removes the least recently used models until the cache is within its size limit
+def enforce_size_limit(keep = None):
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.endswith(EXTENSION) and not name.startswith('tmp-') and os.path.isfile(path):
+            status = os.stat(path)
+            entries.append((status.st_mtime, status.st_size, path))
+    total = sum(size for (mtime, size, path) in entries)
+    for (mtime, size, path) in sorted(entries):
+        if total <= MAX_CACHE_BYTES:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # removed by another run at the same time
+            pass
+        total -= size
+
+
+# function which returns the variables of a loaded model as a dictionary from the keys they were
+# created with by model.addVars(keys, name = name), e.g. the key (0,1,1) of the variable
+# named subsets[0,1,1]
+def model_variables(model, name, keys):
+    variables = {}
+    for key in keys:
+        index = key if isinstance(key, tuple) else (key,)
+        variables[key] = model.getVarByName('{}[{}]'.format(name, ','.join(str(i) for i in index)))
+    return variables
+
+
+# RESULTS
+# The results of solved instances (see extremal/server.py) are kept next to the models as json
+# files in the directory results of the cache, keyed like the models by the problem class, all
+# the parameters of the LP class and the source of its module. They are small and not removed.
+
+# location of the results
+RESULTS_DIR = os.path.join(CACHE_DIR, 'results')
+
+
+# function which returns the path of the result of a problem class solved with the given
+# parameters
+def result_path(problem, arguments):
+    return os.path.join(RESULTS_DIR, problem + '-' + model_key(problem, arguments) + '.json')
+
+
+# function which returns the stored result of a problem class solved with the given parameters,
+# or None if there is none
+def load_result(problem, arguments):
+    path = result_path(problem, arguments)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+# function which stores the result (a dictionary which can be written as json) of a problem class
+# solved with the given parameters
+def store_result(result, problem, arguments):
+    os.makedirs(RESULTS_DIR, exist_ok = True)
+    path = result_path(problem, arguments)
+    temporary = os.path.join(RESULTS_DIR, 'tmp-{}-{}'.format(os.getpid(), os.path.basename(path)))
+    with open(temporary, 'w') as f:
+        json.dump(result, f)
+    os.replace(temporary, path)
@@ -0,0 +1,387 @@
+# The following functions check a family returned by a script against the combinatorial
+# definition of its problem, from scratch and without the solver: antichain, intersecting,
+# diameter <= d, (l+1)-chain-free, no s pairwise disjoint members and no k vertex-disjoint
+# triangles. The first violation is reported with the sets which witness it. Run it from the top
+# of the repository on the output of a script, e.g.
+#
+#     python -m extremal Conjecture_3.2 --params 8 5 2 | python -m extremal.certificates Conjecture_3.2 --params 8 5 2
+#
+# A family F of subsets of [n] is stored as a bitmap: a python integer with 2^n bits where the
+# bit at position p is set when the set with bitmask p (bit i for the element i + 1) is in F.
+# Every test is then a few shifts and masks of whole bitmaps, one for each element of [n], which
+# work on all the 2^n sets at once. For example the sets which contain a member of F (the up-set
+# of F) are found with n shifts, and F is intersecting exactly when no member has its complement
+# in the up-set. The cost is a few dozen operations on 2^n bits instead of the |F|^2 pairs, so
+# families of 10^5 sets are checked in well under a second. The ground set is at most
+# MAX_GROUND_SET elements, the size of the bitmaps grows as 2^n.
+
+import argparse
+import re
+import sys
+
+from extremal.problems import bind_arguments, parse_params, problem_name
+from extremal.subsets import popcount, to_bitmask
+
+# largest ground set of a family which is checked (bitmaps of 2^26 bits take 8 MiB)
+MAX_GROUND_SET = 26
+
+# Bitmaps.disjoint_unions shifts member by member when the family has at most SPLIT_FAMILY_SIZE
+# sets or the ground set at most SPLIT_GROUND_SET elements, and splits off the top element otherwise
+SPLIT_FAMILY_SIZE = 256
+SPLIT_GROUND_SET = 15
+
+# largest ground set for which Bitmaps.disjoint_from keeps its answers for half sets
+MAX_CACHED_GROUND_SET = 20
+
+
+# function which turns a bitmask back into a string of 0s and 1s with n entries
+def to_string(mask, n):
+    return tuple((mask >> index) & 1 for index in range(n))
+
+
+class Bitmaps:
+    # the bitmaps over the subsets of [n]: has[i] has the bit of every set which contains the
+    # element i + 1, and full has every bit
+    def __init__(self, n):
+        if n > MAX_GROUND_SET:
+            raise ValueError('the ground set has {} elements, at most {} can be checked'.format(n, MAX_GROUND_SET))
+        self.n = n
+        self.size = 1 << n
+        self.full = (1 << self.size) - 1
+        self.has = []
+        for i in range(n):
+            # the pattern of 2^i sets without the element followed by 2^i sets with it, repeated
+            period = 1 << (i + 1)
+            pattern = ((1 << (1 << i)) - 1) << (1 << i)
+            while period < self.size:
+                pattern |= pattern << period
+                period *= 2
+            self.has.append(pattern)
+        self.has_not = [self.full ^ has for has in self.has]
+        self.low_elements = (1 << (n//2)) - 1
+        self.disjoint_cache = {}
+        # the bitmaps over the subsets of [n - 1], made when needed
+        self.lower = None
+
+    # function which returns the bitmap of the family
+    def of(self, family):
+        bitmap = 0
+        for mask in family:
+            bitmap |= 1 << mask
+        return bitmap
+
+    # function which returns the sets which contain a set of the bitmap (the up-set)
+    def up_closure(self, bitmap):
+        for i in range(self.n):
+            bitmap |= (bitmap & self.has_not[i]) << (1 << i)
+        return bitmap
+
+    # function which returns the sets which are contained in a set of the bitmap (the down-set)
+    def down_closure(self, bitmap):
+        for i in range(self.n):
+            bitmap |= (bitmap & self.has[i]) >> (1 << i)
+        return bitmap
+
+    # function which returns the sets obtained from a set of the bitmap by adding one element
+    def up_step(self, bitmap):
+        result = 0
+        for i in range(self.n):
+            result |= (bitmap & self.has_not[i]) << (1 << i)
+        return result
+
+    # function which returns the sets obtained from a set of the bitmap by removing one element
+    def down_step(self, bitmap):
+        result = 0
+        for i in range(self.n):
+            result |= (bitmap & self.has[i]) >> (1 << i)
+        return result
+
+    # function which returns the sets at distance at most 1 from a set of the bitmap
+    def neighbourhood(self, bitmap):
+        return bitmap | self.up_step(bitmap) | self.down_step(bitmap)
+
+    # function which returns the complements of the sets of the bitmap
+    def complements(self, bitmap):
+        for i in range(self.n):
+            bitmap = ((bitmap & self.has[i]) >> (1 << i)) | ((bitmap & self.has_not[i]) << (1 << i))
+        return bitmap
+
+    # function which returns the sets disjoint from the set with bitmask mask. For small ground
+    # sets the answer is kept for the lower and the upper half of the elements of mask, so that
+    # it takes one operation for every further set with the same halves
+    def disjoint_from(self, mask):
+        if self.n > MAX_CACHED_GROUND_SET:
+            return self.disjoint_from_elements(mask)
+        low = mask & self.low_elements
+        return self.disjoint_from_half(low) & self.disjoint_from_half(mask ^ low)
+
+    # function which returns disjoint_from for the elements of one half, computed once
+    def disjoint_from_half(self, mask):
+        if mask not in self.disjoint_cache:
+            self.disjoint_cache[mask] = self.disjoint_from_elements(mask)
+        return self.disjoint_cache[mask]
+
+    # function which returns the sets disjoint from the set with bitmask mask, element by element
+    def disjoint_from_elements(self, mask):
+        bitmap = self.full
+        for i in range(self.n):
+            if (mask >> i) & 1:
+                bitmap &= self.has_not[i]
+        return bitmap
+
+    # function which returns the unions X + A of a set X of the bitmap and a member A of the
+    # family which are disjoint (the union of disjoint sets is their sum as bitmasks). Shifting
+    # the whole bitmap for every member is the expensive part, so while the family is large the
+    # top element is split off: X and A cannot both contain it, and the three remaining cases
+    # are the same problem on bitmaps of half the size
+    def disjoint_unions(self, bitmap, family):
+        if len(family) <= SPLIT_FAMILY_SIZE or self.n <= SPLIT_GROUND_SET:
+            result = 0
+            for mask in family:
+                result |= (bitmap & self.disjoint_from(mask)) << mask
+            return result
+        half = self.size >> 1
+        lower = self.sub_bitmaps()
+        without_top = bitmap & lower.full
+        with_top = bitmap >> half
+        top = 1 << (self.n - 1)
+        family_without_top = [mask for mask in family if not mask & top]
+        family_with_top = [mask ^ top for mask in family if mask & top]
+        result = lower.disjoint_unions(without_top, family_without_top)
+        result |= (lower.disjoint_unions(with_top, family_without_top) | lower.disjoint_unions(without_top, family_with_top)) << half
+        return result
+
+    # function which returns the bitmaps over the subsets of [n - 1]
+    def sub_bitmaps(self):
+        if self.lower is None:
+            self.lower = Bitmaps(self.n - 1)
+        return self.lower
+
+
+# function which returns the position of the lowest set bit of a bitmap
+def lowest(bitmap):
+    return (bitmap & -bitmap).bit_length() - 1
+
+
+# function which returns a violation of the antichain property as two members A, B with A a
+# strict subset of B, or None
+def antichain_violation(bitmaps, family, bitmap):
+    # the strict subsets of the members
+    below = bitmaps.down_closure(bitmaps.down_step(bitmap))
+    bad = below & bitmap
+    if not bad:
+        return None
+    a = lowest(bad)
+    b = next(mask for mask in family if mask != a and a & ~mask == 0)
+    return [a, b]
+
+
+# function which returns a violation of the intersecting property as two disjoint members (the
+# same member twice if it is the empty set), or None
+def intersecting_violation(bitmaps, family, bitmap):
+    # a member A is disjoint from a member B exactly when its complement contains B
+    bad = bitmaps.complements(bitmap) & bitmaps.up_closure(bitmap)
+    if not bad:
+        return None
+    a = (bitmaps.size - 1) ^ lowest(bad)
+    b = next(mask for mask in family if mask & a == 0)
+    return [a, b]
+
+
+# function which returns a violation of diameter <= d as two members whose symmetric difference
+# has more than d elements, or None
+def diameter_violation(bitmaps, family, bitmap, d):
+    if d >= bitmaps.n:
+        return None
+    # the distance of A to B is n minus the distance of the complement of A to B, so A is too far
+    # from a member exactly when its complement is at distance < n - d from a member
+    near = bitmap
+    for step in range(bitmaps.n - d - 1):
+        near = bitmaps.neighbourhood(near)
+    bad = bitmaps.complements(bitmap) & near
+    if not bad:
+        return None
+    a = (bitmaps.size - 1) ^ lowest(bad)
+    b = next(mask for mask in family if popcount(a ^ mask) > d)
+    return [a, b]
+
+
+# function which returns a violation of (l+1)-chain-freeness as a chain of l + 1 members, from
+# the smallest to the largest, or None
+def chain_violation(bitmaps, family, bitmap, l):
+    if not bitmap:
+        return None
+    # heights[j] are the members which are the top of a chain of j + 1 members
+    heights = [bitmap]
+    for j in range(l):
+        heights.append(bitmap & bitmaps.up_closure(bitmaps.up_step(heights[-1])))
+        if not heights[-1]:
+            return None
+    chain = [lowest(heights[l])]
+    for j in range(l - 1, -1, -1):
+        top = chain[0]
+        chain.insert(0, next(mask for mask in family if mask != top and mask & ~top == 0 and (heights[j] >> mask) & 1))
+    return chain
+
+
+# function which returns a violation of "no s pairwise disjoint members" as s pairwise disjoint
+# members, or None. unions[j] are the unions of j + 1 pairwise disjoint members, and there are s
+# pairwise disjoint members exactly when a union of a of them is disjoint from a union of s - a
+# of them, so only the unions of up to half of s members are computed
+def disjoint_violation(bitmaps, family, bitmap, s):
+    if s <= 1:
+        return [family[0]] if family else None
+    if family and family[0] == 0:
+        # the empty set is disjoint from every other member
+        rest = family[1:]
+        witness = disjoint_violation(bitmaps, rest, bitmap & ~1, s - 1)
+        return None if witness is None else [0] + witness
+    unions = [bitmap]
+    half = (s + 1)//2
+    while len(unions) < half:
+        unions.append(bitmaps.disjoint_unions(unions[-1], family))
+        if not unions[-1]:
+            return None
+    big = unions[half - 1]
+    small = unions[s - half - 1]
+    bad = bitmaps.complements(big) & bitmaps.up_closure(small)
+    if not bad:
+        return None
+    x = (bitmaps.size - 1) ^ lowest(bad)
+    y = lowest(small & bitmaps.down_closure(1 << ((bitmaps.size - 1) ^ x)))
+
+    # a union of j + 1 members is split into its members one at a time
+    def split(union, j):
+        members = []
+        while j > 0:
+            member = next(mask for mask in family if mask & ~union == 0 and (unions[j - 1] >> (union - mask)) & 1)
+            members.append(member)
+            union -= member
+            j -= 1
+        return members + [union]
+
+    return split(x, half - 1) + split(y, s - half - 1)
+
+
+# function which returns the triangles of the graph with the given edges (bitmasks with two bits
+# set) as bitmasks with three bits set
+def triangles_of(edges):
+    neighbours = {}
+    for edge in edges:
+        u = lowest(edge)
+        v = lowest(edge & ~(1 << u))
+        neighbours[u] = neighbours.get(u, 0) | (1 << v)
+        neighbours[v] = neighbours.get(v, 0) | (1 << u)
+    triangles = set()
+    for edge in edges:
+        u = lowest(edge)
+        v = lowest(edge & ~(1 << u))
+        # the common neighbours of u and v above v, so every triangle is found once
+        common = neighbours[u] & neighbours[v] & ~((1 << (v + 1)) - 1)
+        while common:
+            w = lowest(common)
+            triangles.add(edge | (1 << w))
+            common &= common - 1
+    return sorted(triangles)
+
+
+# function which checks a family of subsets of [n] (strings of 0s and 1s or bitmasks) against the
+# conditions, a list of tuples ('antichain',), ('intersecting',), ('diameter', d),
+# ('chain_free', l) for (l+1)-chain-free, ('no_disjoint', s) for no s pairwise disjoint members
+# and ('no_disjoint_triangles', k) for a family of edges without k vertex-disjoint triangles.
+# Returns None if the family satisfies all of them, otherwise the first violation as
+# (condition, list of sets which witness it) with the sets as strings of 0s and 1s
+def check_family(family, n, conditions):
+    family = sorted(set(to_bitmask(subset) for subset in family))
+    bitmaps = Bitmaps(n)
+    bitmap = bitmaps.of(family)
+    for condition in conditions:
+        name = condition[0]
+        if name == 'antichain':
+            witness = antichain_violation(bitmaps, family, bitmap)
+        elif name == 'intersecting':
+            witness = intersecting_violation(bitmaps, family, bitmap)
+        elif name == 'diameter':
+            witness = diameter_violation(bitmaps, family, bitmap, condition[1])
+        elif name == 'chain_free':
+            witness = chain_violation(bitmaps, family, bitmap, condition[1])
+        elif name == 'no_disjoint':
+            witness = disjoint_violation(bitmaps, family, bitmap, condition[1])
+        elif name == 'no_disjoint_triangles':
+            triangles = triangles_of(family)
+            witness = disjoint_violation(bitmaps, triangles, bitmaps.of(triangles), condition[1])
+        else:
+            raise ValueError('unknown condition {!r}'.format(name))
+        if witness is not None:
+            return condition, [to_string(mask, n) for mask in witness]
+    return None
+
+
+# function which returns the conditions which the family of a problem class satisfies, given the
+# arguments of its LP class as a dictionary (see extremal.problems.bind_arguments)
+def problem_conditions(problem, arguments):
+    problem = problem_name(problem)
+    if problem == 'Example_1':
+        return [('antichain',)]
+    if problem == 'Conjecture_3.1':
+        return [('antichain',), ('diameter', arguments['d'])]
+    if problem == 'Conjecture_3.2':
+        return [('diameter', arguments['d']), ('chain_free', arguments['l'])]
+    if problem == 'Conjecture_3.10':
+        return [('no_disjoint', arguments['s'])]
+    if problem == 'Theorem_3.11':
+        return [('no_disjoint_triangles', arguments['k'])]
+    if problem == 'Spec':
+        # the conditions of the specification which are checked here (see extremal/specs.py)
+        from extremal.specs import parse_spec
+        return [condition for condition in parse_spec(arguments['spec'])['conditions'] if condition[0] not in ('covering', 'regular')]
+    if problem == 'Example_2':
+        # the family is the triangles of the graph, which has no condition of its own
+        return []
+    return [('intersecting',)]
+
+
+# function which reads the family printed by a script: the lines which are strings of 0s and 1s
+# such as (0, 1, 1)
+def read_family(lines):
+    family = []
+    for line in lines:
+        if re.match(r'^\s*\(\s*[01](\s*,\s*[01])*\s*,?\s*\)\s*$', line):
+            family.append(tuple(int(entry) for entry in re.findall(r'[01]', line)))
+    return family
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = 'Check a family printed by a script against the definition of its problem.')
+    parser.add_argument('problem', help = 'problem class, i.e. the name of its script (e.g. Conjecture_3.2)')
+    parser.add_argument('--params', nargs = '*', default = [], help = 'parameters of the LP class, in order or as name=value')
+    parser.add_argument('--family', help = 'file with the output of the script (default: standard input)')
+    args = parser.parse_args(argv)
+
+    try:
+        problem = problem_name(args.problem)
+        params, keyword_params = parse_params(args.params)
+        arguments = bind_arguments(problem, params, keyword_params)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+
+    if args.family:
+        with open(args.family) as f:
+            family = read_family(f)
+    else:
+        family = read_family(sys.stdin)
+    if not family:
+        parser.error('no sets found, the family is read from lines such as (0, 1, 1)')
+
+    conditions = problem_conditions(problem, arguments)
+    violation = check_family(family, len(family[0]), conditions)
+    if violation is None:
+        print('The family of {} sets satisfies {}.'.format(len(family), ', '.join(' '.join(str(part) for part in condition) for condition in conditions) or 'no conditions'))
+        return 0
+    condition, witness = violation
+    print('Violation of {}: {}'.format(' '.join(str(part) for part in condition), ' '.join(str(subset) for subset in witness)))
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
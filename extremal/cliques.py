@@ -0,0 +1,88 @@
+# The following functions aggregate the pairwise conflict constraints x_A + x_B <= 1 of a model
+# into clique constraints sum_{A in C} x_A <= 1. A family which takes at most one set of every
+# conflicting pair takes at most one set of every clique of the conflict graph, so covering the
+# conflicting pairs by cliques gives the same integer solutions with fewer rows and a tighter
+# LP relaxation.
+#
+# The vertices of the conflict graph are the positions 0, 1, ... of the sets in the list of
+# subsets of a script, and sets of vertices are stored as bitmasks (python integers) where
+# bit i corresponds with vertex i.
+
+
+# function which returns the list of neighbourhoods (as bitmasks) of the graph on num_vertices
+# vertices with the given edges (pairs of vertices, repeated edges are allowed)
+def adjacency_from_edges(num_vertices, edges):
+    adjacency = [0 for i in range(num_vertices)]
+    for (u, v) in edges:
+        if u == v:
+            continue
+        adjacency[u] |= 1 << v
+        adjacency[v] |= 1 << u
+    return adjacency
+
+
+# function which returns the vertices of a bitmask in increasing order
+def vertices_of(mask):
+    vertices = []
+    while mask:
+        lowest_bit = mask & -mask
+        vertices.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return vertices
+
+
+# function which greedily extends clique to a maximal clique. candidates is the bitmask of the
+# vertices adjacent to all of clique. The next vertex is the candidate with the most uncovered
+# edges to the clique and the other candidates, ties broken by its number of neighbours among
+# the candidates, so the clique keeps as many choices as possible
+def grow_clique(adjacency, uncovered, clique, candidates):
+    clique_mask = 0
+    for v in clique:
+        clique_mask |= 1 << v
+    while candidates:
+        best_vertex = -1
+        best_score = (-1, -1)
+        for w in vertices_of(candidates):
+            score = (bin(uncovered[w] & (clique_mask | candidates)).count('1'),
+                     bin(adjacency[w] & candidates).count('1'))
+            if score > best_score:
+                best_vertex = w
+                best_score = score
+        clique.append(best_vertex)
+        clique_mask |= 1 << best_vertex
+        candidates &= adjacency[best_vertex]
+    return clique
+
+
+# function which covers every edge of the conflict graph by a clique and returns the cliques as
+# lists of vertices. seed_cliques are cliques known in advance (for example chains of 2^[n] or
+# families of pairwise disjoint k-sets), they are used first. The remaining edges are covered
+# by growing a maximal clique from each uncovered edge; in the comparability graph of 2^[n] these
+# are full chains, and in a disjointness graph they are families of pairwise disjoint sets
+def cover_edges_with_cliques(num_vertices, edges, seed_cliques = ()):
+    adjacency = adjacency_from_edges(num_vertices, edges)
+    # uncovered[v] holds the neighbours of v whose edge with v is in no clique yet
+    uncovered = list(adjacency)
+    cliques = []
+
+    def add_clique(clique):
+        clique_mask = 0
+        for v in clique:
+            clique_mask |= 1 << v
+        for v in clique:
+            uncovered[v] &= ~clique_mask
+        cliques.append(clique)
+
+    for clique in seed_cliques:
+        clique = list(clique)
+        for i in range(len(clique)):
+            for j in range(i + 1, len(clique)):
+                if not (adjacency[clique[i]] >> clique[j]) & 1:
+                    raise ValueError('seed clique {} contains the non-adjacent pair ({}, {})'.format(clique, clique[i], clique[j]))
+        add_clique(clique)
+
+    for u in range(num_vertices):
+        while uncovered[u]:
+            v = (uncovered[u] & -uncovered[u]).bit_length() - 1
+            add_clique(grow_clique(adjacency, uncovered, [u, v], adjacency[u] & adjacency[v]))
+    return cliques
@@ -0,0 +1,136 @@
+# The following functions give valid inequalities for families of subsets of [n], to tighten the
+# LP relaxation of models which only have pairwise or chain rows (whose LP bound is close to 2^n):
+#
+#   - LYM cuts: an antichain F of 2^[n] has sum over A in F of 1/(n choose |A|) <= 1, and an
+#     (l+1)-chain-free family has the same sum <= l (Erdos). The same holds inside every interval
+#     [C, D] = {A : C <= A <= D} of 2^[n], which is a Boolean lattice of dimension |D - C|, so
+#     there is one cut for every interval [{}, D] and [C, [n]].
+#   - shadow cuts for intersecting families: the part of layer k is at most (n-1 choose k-1) for
+#     2k <= n (Erdos-Ko-Rado), and for k < l with k + l <= n no k-set of F lies in the complement
+#     of an l-set of F, i.e. F_k misses the k-shadow of the complements of F_l. By the normalized
+#     matching property (the linear form of the Kruskal-Katona theorem) that shadow has at least
+#     |F_l| (n choose k)/(n choose l) sets, so |F_k|/(n choose k) + |F_l|/(n choose l) <= 1.
+#
+# A cut is a row (terms, rhs), terms a list of (subset, coefficient) with the subsets as strings
+# of 0s and 1s, and only the subsets which have a variable are in the terms. The rows are either
+# added to the model when it is built (add_rows) or given to the solver as cuts from a callback
+# at the root node when the relaxation violates them (row_separator).
+
+import math
+
+from extremal.subsets import popcount, to_bitmask
+
+# the choices of the cuts parameter of the problem classes
+CUT_MODES = (None, 'build', 'callback')
+
+
+# function which checks the cuts parameter of a problem class
+def check_cut_mode(cuts):
+    if cuts not in CUT_MODES:
+        raise ValueError("cuts must be None, 'build' or 'callback', not {!r}".format(cuts))
+
+
+# function which returns the cuts parameter under which a model is cached (see extremal/cache.py):
+# the cuts of a callback are not part of the built model, which is the model without cuts
+def built_cut_mode(cuts):
+    return cuts if cuts == 'build' else None
+
+
+# function which returns the sets of the given subsets by bitmask
+def by_bitmask(subsets):
+    return {to_bitmask(subset): subset for subset in subsets}
+
+
+# function which returns the LYM cuts of an (l+1)-chain-free family (an antichain for l = 1) of
+# subsets of [n], one for every interval [{}, D] and [C, [n]] of dimension at least 2
+def lym_rows(subsets, n, l = 1):
+    sets = by_bitmask(subsets)
+    everything = (1 << n) - 1
+    rows = []
+    for top in range(1 << n):
+        dimension = popcount(top)
+        if dimension < 2:
+            continue
+        # every subset of top, by the standard submask enumeration
+        terms = []
+        mask = top
+        while True:
+            if mask in sets:
+                terms.append((sets[mask], 1/math.comb(dimension, popcount(mask))))
+            if mask == 0:
+                break
+            mask = (mask - 1) & top
+        if len(terms) > l:
+            rows.append((terms, l))
+    for bottom in range(1, 1 << n):
+        free = everything ^ bottom
+        dimension = popcount(free)
+        if dimension < 2:
+            continue
+        # every superset of bottom
+        terms = []
+        mask = free
+        while True:
+            if bottom | mask in sets:
+                terms.append((sets[bottom | mask], 1/math.comb(dimension, popcount(mask))))
+            if mask == 0:
+                break
+            mask = (mask - 1) & free
+        if len(terms) > l:
+            rows.append((terms, l))
+    return rows
+
+
+# function which returns the shadow cuts of an intersecting family of subsets of [n]
+def intersecting_rows(subsets, n):
+    layers = [[] for k in range(n + 1)]
+    for subset in subsets:
+        layers[sum(subset)].append(subset)
+    rows = []
+    for k in range(1, n//2 + 1):
+        if len(layers[k]) > math.comb(n - 1, k - 1):
+            rows.append(([(subset, 1) for subset in layers[k]], math.comb(n - 1, k - 1)))
+    for k in range(1, n):
+        for l in range(k + 1, n - k + 1):
+            if layers[k] and layers[l]:
+                terms = [(subset, 1/math.comb(n, k)) for subset in layers[k]]
+                terms += [(subset, 1/math.comb(n, l)) for subset in layers[l]]
+                rows.append((terms, 1))
+    return rows
+
+
+# function which adds the rows to the model as constraints
+def add_rows(model, variables, rows):
+    import gurobipy as gp
+    for terms, rhs in rows:
+        model.addConstr(gp.quicksum(coefficient*variables[subset] for subset, coefficient in terms) <= rhs)
+
+
+# function which returns a gurobi callback which adds the rows violated by the relaxation at the
+# root node as cuts, for at most max_rounds rounds of separation. Rows are only added once
+def row_separator(model, variables, rows, max_rounds = 20, tolerance = 1e-6):
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    # cuts are only used if the presolved model can take them
+    model.Params.PreCrush = 1
+    subsets = list(variables)
+    position = {subset: i for i, subset in enumerate(subsets)}
+    rounds = [0]
+    added = set()
+
+    def callback(model, where):
+        if where != GRB.Callback.MIPNODE or rounds[0] >= max_rounds:
+            return
+        if model.cbGet(GRB.Callback.MIPNODE_STATUS) != GRB.OPTIMAL or model.cbGet(GRB.Callback.MIPNODE_NODCNT) > 0:
+            return
+        rounds[0] += 1
+        values = model.cbGetNodeRel([variables[subset] for subset in subsets])
+        for index, (terms, rhs) in enumerate(rows):
+            if index in added:
+                continue
+            if sum(coefficient*values[position[subset]] for subset, coefficient in terms) > rhs + tolerance:
+                model.cbCut(gp.quicksum(coefficient*variables[subset] for subset, coefficient in terms) <= rhs)
+                added.add(index)
+
+    return callback
@@ -0,0 +1,260 @@
+# The following functions solve "the maximum number of triangles of a graph on n vertices
+# and m edges" (Example_2) without a MIP solver, by enumerating the graphs on n vertices up
+# to isomorphism with canonical augmentation: graphs are built by adding one edge at a time,
+# and a graph G + e is only kept if e is its canonical last edge (canonical deletion) and it
+# is not isomorphic to another child of G. Every isomorphism class is then visited once.
+# Branches which cannot beat the best graph found so far are cut with upper bounds on the
+# number of triangles reachable with the remaining edges, and the search stops at once when the
+# best graph attains the Kruskal-Katona bound.
+#
+# A graph on the vertices 0, ..., n - 1 is stored as a list adjacency where adjacency[v] is the
+# bitmask (python integer) of the neighbours of v.
+
+from extremal.subsets import popcount
+
+
+# function to determine whether u and v are twins, i.e. have the same neighbours besides each
+# other. Swapping two twins is an automorphism of the graph
+def are_twins(adjacency, u, v):
+    return (adjacency[u] & ~(1 << v)) == (adjacency[v] & ~(1 << u))
+
+
+# function which refines an ordered partition of the vertices (a list of cells, which are lists
+# of vertices) until it is equitable: the vertices of a cell all have the same number of
+# neighbours in every cell. Cells are split by that number in increasing order, so the result
+# only depends on the graph and the partition and not on the names of the vertices
+def refine(adjacency, partition):
+    partition = [list(cell) for cell in partition]
+    changed = True
+    while changed:
+        changed = False
+        for splitter in range(len(partition)):
+            splitter_mask = 0
+            for v in partition[splitter]:
+                splitter_mask |= 1 << v
+            refined = []
+            for cell in partition:
+                if len(cell) == 1:
+                    refined.append(cell)
+                    continue
+                by_count = {}
+                for v in cell:
+                    by_count.setdefault(popcount(adjacency[v] & splitter_mask), []).append(v)
+                for count in sorted(by_count):
+                    refined.append(by_count[count])
+            if len(refined) != len(partition):
+                partition = refined
+                changed = True
+                break
+    return partition
+
+
+# function which returns the canonical form of a graph as (certificate, labelling). Two graphs
+# are isomorphic exactly when their certificates are equal, and labelling[v] is the canonical
+# label of the vertex v. This is an individualization-refinement search: the first non-trivial
+# cell of the equitable partition is split by individualizing each of its vertices in turn
+# (only one vertex of every class of twins, the others give the same leaves) and the smallest
+# relabelled adjacency over all the leaves is the certificate
+def canonical_form(adjacency):
+    n = len(adjacency)
+    best = [None, None]
+
+    def search(partition):
+        partition = refine(adjacency, partition)
+        for position in range(len(partition)):
+            if len(partition[position]) > 1:
+                break
+        else:
+            # every cell is a single vertex, this is a labelling of the graph
+            labelling = [0 for v in range(n)]
+            for label, cell in enumerate(partition):
+                labelling[cell[0]] = label
+            certificate = [0 for v in range(n)]
+            for v in range(n):
+                for w in range(n):
+                    if (adjacency[v] >> w) & 1:
+                        certificate[labelling[v]] |= 1 << labelling[w]
+            certificate = tuple(certificate)
+            if best[0] is None or certificate < best[0]:
+                best[0] = certificate
+                best[1] = labelling
+            return
+        cell = partition[position]
+        tried = []
+        for v in cell:
+            if any(are_twins(adjacency, u, v) for u in tried):
+                continue
+            tried.append(v)
+            rest = [u for u in cell if u != v]
+            search(partition[:position] + [[v], rest] + partition[position + 1:])
+
+    search([list(range(n))])
+    return best[0], best[1]
+
+
+# function which returns the canonical last edge of a graph from its canonical labelling: the
+# edge whose endpoints have the largest labels. It is the same for isomorphic graphs up to an
+# automorphism
+def canonical_edge(adjacency, labelling):
+    n = len(adjacency)
+    best_edge = None
+    best_labels = None
+    for u in range(n):
+        for v in range(u + 1, n):
+            if (adjacency[u] >> v) & 1:
+                labels = (max(labelling[u], labelling[v]), min(labelling[u], labelling[v]))
+                if best_labels is None or labels > best_labels:
+                    best_edge = (u, v)
+                    best_labels = labels
+    return best_edge
+
+
+# function to determine the number of triangles of a graph
+def count_triangles(adjacency):
+    n = len(adjacency)
+    triangles = 0
+    for u in range(n):
+        for v in range(u + 1, n):
+            if (adjacency[u] >> v) & 1:
+                # common neighbours above v, so every triangle is counted once
+                triangles += popcount(adjacency[u] & adjacency[v] & ~((1 << (v + 1)) - 1))
+    return triangles
+
+
+# function which bounds the number of triangles of any graph obtained from the graph by adding
+# remaining edges. A new triangle with one new edge uv is closed by a common neighbour of u and v
+# in the graph, so these are at most the largest remaining codegrees. Two new edges lie in at
+# most one common triangle, so the new triangles with two or three new edges are at most the
+# number of pairs of new edges. Also every new edge is in at most n - 2 triangles
+def codegree_upper_bound(adjacency, triangles, remaining):
+    n = len(adjacency)
+    codegrees = []
+    for u in range(n):
+        for v in range(u + 1, n):
+            if not (adjacency[u] >> v) & 1:
+                codegrees.append(popcount(adjacency[u] & adjacency[v]))
+    codegrees.sort(reverse = True)
+    by_pairs = sum(codegrees[:remaining]) + remaining*(remaining - 1)//2
+    by_edges = sum(min(codegree + remaining - 1, n - 2) for codegree in codegrees[:remaining])
+    return triangles + min(by_pairs, by_edges)
+
+
+# function which bounds the number of triangles of any graph H on m edges obtained from the
+# graph by adding remaining edges through its degrees. A vertex of degree d is in at most
+# min(d choose 2, m - d) triangles (the edges between its neighbours are not incident to it),
+# and every triangle has three vertices. The degrees of H are at least those of the graph,
+# at most n - 1 and add up to 2m; the best such degree sequence is found by dynamic programming
+# over the vertices and the number of extra degrees handed out so far
+def degree_upper_bound(adjacency, remaining):
+    n = len(adjacency)
+    degrees = [popcount(adjacency[v]) for v in range(n)]
+    m = sum(degrees)//2 + remaining
+    extra = 2*remaining
+    # best[b] is the largest sum over the vertices so far with b extra degrees handed out
+    best = [0] + [None for b in range(extra)]
+    for v in range(n):
+        new_best = [None for b in range(extra + 1)]
+        for b in range(extra + 1):
+            if best[b] is None:
+                continue
+            for d in range(degrees[v], min(n - 1, degrees[v] + extra - b) + 1):
+                value = best[b] + min(d*(d - 1)//2, m - d)
+                position = b + d - degrees[v]
+                if new_best[position] is None or value > new_best[position]:
+                    new_best[position] = value
+        best = new_best
+    return best[extra]//3
+
+
+# function which bounds the number of triangles of any graph obtained from the graph (which has
+# the given number of triangles) by adding remaining edges
+def triangle_upper_bound(adjacency, triangles, remaining):
+    if remaining == 0:
+        return triangles
+    return min(codegree_upper_bound(adjacency, triangles, remaining), degree_upper_bound(adjacency, remaining))
+
+
+# function which returns the edges (u, v) with u < v of the graph in order
+def edges_of(adjacency):
+    n = len(adjacency)
+    return [(u, v) for u in range(n) for v in range(u + 1, n) if (adjacency[u] >> v) & 1]
+
+
+# function which returns the maximum number of triangles of a graph with m edges given by the
+# Kruskal-Katona theorem: writing m = (a choose 2) + b with 0 <= b < a, it is
+# (a choose 3) + (b choose 2)
+def kruskal_katona_bound(m):
+    a = 1
+    while (a + 1)*a//2 <= m:
+        a += 1
+    b = m - a*(a - 1)//2
+    return a*(a - 1)*(a - 2)//6 + b*(b - 1)//2
+
+
+# function which returns the graph on n vertices made of the first m edges in colex order,
+# (0,1), (0,2), (1,2), (0,3), ... It attains the Kruskal-Katona bound and is the first
+# incumbent of the search
+def colex_graph(n, m):
+    adjacency = [0 for v in range(n)]
+    added = 0
+    for v in range(n):
+        for u in range(v):
+            if added == m:
+                return adjacency
+            adjacency[u] |= 1 << v
+            adjacency[v] |= 1 << u
+            added += 1
+    return adjacency
+
+
+# function which returns (max number of triangles, list of edges of an extremal graph) over all
+# the graphs on n vertices with m edges. With kruskal_katona the search stops as soon as the
+# best graph attains the Kruskal-Katona bound (which the colex graph does, so it returns at
+# once); without it the bound is proven by the enumeration alone, which is an independent check
+# but only fast for small n
+def max_triangles(n, m, kruskal_katona = True):
+    if m < 0 or m > n*(n - 1)//2:
+        raise ValueError('a graph on {} vertices has between 0 and {} edges, not {}'.format(n, n*(n - 1)//2, m))
+
+    incumbent = colex_graph(n, m)
+    best = [count_triangles(incumbent), incumbent]
+    if kruskal_katona and best[0] >= kruskal_katona_bound(m):
+        return best[0], edges_of(best[1])
+
+    def search(adjacency, triangles, num_edges, certificate):
+        if num_edges == m:
+            if triangles > best[0]:
+                best[0] = triangles
+                best[1] = list(adjacency)
+            return
+        # children of this graph which were already accepted, to reject isomorphic copies
+        seen = set()
+        for u in range(n):
+            for v in range(u + 1, n):
+                if (adjacency[u] >> v) & 1:
+                    continue
+                child = list(adjacency)
+                child[u] |= 1 << v
+                child[v] |= 1 << u
+                child_triangles = triangles + popcount(adjacency[u] & adjacency[v])
+                # only strictly better graphs are of interest
+                if triangle_upper_bound(child, child_triangles, m - num_edges - 1) <= best[0]:
+                    continue
+                child_certificate, labelling = canonical_form(child)
+                if child_certificate in seen:
+                    continue
+                # canonical deletion: the child is only generated from the parent obtained by
+                # removing its canonical last edge
+                (a, b) = canonical_edge(child, labelling)
+                parent = list(child)
+                parent[a] &= ~(1 << b)
+                parent[b] &= ~(1 << a)
+                if canonical_form(parent)[0] != certificate:
+                    continue
+                seen.add(child_certificate)
+                search(child, child_triangles, num_edges + 1, child_certificate)
+
+    empty = [0 for v in range(n)]
+    if triangle_upper_bound(empty, 0, m) > best[0]:
+        search(empty, 0, 0, canonical_form(empty)[0])
+    return best[0], edges_of(best[1])
@@ -0,0 +1,116 @@
+# The following class stores the incidence matrix of a list of subsets (the rows, in the order of
+# the list) against the elements of the ground set (the columns) in compressed sparse row form,
+# together with its transpose, and the functions below build the constraint blocks which only
+# depend on which sets contain which elements:
+#
+#   - degree dominance (Conjectures 3.3 to 3.5): |F(i)| <= |F(1)| for every element i, where F(i)
+#     is the part of the family containing i,
+#   - covering (Conjectures 3.6 and 3.7): every element is missed by some set of the family,
+#   - regularity (Theorem 3.9): every s-set is contained in the same number of sets of the family.
+#
+# A row of a block is (terms, sense, rhs) with terms a list of (position, coefficient), the
+# positions being those of the sets in the list, and sense '<', '>' or '=' as in gurobi. The
+# blocks are computed from the columns (the positions of the sets containing an element) as
+# differences, complements and intersections of sorted lists, so the sets are walked through once
+# to build the matrix instead of once per row.
+
+import itertools
+import math
+
+
+class Incidence:
+    def __init__(self, subsets, n):
+        self.n = n
+        self.num_sets = len(subsets)
+        # compressed sparse rows: the elements of the set at position p are
+        # indices[indptr[p]:indptr[p + 1]], in increasing order
+        self.indptr = [0]
+        self.indices = []
+        for subset in subsets:
+            self.indices.extend(index for index in range(n) if subset[index])
+            self.indptr.append(len(self.indices))
+        # the transpose: columns[i] lists the positions of the sets containing the element i + 1
+        self.columns = [[] for index in range(n)]
+        for position in range(self.num_sets):
+            for index in self.indices[self.indptr[position]:self.indptr[position + 1]]:
+                self.columns[index].append(position)
+
+    # the elements (indices) of the set at a position
+    def row(self, position):
+        return self.indices[self.indptr[position]:self.indptr[position + 1]]
+
+    # the positions of the sets containing the element index + 1
+    def containing(self, index):
+        return self.columns[index]
+
+    # the positions of the sets missing the element index + 1
+    def missing(self, index):
+        column = set(self.columns[index])
+        return [position for position in range(self.num_sets) if position not in column]
+
+    # the positions of the sets containing every element of the given indices, by intersecting the
+    # columns from the shortest one
+    def containing_all(self, indices):
+        if not indices:
+            return list(range(self.num_sets))
+        columns = sorted((self.columns[index] for index in indices), key = len)
+        positions = columns[0]
+        for column in columns[1:]:
+            column = set(column)
+            positions = [position for position in positions if position in column]
+        return positions
+
+    # codegree index: the list, for every s-set of [n] by its rank in colex order (see rank), of the
+    # positions of the sets containing it. It is filled by walking through the s-subsets of every
+    # set once
+    def codegrees(self, s):
+        containing = [[] for r in range(math.comb(self.n, s))]
+        for position in range(self.num_sets):
+            for elements in itertools.combinations(self.row(position), s):
+                containing[rank(elements)].append(position)
+        return containing
+
+
+# rank of a set in the combinatorial number system, i.e. its position among the subsets of the
+# same size in colex order. elements lists the indices of the set in increasing order
+def rank(elements):
+    return sum(math.comb(element, i + 1) for i, element in enumerate(elements))
+
+
+# function which returns the terms of the difference of the rows with the given lists of positions
+# (sum over plus minus sum over minus), sets in both cancel out
+def difference(plus, minus):
+    coefficients = dict.fromkeys(plus, 1)
+    for position in minus:
+        coefficients[position] = coefficients.get(position, 0) - 1
+    return [(position, coefficient) for position, coefficient in coefficients.items() if coefficient != 0]
+
+
+# function which returns the degree dominance block: |F(i)| - |F(element + 1)| <= 0 for every
+# other element i, i.e. the maximum degree is attained at the element with index element
+def degree_rows(incidence, element = 0):
+    return [(difference(incidence.containing(index), incidence.containing(element)), '<', 0)
+            for index in range(incidence.n) if index != element]
+
+
+# function which returns the covering block: for every element, the sets missing it have at least
+# one set in the family
+def missed_rows(incidence):
+    return [([(position, 1) for position in incidence.missing(index)], '>', 1) for index in range(incidence.n)]
+
+
+# function which returns the regularity block: every s-set is contained in as many sets of the
+# family as the s-set of rank 0, i.e. {1, ..., s}
+def regularity_rows(incidence, s):
+    containing = incidence.codegrees(s)
+    return [(difference(containing[0], containing[r]), '=', 0) for r in range(1, len(containing))]
+
+
+# function which adds the rows of a block to the model, where subsets lists the keys of the
+# variables by position
+def add_block(model, variables, subsets, rows):
+    import gurobipy as gp
+    for terms, sense, rhs in rows:
+        expression = gp.LinExpr([coefficient for position, coefficient in terms],
+                                [variables[subsets[position]] for position, coefficient in terms])
+        model.addLConstr(expression, sense, rhs)
@@ -0,0 +1,148 @@
+# The following functions reduce a family of subsets of [n] to a canonical form under the
+# permutations of [n], so that two families are isomorphic (one is the image of the other under
+# a relabelling of the elements) exactly when their canonical forms are equal.
+#
+# A family is a tuple of groups, each a list of bitmasks (bit i for the element i + 1), e.g. the
+# sets of Example_1 or the triangles and the edges of Example_2: a permutation acts on every
+# group at once. The canonical form is the smallest relabelled family over the leaves of an
+# individualization-refinement search on the elements, as for the graphs of extremal/graphs.py:
+# the elements are split by invariants (how many of their sets meet every cell of the partition)
+# until the partition is equitable, then the first non-trivial cell is split by individualizing
+# each of its elements in turn. Two elements whose transposition maps the family onto itself give
+# the same leaves, so only one of them is tried, which keeps the search small for the very
+# symmetric families (e.g. a whole layer of 2^[n]) where every element would be tried otherwise.
+
+from extremal.subsets import popcount
+
+
+# function which returns the image of a bitmask under a permutation, where permutation[i] is the
+# image of the element i + 1 (as an index)
+def permute_mask(mask, permutation):
+    image = 0
+    while mask:
+        lowest = mask & -mask
+        image |= 1 << permutation[lowest.bit_length() - 1]
+        mask ^= lowest
+    return image
+
+
+# function which returns the image of a family under a permutation, every group sorted
+def permute_family(family, permutation):
+    return tuple(tuple(sorted(permute_mask(mask, permutation) for mask in group)) for group in family)
+
+
+# function which returns the family with every group sorted, the form the functions below compare
+def sorted_family(family):
+    return tuple(tuple(sorted(group)) for group in family)
+
+
+# function to determine whether swapping the elements u and v maps the family onto itself
+def swap_is_automorphism(family, u, v):
+    pair = (1 << u) | (1 << v)
+    for group in family:
+        members = set(group)
+        for mask in group:
+            # only the sets with exactly one of u and v move
+            if popcount(mask & pair) == 1 and mask ^ pair not in members:
+                return False
+    return True
+
+
+# function which refines an ordered partition of the elements (a list of cells, which are lists of
+# element indices) until it is equitable: the elements of a cell all lie in the same numbers of
+# sets of every group meeting the cells in the same numbers of elements. Cells are split by that
+# invariant in increasing order, so the result only depends on the family and the partition and
+# not on the names of the elements
+def refine(family, n, partition):
+    partition = [list(cell) for cell in partition]
+    while True:
+        cell_masks = []
+        for cell in partition:
+            cell_mask = 0
+            for element in cell:
+                cell_mask |= 1 << element
+            cell_masks.append(cell_mask)
+        # the profile of a set is the number of its elements in every cell
+        profiles = [[tuple(popcount(mask & cell_mask) for cell_mask in cell_masks) for mask in group] for group in family]
+        refined = []
+        for cell in partition:
+            if len(cell) == 1:
+                refined.append(cell)
+                continue
+            by_invariant = {}
+            for element in cell:
+                invariant = tuple(tuple(sorted(profile for mask, profile in zip(group, group_profiles) if (mask >> element) & 1))
+                                  for group, group_profiles in zip(family, profiles))
+                by_invariant.setdefault(invariant, []).append(element)
+            for invariant in sorted(by_invariant):
+                refined.append(by_invariant[invariant])
+        if len(refined) == len(partition):
+            return partition
+        partition = refined
+
+
+# function which returns the canonical form of a family of subsets of [n] as (certificate,
+# permutation). Two families are isomorphic exactly when their certificates are equal, and the
+# certificate is the image of the family under permutation (the canonical labels of the elements)
+def canonical_form(family, n):
+    family = sorted_family(family)
+    best = [None, None]
+
+    def search(partition):
+        partition = refine(family, n, partition)
+        for position in range(len(partition)):
+            if len(partition[position]) > 1:
+                break
+        else:
+            # every cell is a single element, this is a labelling of the elements
+            permutation = [0 for element in range(n)]
+            for label, cell in enumerate(partition):
+                permutation[cell[0]] = label
+            certificate = permute_family(family, permutation)
+            if best[0] is None or certificate < best[0]:
+                best[0] = certificate
+                best[1] = permutation
+            return
+        cell = partition[position]
+        tried = []
+        for element in cell:
+            if any(swap_is_automorphism(family, other, element) for other in tried):
+                continue
+            tried.append(element)
+            rest = [other for other in cell if other != element]
+            search(partition[:position] + [[element], rest] + partition[position + 1:])
+
+    search([list(range(n))])
+    return best[0], best[1]
+
+
+# function which returns the certificate of the canonical form of a family
+def certificate(family, n):
+    return canonical_form(family, n)[0]
+
+
+# function which returns the images of a family under the permutations of [n] (its orbit), each
+# with its groups sorted, found by applying a transposition and an n-cycle (which generate all
+# the permutations) until no new image appears. At most limit images are returned, the orbit of
+# a family with few automorphisms has n! of them
+def orbit(family, n, limit = None):
+    family = sorted_family(family)
+    generators = []
+    if n > 1:
+        generators.append([1, 0] + list(range(2, n)))
+        generators.append([(element + 1) % n for element in range(n)])
+    images = {family}
+    frontier = [family]
+    while frontier:
+        next_frontier = []
+        for image in frontier:
+            for generator in generators:
+                new_image = permute_family(image, generator)
+                if new_image in images:
+                    continue
+                if limit is not None and len(images) >= limit:
+                    return list(images)
+                images.add(new_image)
+                next_frontier.append(new_image)
+        frontier = next_frontier
+    return list(images)
@@ -0,0 +1,153 @@
+# The following functions bound problems which are invariant under permuting [n] (Example_1,
+# Conjecture_3.1, Conjecture_3.10) with a linear program with one variable per layer instead of
+# one per subset. Averaging a feasible family F over all the permutations of [n] gives
+# y_k = |F_k|/(n choose k), the fraction of the k-sets which are in F, and every constraint of
+# the original model averages to a constraint on the y_k: if at most r sets of a family with
+# sizes k_1, ..., k_m can be in F, then so can at most r sets of each of its images, so
+# y_{k_1} + ... + y_{k_m} <= r. The maximum of sum (n choose k) y_k is then an upper bound on |F|
+# which only takes n + 1 variables, e.g. for n = 20 to 40.
+#
+# The rows come from families whose images are all constraints of the model (chains, pairwise
+# disjoint sets, ...), and since there are exponentially many of them the most violated one is
+# found by a knapsack over the sizes of the sets and added until none is violated. The bound is
+# certified from the duals of the last LP in exact arithmetic: for any duals p_r >= 0 of the rows,
+# sum p_r rhs_r + sum over k of max(0, (n choose k) - sum p_r c_rk) is an upper bound by weak
+# duality, whatever the rounding errors of the solver.
+
+import math
+from fractions import Fraction
+
+
+# function which returns the row of the chains: a chain has at most one set in an antichain, and
+# every layer has a set in some maximal chain
+def chain_row(n):
+    return ({k: 1 for k in range(n + 1)}, 1)
+
+
+# function which returns (value, counts) of the best multiset of sizes (counts[k] sets of size k)
+# with sizes in sizes and total size at most budget, where a set of size k is worth values[k]
+# (an unbounded knapsack)
+def best_multiset(values, sizes, budget):
+    best = [0.0 for b in range(budget + 1)]
+    choice = [None for b in range(budget + 1)]
+    for b in range(1, budget + 1):
+        best[b] = best[b - 1]
+        for k in sizes:
+            if 0 < k <= b and best[b - k] + values[k] > best[b]:
+                best[b] = best[b - k] + values[k]
+                choice[b] = k
+    counts = {}
+    b = budget
+    while b > 0:
+        if choice[b] is None:
+            b -= 1
+        else:
+            counts[choice[b]] = counts.get(choice[b], 0) + 1
+            b -= choice[b]
+    return best[budget], counts
+
+
+# function which returns the separator of the rows of "no s pairwise disjoint members": any s of
+# the empty set and pairwise disjoint non-empty sets of sizes k_1, ..., k_m (with total at most n)
+# are pairwise disjoint, so at most s - 1 of them are in the family
+def disjoint_parts_separator(n, s):
+    def separate(values):
+        value, counts = best_multiset(values, range(1, n + 1), n)
+        counts[0] = 1
+        return [(counts, s - 1)]
+    return separate
+
+
+# function which returns the separator of the rows of "antichain of diameter <= d": pairwise
+# disjoint non-empty sets whose sizes add up to more than d pairwise are too far apart, the empty
+# set and [n] are comparable with every set, so at most one of them is in the family. Taking
+# complements gives the rows with the layers reversed
+def far_parts_separator(n, d):
+    def separate(values):
+        best = None
+        for smallest in range(1, n):
+            # the other sets have at least smallest and at least d + 1 - smallest elements
+            sizes = range(max(smallest, d + 1 - smallest), n)
+            for reverse in (False, True):
+                layer_values = values[::-1] if reverse else values
+                value, counts = best_multiset(layer_values, sizes, n - smallest)
+                value += layer_values[smallest]
+                if best is None or value > best[0]:
+                    counts = dict(counts)
+                    counts[smallest] = counts.get(smallest, 0) + 1
+                    if reverse:
+                        counts = {n - k: count for k, count in counts.items()}
+                    best = (value, counts)
+        if best is None:
+            return []
+        counts = best[1]
+        counts[0] = counts.get(0, 0) + 1
+        counts[n] = counts.get(n, 0) + 1
+        return [(counts, 1)]
+    return separate
+
+
+# function which returns the upper bound of sum (n choose k) y_k from the duals of the rows, in
+# exact arithmetic (see the top of the file)
+def certified_bound(n, rows, duals):
+    bound = Fraction(0)
+    covered = [Fraction(0) for k in range(n + 1)]
+    for (coefficients, rhs), dual in zip(rows, duals):
+        dual = max(Fraction(dual), Fraction(0))
+        bound += dual*rhs
+        for k, coefficient in coefficients.items():
+            covered[k] += dual*coefficient
+    for k in range(n + 1):
+        bound += max(Fraction(0), math.comb(n, k) - covered[k])
+    return bound
+
+
+# function which solves the layer LP with the rows (pairs (coefficients, rhs) where coefficients
+# maps a layer k to the coefficient of y_k) and the rows found by separate (a function of the
+# current y which returns candidate rows), and returns (bound, y, rows) where bound is the
+# certified upper bound on the size of the family, rounded down
+def layer_bound(n, rows, separate = None, max_rounds = 1000, tolerance = 1e-9):
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    rows = list(rows)
+    model = gp.Model('layers')
+    model.Params.LogToConsole = 0
+    # the duals are as exact as the solver allows, they give the certified bound
+    model.Params.OptimalityTol = 1e-9
+    model.Params.FeasibilityTol = 1e-9
+    y = model.addVars(range(n + 1), lb = 0, ub = 1, name = 'layers')
+    constraints = [model.addConstr(gp.quicksum(c*y[k] for k, c in coefficients.items()) <= rhs)
+                   for coefficients, rhs in rows]
+    # the objective is scaled by 2^n, the sizes of the layers are too large for the solver at n = 40
+    model.setObjective(gp.quicksum(math.comb(n, k)/2**n*y[k] for k in range(n + 1)), GRB.MAXIMIZE)
+
+    for separation_round in range(max_rounds):
+        model.optimize()
+        values = [y[k].X for k in range(n + 1)]
+        violated = []
+        if separate is not None:
+            for coefficients, rhs in separate(values):
+                if sum(c*values[k] for k, c in coefficients.items()) > rhs + tolerance:
+                    violated.append((coefficients, rhs))
+        if not violated:
+            break
+        for coefficients, rhs in violated:
+            rows.append((coefficients, rhs))
+            constraints.append(model.addConstr(gp.quicksum(c*y[k] for k, c in coefficients.items()) <= rhs))
+    else:
+        # the rounds ran out with the rows of the last round added, the duals are read from the
+        # LP with all of them
+        model.optimize()
+        values = [y[k].X for k in range(n + 1)]
+
+    duals = [Fraction(constraint.Pi)*2**n for constraint in constraints]
+    return math.floor(certified_bound(n, rows, duals)), values, rows
+
+
+# function which prints the fraction of every layer in the optimal solution of a layer LP
+def print_layers(values):
+    print('The fractions of the layers are as follows.')
+    for k in range(len(values)):
+        if values[k] > 1e-9:
+            print('layer {}: {:.6f}'.format(k, values[k]))
@@ -0,0 +1,188 @@
+# The following runs a sweep of instances of a problem class (e.g. Conjecture_3.2 for n = 6, 7, 8)
+# where every instance starts from the optimum of the previous one: the optimal family on [n] is
+# lifted to a feasible family of the next instance, which is given to gurobi as a MIP start
+# (see start in extremal/params.py), so that the largest instances of the sweep start with a good
+# incumbent instead of from scratch. Run it from the top of the repository, e.g.
+#
+#     python -m extremal.lifting Conjecture_3.2 --params 6 5 2 --params 7 5 2 --params 8 5 2
+#
+# A family is lifted by the rule of its problem class (LIFTS):
+#
+#   - most classes (greedy): the sets of the family are embedded in [n'] (the new elements are in
+#     none of them) and then the sets of the next instance containing a new element, and after
+#     them the others, are added one at a time from the sizes closest to the family shifted by
+#     (n' - n)/2, e.g. F together with {A + {n+1}} for the sets A next to the sets of F. A set is
+#     only kept if the family still satisfies every condition of the problem
+#     (extremal/certificates.py) and the rule of the class the certificates do not check (the
+#     degree of the element 1 in Conjectures 3.3 to 3.5), so the lifted family is feasible also
+#     when the other parameters of the next instance are stricter,
+#   - Example_2: the edges of the graph are kept, the edges closing the most triangles are added
+#     (or those in the fewest triangles removed) until the graph has m' edges, and the triangles
+#     are those of the graph.
+#
+# The classes without a rule (Conjectures 3.6 to 3.8, Theorems 3.9 and 3.11, whose families are
+# tied to their partitions or are regular) are solved from scratch in a sweep.
+
+import argparse
+import time
+
+import extremal.params as params
+from extremal.certificates import check_family, problem_conditions
+from extremal.optima import family_variables
+from extremal.problems import bind_arguments, load_problem, parse_params, problem_name
+from extremal.subsets import popcount
+
+
+# function which returns the name of the variable of a set, e.g. subsets[0,1,1]
+def variable_name(group, mask, n):
+    return '{}[{}]'.format(group, ','.join(str((mask >> index) & 1) for index in range(n)))
+
+
+# function to determine whether the element 1 has the largest degree of the family, as in the
+# diversity problems (Conjectures 3.3 to 3.5)
+def degree_at_first(family, n):
+    degrees = [sum((mask >> index) & 1 for mask in family) for index in range(n)]
+    return all(degree <= degrees[0] for degree in degrees)
+
+
+# function which returns the sets the family of an instance is made of, as bitmasks
+def ground_family(problem, arguments):
+    n = arguments['n']
+    if problem == 'Conjecture_3.3':
+        return [mask for mask in range(1 << n) if popcount(mask) == arguments['k']]
+    return list(range(1 << n))
+
+
+# function which lifts a family (bitmasks of subsets of [n]) to a feasible family of the instance
+# of the problem class with the given arguments, greedily as described above
+def lift_greedy(problem, family, n, arguments):
+    new_n = arguments['n']
+    conditions = problem_conditions(problem, arguments)
+    extra = degree_at_first if problem in ('Conjecture_3.3', 'Conjecture_3.4', 'Conjecture_3.5') else None
+    old_sets = set(family)
+    new_elements = ((1 << new_n) - 1) ^ ((1 << n) - 1)
+    target = (sum(popcount(mask) for mask in family)/len(family) if family else n/2) + (new_n - n)/2
+    ground = ground_family(problem, arguments)
+    candidates = sorted((mask for mask in ground if mask not in old_sets),
+                        key = lambda mask: (not mask & new_elements, abs(popcount(mask) - target), popcount(mask), mask))
+    members = set(ground)
+    lifted = []
+    for mask in sorted(mask for mask in family if mask in members) + candidates:
+        trial = lifted + [mask]
+        if check_family(trial, new_n, conditions) is None and (extra is None or extra(trial, new_n)):
+            lifted = trial
+    return {'subsets': lifted}
+
+
+# function which lifts the graph of Example_2 (its edges as bitmasks with two bits set) to a
+# graph on n' vertices with m' edges and its triangles
+def lift_graph(problem, family, n, arguments):
+    new_n, m = arguments['n'], arguments['m']
+    edges = set(family)
+    all_edges = [(1 << u) | (1 << v) for v in range(new_n) for u in range(v)]
+
+    # the number of triangles an edge uv closes (or is in): the common neighbours of u and v
+    def codegree(edge):
+        u, v = [index for index in range(new_n) if (edge >> index) & 1]
+        return sum(1 for w in range(new_n) if ((1 << u) | (1 << w)) in edges and ((1 << v) | (1 << w)) in edges)
+
+    while len(edges) > m:
+        edges.remove(min(sorted(edges), key = codegree))
+    while len(edges) < m:
+        edges.add(max((edge for edge in all_edges if edge not in edges), key = lambda edge: (codegree(edge), -edge)))
+    triangles = [(1 << u) | (1 << v) | (1 << w) for w in range(new_n) for v in range(w) for u in range(v)
+                 if {(1 << u) | (1 << v), (1 << u) | (1 << w), (1 << v) | (1 << w)} <= edges]
+    return {'edges': sorted(edges), 'triangles': triangles}
+
+
+# the lifting rule of every problem class which has one, called as rule(problem, family, n,
+# arguments) with the family of the solved instance (its main group of variables) and the
+# arguments of the next instance, returning the groups of the lifted family
+LIFTS = {
+    'Example_1': lift_greedy,
+    'Example_2': lift_graph,
+    'Conjecture_3.1': lift_greedy,
+    'Conjecture_3.2': lift_greedy,
+    'Conjecture_3.3': lift_greedy,
+    'Conjecture_3.4': lift_greedy,
+    'Conjecture_3.5': lift_greedy,
+    'Conjecture_3.10': lift_greedy,
+}
+
+# the group of variables a lifting rule starts from
+LIFTED_GROUPS = {'Example_2': 'edges'}
+
+
+# function which returns the family of the solution of a solved model as {group: [bitmask]} and
+# the size of the ground set, or None if there is no solution
+def solved_family(model):
+    if model.SolCount == 0:
+        return None
+    groups, n = family_variables(model)
+    family = {}
+    for group, variables in groups.items():
+        values = model.getAttr('X', [variable for mask, variable in variables])
+        family[group] = [mask for (mask, variable), value in zip(variables, values) if value > 0.5]
+    return family, n
+
+
+# function which returns the MIP start of the next instance from the family of the solved one, or
+# None if the problem class has no lifting rule or the next instance has fewer elements
+def lifted_start(problem, solved, arguments):
+    if problem not in LIFTS or solved is None:
+        return None
+    family, n = solved
+    if arguments['n'] < n:
+        return None
+    lifted = LIFTS[problem](problem, family[LIFTED_GROUPS.get(problem, 'subsets')], n, arguments)
+    return {variable_name(group, mask, arguments['n']): 1 for group, masks in lifted.items() for mask in masks}
+
+
+# function which runs the instances of a problem class in order, each from the lifted optimum of
+# the previous one (without lifting when cold is set), and returns for every instance its
+# arguments, the number of variables set in its start and its running time
+def sweep(problem, instances, cold = False):
+    problem = problem_name(problem)
+    report = []
+    solved = None
+    for args, kwargs in instances:
+        arguments = bind_arguments(problem, args, kwargs)
+        params.start = None if cold else lifted_start(problem, solved, arguments)
+        params.recorded_models = []
+        begin = time.time()
+        try:
+            load_problem(problem)(*args, **kwargs)
+            models = params.recorded_models
+        finally:
+            started = params.start
+            params.start = None
+            params.recorded_models = None
+        report.append((arguments, len(started) if started is not None else None, time.time() - begin))
+        solved = solved_family(models[-1]) if models else None
+    return report
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m extremal.lifting', description = 'Run a sweep of a problem class, every instance from the lifted optimum of the previous one.')
+    parser.add_argument('problem', help = 'problem class, i.e. the name of its script (e.g. Conjecture_3.2)')
+    parser.add_argument('--params', nargs = '*', action = 'append', default = [], help = 'parameters of one instance of the LP class, once per instance in order')
+    parser.add_argument('--cold', action = 'store_true', help = 'solve every instance from scratch, e.g. to compare the running times')
+    args = parser.parse_args(argv)
+
+    try:
+        problem = problem_name(args.problem)
+        instances = [parse_params(instance) for instance in args.params]
+        for positional, keyword_params in instances:
+            bind_arguments(problem, positional, keyword_params)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+    if not instances:
+        parser.error('at least one instance is required (--params ...)')
+
+    for arguments, started, seconds in sweep(problem, instances, args.cold):
+        print('{}({}): {:.2f}s, {}'.format(problem, ', '.join('{} = {!r}'.format(name, value) for name, value in arguments.items()), seconds,
+                                          'from scratch' if started is None else 'started from a lifted family of {} variables'.format(started)))
+
+
+if __name__ == '__main__':
+    main()
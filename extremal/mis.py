@@ -0,0 +1,79 @@
+# The following functions find a maximum independent set of a conflict graph without a MIP
+# solver. Models whose only constraints are pairwise conflicts x_A + x_B <= 1 (Example_1,
+# Conjecture_3.1, Conjecture_3.8) are maximum independent set problems, i.e. maximum clique
+# problems on the complement graph, and can use this as their solver or to verify the result
+# of gurobi.
+#
+# The maximum clique search is the branch and bound of Tomita (MCQ): the candidates are greedily
+# coloured, a clique has at most one vertex of every colour, so a branch is cut as soon as the
+# current clique plus the number of colours cannot beat the best clique found. Sets of vertices
+# are bitmasks (python integers), so intersecting a candidate set with a neighbourhood is a
+# single operation on whole machine words.
+
+from extremal.cliques import adjacency_from_edges, vertices_of
+from extremal.subsets import popcount
+
+
+# function which colours the candidates greedily, in increasing order of their position: each
+# colour class is an independent set taken from the candidates which are left. Returns the list
+# of (vertex, colour) ordered by colour
+def colour_sort(adjacency, candidates):
+    coloured = []
+    colour = 0
+    uncoloured = candidates
+    while uncoloured:
+        colour += 1
+        available = uncoloured
+        while available:
+            lowest_bit = available & -available
+            v = lowest_bit.bit_length() - 1
+            # the neighbours of v cannot get the same colour
+            available &= ~adjacency[v] & ~lowest_bit
+            uncoloured &= ~lowest_bit
+            coloured.append((v, colour))
+    return coloured
+
+
+# function which returns a maximum clique of the graph with the given neighbourhoods (bitmasks)
+# as a sorted list of vertices. lower_bound is the size of a known clique, if any, so that only
+# larger cliques are searched for (an empty list is returned if there is none)
+def maximum_clique(adjacency, lower_bound = 0):
+    n = len(adjacency)
+    # vertices are relabelled by decreasing degree, so that the colouring (which goes through
+    # the candidates by increasing label) starts with the vertices of largest degree
+    order = sorted(range(n), key = lambda v: -popcount(adjacency[v]))
+    label = [0 for v in range(n)]
+    for new_label, v in enumerate(order):
+        label[v] = new_label
+    relabelled = [0 for v in range(n)]
+    for v in range(n):
+        for w in vertices_of(adjacency[v]):
+            relabelled[label[v]] |= 1 << label[w]
+
+    best = [[], lower_bound]
+
+    def expand(clique, candidates):
+        coloured = colour_sort(relabelled, candidates)
+        # branch on the vertices of largest colour first
+        for v, colour in reversed(coloured):
+            if len(clique) + colour <= best[1]:
+                return
+            new_candidates = candidates & relabelled[v]
+            if new_candidates:
+                expand(clique + [v], new_candidates)
+            elif len(clique) + 1 > best[1]:
+                best[0] = clique + [v]
+                best[1] = len(clique) + 1
+            candidates &= ~(1 << v)
+
+    expand([], (1 << n) - 1)
+    return sorted(order[v] for v in best[0])
+
+
+# function which returns a maximum independent set of the graph on num_vertices vertices with
+# the given edges (pairs of vertices) as a sorted list of vertices
+def maximum_independent_set(num_vertices, edges):
+    adjacency = adjacency_from_edges(num_vertices, edges)
+    all_vertices = (1 << num_vertices) - 1
+    complement = [all_vertices & ~adjacency[v] & ~(1 << v) for v in range(num_vertices)]
+    return maximum_clique(complement)
@@ -0,0 +1,219 @@
+# The following enumerates all the optimal families of an instance of a problem class up to
+# isomorphism, instead of the single optimal family a script prints. Run it from the top of the
+# repository, e.g.
+#
+#     python -m extremal.optima Conjecture_3.1 --params 6 4
+#     python -m extremal.optima Conjecture_3.3 --params 7 3 --max-families 20
+#
+# The LP class of the problem builds and solves its model as usual, with gurobi collecting a pool
+# of its best solutions (PoolSearchMode 2). The objective is then fixed to the optimum and the
+# model is solved again and again: every optimal family of the pool is reduced to its canonical
+# form under the permutations of [n] (extremal/isomorphism.py), a family of a new isomorphism
+# class is kept, and no-good cuts remove every optimal family found and, for a new class, every
+# image of it under the permutations (up to MAX_ORBIT_CUTS of them), so that the solver does not
+# find permuted copies of a known family again. The enumeration ends when the model with the
+# fixed objective is infeasible, i.e. all the optimal families were found, or after max_families
+# isomorphism classes. Only a model solved to optimality is enumerated, and a solve which stops
+# early (e.g. at a time limit) ends the enumeration without proving it complete.
+#
+# The variables of the model are read from their names, e.g. subsets[0,1,1], so the families of
+# every problem class are handled, with all their groups of variables (e.g. the triangles and the
+# edges of Example_2). The classes are those of S_n even when the model itself is only invariant
+# under some of the permutations (e.g. those fixing the element 1 in Conjecture 3.3); the cuts for
+# the other images only remove infeasible points.
+
+import argparse
+import contextlib
+import io
+
+import extremal.params as params
+from extremal.certificates import to_string
+from extremal.cuts import to_bitmask
+from extremal.isomorphism import canonical_form, orbit
+from extremal.problems import bind_arguments, load_problem, parse_params, problem_name
+
+# solutions collected by gurobi at every solve
+POOL_SIZE = 100
+# largest number of images of a family which are cut off by no-good cuts
+MAX_ORBIT_CUTS = 1000
+
+
+# function which returns the name of the group and the key of a variable named as by addVars, e.g.
+# ('subsets', (0, 1, 1)) for subsets[0,1,1], or None for another variable
+def variable_key(name):
+    if not name.endswith(']') or '[' not in name:
+        return None
+    group, key = name[:-1].split('[', 1)
+    try:
+        return group, tuple(int(entry) for entry in key.split(','))
+    except ValueError:
+        return None
+
+
+# function which returns the groups of variables of a model as {group: [(bitmask, variable)]}, and
+# the size n of the ground set
+def family_variables(model):
+    groups = {}
+    n = None
+    for variable in model.getVars():
+        name = variable_key(variable.VarName)
+        if name is None:
+            continue
+        group, key = name
+        n = len(key)
+        groups.setdefault(group, []).append((to_bitmask(key), variable))
+    if not groups:
+        raise ValueError('the model has no variables named after sets, such as subsets[0,1,1]')
+    return groups, n
+
+
+# function which returns the family of the solution of the pool currently selected by
+# SolutionNumber, as a tuple of groups of bitmasks
+def pool_family(model, groups):
+    family = []
+    for group in sorted(groups):
+        masks = [mask for mask, variable in groups[group]]
+        values = model.getAttr('Xn', [variable for mask, variable in groups[group]])
+        family.append([mask for mask, value in zip(masks, values) if value > 0.5])
+    return tuple(tuple(sorted(group)) for group in family)
+
+
+# function which adds a no-good cut to the model, which removes exactly the solution with the
+# given family: the variables of its sets sum to less than their number, or one of the other
+# variables is set
+def add_no_good(model, groups, family):
+    import gurobipy as gp
+    from gurobipy import GRB
+    coefficients = []
+    variables = []
+    size = 0
+    for group, members in zip(sorted(groups), family):
+        members = set(members)
+        size += len(members)
+        for mask, variable in groups[group]:
+            coefficients.append(1 if mask in members else -1)
+            variables.append(variable)
+    model.addLConstr(gp.LinExpr(coefficients, variables), GRB.LESS_EQUAL, size - 1)
+
+
+# function which enumerates the optimal families of a solved model up to isomorphism. Returns the
+# optimum, the list of the classes found as (family, orbit size), the family being the first one
+# found of its class (a tuple of groups of bitmasks) and the orbit size None when it has more than
+# max_orbit images, and whether the list is proven complete, i.e. every solve ended optimal or
+# infeasible. progress is called with every new class as progress(family, orbit size, names of
+# the groups, n). Raises ValueError if the model was not solved to optimality
+def enumerate_optima(model, max_families = None, max_orbit = MAX_ORBIT_CUTS, progress = None):
+    from gurobipy import GRB
+
+    groups, n = family_variables(model)
+    if model.Status == GRB.INFEASIBLE:
+        return None, [], True
+    if model.Status != GRB.OPTIMAL:
+        raise ValueError('the model was not solved to optimality (status {}), its incumbents are not known to be optimal'.format(model.Status))
+    optimum = model.ObjVal
+    # only the optimal families are of interest from now on
+    sense = GRB.GREATER_EQUAL if model.ModelSense == GRB.MAXIMIZE else GRB.LESS_EQUAL
+    model.addLConstr(model.getObjective(), sense, optimum + model.ModelSense*1e-6)
+
+    classes = {}
+    found = []
+    complete = False
+    while max_families is None or len(found) < max_families:
+        cut_off = set()
+        for number in range(model.SolCount):
+            model.Params.SolutionNumber = number
+            if abs(model.PoolObjVal - optimum) > 1e-6:
+                continue
+            family = pool_family(model, groups)
+            if family in cut_off:
+                continue
+            cut_off.add(family)
+            certificate = canonical_form(family, n)[0]
+            if certificate in classes:
+                continue
+            images = orbit(family, n, max_orbit + 1)
+            classes[certificate] = family
+            found.append((family, len(images) if len(images) <= max_orbit else None))
+            if progress is not None:
+                progress(family, found[-1][1], sorted(groups), n)
+            cut_off.update(images[:max_orbit])
+            if max_families is not None and len(found) == max_families:
+                break
+        if not cut_off or (max_families is not None and len(found) >= max_families):
+            break
+        for family in cut_off:
+            add_no_good(model, groups, family)
+        params.optimize(model)
+        # infeasible: every optimal family is cut off. A solve stopped early (e.g. at the time
+        # limit) may have missed optimal families of its pool
+        if model.Status == GRB.INFEASIBLE:
+            complete = True
+            break
+        if model.Status != GRB.OPTIMAL:
+            break
+    return optimum, found, complete
+
+
+# function which runs the LP class of a problem with a solution pool and enumerates the optimal
+# families of its (last) model up to isomorphism, see enumerate_optima
+def problem_optima(problem, args = (), kwargs = None, max_families = None, pool_size = POOL_SIZE,
+                   max_orbit = MAX_ORBIT_CUTS, progress = None):
+    overrides = params.overrides
+    params.recorded_models = []
+    params.overrides = dict(overrides, PoolSearchMode = 2, PoolSolutions = pool_size, PoolGap = 0)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_problem(problem)(*args, **(kwargs or {}))
+        models = params.recorded_models
+    finally:
+        params.recorded_models = None
+        params.overrides = overrides
+    if not models:
+        raise ValueError('{} did not solve a gurobi model (solver must be gurobi)'.format(problem))
+    return enumerate_optima(models[-1], max_families, max_orbit, progress)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m extremal.optima', description = 'Enumerate the optimal families of a problem class up to isomorphism.')
+    parser.add_argument('problem', help = 'problem class, i.e. the name of its script (e.g. Conjecture_3.1)')
+    parser.add_argument('--params', nargs = '*', default = [], help = 'parameters of the LP class, in order or as name=value')
+    parser.add_argument('--max-families', type = int, help = 'stop after this many isomorphism classes')
+    parser.add_argument('--pool', type = int, default = POOL_SIZE, help = 'solutions collected by gurobi at every solve')
+    parser.add_argument('--max-orbit', type = int, default = MAX_ORBIT_CUTS, help = 'largest number of images of a family cut off')
+    args = parser.parse_args(argv)
+
+    try:
+        problem = problem_name(args.problem)
+        positional, keyword_params = parse_params(args.params)
+        arguments = bind_arguments(problem, positional, keyword_params)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+    instance = '{}({})'.format(problem, ', '.join('{} = {!r}'.format(name, value) for name, value in arguments.items()))
+
+    count = [0]
+
+    def progress(family, size, names, n):
+        count[0] += 1
+        print('Family {} ({} labelled copies):'.format(count[0], size if size is not None else 'more than {}'.format(args.max_orbit)))
+        for name, group in zip(names, family):
+            if len(names) > 1:
+                print(name)
+            for mask in group:
+                print(to_string(mask, n))
+
+    try:
+        optimum, found, complete = problem_optima(problem, positional, keyword_params, args.max_families, args.pool, args.max_orbit, progress)
+    except ValueError as error:
+        parser.exit(1, '{}: {}\n'.format(instance, error))
+    if optimum is None:
+        print('{} has no feasible family'.format(instance))
+        return
+    stopped = args.max_families is not None and len(found) == args.max_families
+    print('{}: optimum {}, {} optimal {} up to isomorphism{}'.format(instance, round(optimum, 6), len(found),
+                                                                     'family' if len(found) == 1 else 'families',
+                                                                     ' (stopped at --max-families)' if stopped else
+                                                                     '' if complete else ' (a solve stopped early, the enumeration is not proven complete)'))
+
+
+if __name__ == '__main__':
+    main()
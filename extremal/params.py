@@ -0,0 +1,81 @@
+# The following functions give every model the gurobi parameters tuned for its problem class.
+# The problem class of a model is the name of the script which builds it (e.g. 'Conjecture_3.2')
+# and the tuned parameters are stored by extremal/tuning.py in a json file of the form
+#
+#     {"Conjecture_3.2": {"MIPFocus": 2, "Cuts": 2}, "Theorem_3.9": {"Presolve": 2}}
+#
+# which is solver_params.json at the top of the repository, or the file given by the
+# environment variable EXTREMAL_SOLVER_PARAMS. Classes which are not in the file keep the
+# gurobi defaults. The scripts solve their models through optimize, so that a callback and a MIP
+# start can be attached to every solve.
+
+import json
+import os
+
+# location of the file with the tuned parameters
+PARAMS_FILE = os.environ.get('EXTREMAL_SOLVER_PARAMS',
+                             os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'solver_params.json'))
+
+# parameters which are set on every model after the tuned ones, used by the tuning harness to
+# try other settings without touching the scripts
+overrides = {}
+
+# when this is a list, every model given parameters is appended to it, so that the tuning
+# harness can read the runtime of the models built by a script
+recorded_models = None
+
+# gurobi callback passed to every solve by optimize, used by the racing mode to share incumbents
+callback = None
+
+# MIP start given to every solve by optimize, as a dictionary {variable name: value} where the
+# variables which are not in it start at 0. Used by the sweeps of extremal/lifting.py to start an
+# instance from the lifted optimum of the previous one
+start = None
+
+
+# function which returns the dictionary of all the tuned parameters in the file (empty if there
+# is no file yet)
+def load_all_params(params_file = None):
+    params_file = params_file or PARAMS_FILE
+    if not os.path.exists(params_file):
+        return {}
+    with open(params_file) as f:
+        return json.load(f)
+
+
+# function which returns the tuned parameters of a problem class
+def load_params(problem):
+    return dict(load_all_params().get(problem, {}))
+
+
+# function which sets the tuned parameters of the problem class (and the overrides) on a model
+def apply_solver_params(model, problem):
+    params = load_params(problem)
+    params.update(overrides)
+    for name, value in params.items():
+        model.setParam(name, value)
+    if recorded_models is not None:
+        recorded_models.append(model)
+
+
+# function which solves a model, from the MIP start and with the callback if they are set and the
+# separator of the model (a gurobi callback which adds cuts, see extremal/cuts.py) if one is given.
+# The model attributes cannot be queried during the solve, so the variables and the sense of the
+# objective are kept on the model as model._variables and model._sense for the callbacks
+def optimize(model, separator = None):
+    if start is not None:
+        variables = model.getVars()
+        model.setAttr('Start', variables, [start.get(variable.VarName, 0) for variable in variables])
+    callbacks = [function for function in (separator, callback) if function is not None]
+    if callbacks:
+        model._variables = model.getVars()
+        model._sense = model.ModelSense
+    if not callbacks:
+        model.optimize()
+    elif len(callbacks) == 1:
+        model.optimize(callbacks[0])
+    else:
+        def both(model, where):
+            for function in callbacks:
+                function(model, where)
+        model.optimize(both)
@@ -0,0 +1,102 @@
+# The problem classes, one module per script of the repository: the module
+# extremal/problems/conjecture_3_2.py defines the class LP of Conjecture_3.2.py, whose
+# calls stay in the script. Importing a module builds or solves nothing, and gurobi is
+# only imported when a model is built, so the problems can be listed, their parameters
+# checked and their models looked up in the cache without loading the solver.
+
+import ast
+import importlib
+import inspect
+import os
+import re
+
+# the problem classes, named after their scripts
+PROBLEMS = [
+    'Example_1',
+    'Example_2',
+    'Conjecture_3.1',
+    'Conjecture_3.2',
+    'Conjecture_3.3',
+    'Conjecture_3.4',
+    'Conjecture_3.5',
+    'Conjecture_3.6',
+    'Conjecture_3.7',
+    'Conjecture_3.8',
+    'Theorem_3.9',
+    'Conjecture_3.10',
+    'Theorem_3.11',
+    'Spec',
+]
+
+
+# function which returns the name of a problem class as in PROBLEMS, given its name in any case
+# or the name of its module (e.g. conjecture_3_10 for Conjecture_3.10)
+def problem_name(problem):
+    for name in PROBLEMS:
+        if problem.lower() in (name.lower(), module_name(name)):
+            return name
+    raise ValueError('unknown problem class {!r}, choose from {}'.format(problem, ', '.join(PROBLEMS)))
+
+
+# function which returns the name of the module of a problem class
+def module_name(problem):
+    return problem.lower().replace('.', '_')
+
+
+# function which returns the path of the module of a problem class
+def problem_file(problem):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), module_name(problem_name(problem)) + '.py')
+
+
+# function which returns the LP class of a problem class, or another class of its module (e.g.
+# Layers or Orderly)
+def load_problem(problem, class_name = 'LP'):
+    module = importlib.import_module('extremal.problems.' + module_name(problem_name(problem)))
+    if not hasattr(module, class_name):
+        raise ValueError('{} has no class {}'.format(problem_name(problem), class_name))
+    return getattr(module, class_name)
+
+
+# function which checks that the arguments fit the LP class (or another class) of a problem class
+# (raises TypeError if they do not) and returns them as a dictionary from the names of the
+# parameters to their values, with the defaults filled in
+def bind_arguments(problem, args = (), kwargs = None, class_name = 'LP'):
+    bound = inspect.signature(load_problem(problem, class_name)).bind(*args, **(kwargs or {}))
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+# function which returns the parameters under which the LP class of a problem class caches its
+# model (see extremal/cache.py): all its parameters in order except the choice of the solver, with
+# cuts = 'callback' as cuts = None since the cuts of a callback are not part of the built model
+def model_arguments(problem, args = (), kwargs = None):
+    from extremal.cuts import built_cut_mode
+
+    arguments = bind_arguments(problem, args, kwargs)
+    if 'cuts' in arguments:
+        arguments['cuts'] = built_cut_mode(arguments['cuts'])
+    return tuple(value for name, value in arguments.items() if name != 'solver')
+
+
+# function which reads a parameter of the command line as a python literal, or as a string if it
+# is not one
+def parse_value(text):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+# function which splits the parameters of the command line into (args, kwargs)
+def parse_params(params):
+    args = []
+    kwargs = {}
+    for param in params:
+        keyword = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)=(.*)$', param, re.DOTALL)
+        if keyword:
+            kwargs[keyword.group(1)] = parse_value(keyword.group(2))
+        elif kwargs:
+            raise ValueError('the parameter {!r} is given in order after a name=value parameter'.format(param))
+        else:
+            args.append(parse_value(param))
+    return args, kwargs
@@ -0,0 +1,144 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import all_subsets
+from extremal.sizes import admit
+from extremal.cuts import add_rows, built_cut_mode, check_cut_mode, lym_rows, row_separator, to_bitmask
+from extremal.cliques import cover_edges_with_cliques
+from extremal.mis import maximum_independent_set
+from extremal.layers import chain_row, far_parts_separator, layer_bound, print_layers
+from extremal.shards import generate_sharded, pairs_of
+from array import array
+import math
+
+# function which lists the pairs (i, j), i < j, of positions such that the sets i and j are
+# comparable or have a symmetric difference larger than d, for i in [start, stop), given the sets
+# as bitmasks (a shard of the conflicts, see extremal/shards.py)
+def far_or_comparable_pairs(start, stop, data):
+    masks, d = data
+    first = array('q')
+    second = array('q')
+    for i in range(start, stop):
+        for j in range(i + 1, len(masks)):
+            union = masks[i] | masks[j]
+            # if one set is a subset of the other, or their symmetric difference is larger than d
+            if union == masks[i] or union == masks[j] or bin(masks[i] ^ masks[j]).count('1') > d:
+                first.append(i)
+                second.append(j)
+    return first, second
+
+
+# The following class defines an LP to solve the maximum size of an antichain
+# of 2^[n] with diameter less than or equal to d. The inputs of this class are n and d. 
+# Modify the class calls in Conjecture_3.1.py at the top of the repository to run the problem for various values of n and d.
+# With solver = 'mis' the problem is solved by the maximum independent set search of
+# extremal/mis.py instead of gurobi, e.g. to verify the result of gurobi.
+# With cuts = 'build' the LYM cuts of antichains (extremal/cuts.py) are added to the
+# model, with cuts = 'callback' they are added as cuts at the root node.
+
+class LP:
+    def __init__(self, n, d, solver = 'gurobi', cuts = None):
+
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, d, cuts = admit('Conjecture_3.1', (n, d, cuts))
+
+        if solver not in ('gurobi', 'mis'):
+            raise ValueError("solver must be 'gurobi' or 'mis', not {!r}".format(solver))
+        check_cut_mode(cuts)
+
+        # all the subset of [n], in the order of their strings of 0s and 1s read as binary numbers
+        # (see extremal/subsets.py)
+        binarystrings = list(all_subsets(n))
+
+        # the gurobi model is read from the cache of extremal/cache.py if it was built before with
+        # these parameters, and then the conflicts are not needed
+        model = load_model('Conjecture_3.1', (n, d, built_cut_mode(cuts))) if solver == 'gurobi' else None
+        if model is None:
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are
+            # comparable or have a symmetric difference larger than d, only one of them can be in the
+            # antichain. They are generated in shards of i by a pool of processes (see extremal/shards.py)
+            masks = [to_bitmask(subset) for subset in binarystrings]
+            conflicts = pairs_of(*generate_sharded(far_or_comparable_pairs, len(binarystrings), (masks, d)))
+
+        # SOLVE
+        if solver == 'mis':
+            # the antichain is a maximum independent set of the conflict graph
+            max_set = set(binarystrings[i] for i in maximum_independent_set(len(binarystrings), conflicts))
+        else:
+            import gurobipy as gp
+            from gurobipy import GRB
+
+            if model is not None:
+                variables = model_variables(model, 'subsets', binarystrings)
+            else:
+                # problem is a maximization problem
+                model = gp.Model('antichains_of_fixed_diameter')
+
+                # BINARY VARIABLES
+                # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+                #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+                variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+                # CONSTRAINTS
+                # the conflicting pairs are covered by cliques of the conflict graph (families in which any two
+                # sets are comparable or too far apart, e.g. chains) and only one set of each clique can be in the antichain
+                for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                    model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+                # VALID INEQUALITIES
+                if cuts == 'build':
+                    add_rows(model, variables, lym_rows(binarystrings, n))
+
+                # OBJECTIVE FUNCTION
+                obj = gp.LinExpr()
+                for subset in binarystrings:
+                    obj += variables[subset]
+                model.setObjective(obj, GRB.MAXIMIZE)
+                store_model(model, 'Conjecture_3.1', (n, d, built_cut_mode(cuts)))
+            model.Params.LogToConsole = 0
+            # parameters tuned for this problem class by extremal/tuning.py, if any
+            apply_solver_params(model, 'Conjecture_3.1')
+
+            # RUN
+            separator = None
+            if cuts == 'callback':
+                separator = row_separator(model, variables, lym_rows(binarystrings, n))
+            optimize(model, separator)
+            max_set = set(theset for theset in binarystrings if variables[theset].x == 1)
+
+        formula = int(math.factorial(n)/((math.factorial(n - math.floor(d/2))*math.factorial(math.floor(d/2)))))
+        print('Max size of an antichain of 2^{} with diameter <= {} is {} <= {}'.format(n, d, len(max_set), formula))
+        print('The elements of this max set are as follows.')
+        antichain = ""
+        for theset in reversed(binarystrings):
+            if theset in max_set:
+                print(theset)
+# for LATEX
+#                local_set = "\\"
+#                for index in range(n):
+#                    if theset[index] == 1:
+#                        local_set += str(index + 1)
+#                        local_set += ", "
+#                lenthofstring = len(local_set)
+#                local_set = local_set[:lenthofstring - 2]
+#                local_set += "\\, "
+#                antichain += local_set
+#        lengthofantichain = len(antichain)
+#        antichain = antichain[:lengthofantichain - 2]
+#        print(antichain)
+
+
+# The following class bounds the same problem with the layer LP of extremal/layers.py, which has
+# n + 1 variables instead of 2^n, so that n can be 20 to 40. Its rows are the chains and the
+# families of pairwise disjoint sets which are too far apart (with {} and [n]), which give a valid
+# upper bound but a loose one for large d, since the rows do not see the distances within a layer
+
+class Layers:
+    def __init__(self, n, d):
+
+        bound, values, rows = layer_bound(n, [chain_row(n)], far_parts_separator(n, d))
+
+        formula = math.comb(n, d//2)
+        print('Max size of an antichain of 2^{} with diameter <= {} is at most {} (layer LP, {} rows), (n choose floor(d/2)) = {}'.format(n, d, bound, len(rows), formula))
+        print_layers(values)
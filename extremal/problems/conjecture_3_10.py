@@ -0,0 +1,121 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import all_subsets
+from extremal.sizes import admit
+from extremal.layers import disjoint_parts_separator, layer_bound, print_layers
+import math
+
+# function which yields every family of s pairwise disjoint members of 2^[n] exactly once, as a
+# list of bitmasks where bit index corresponds with the element index + 1. The sets disjoint from
+# all the members chosen so far are exactly the submasks of free, the complement of their union, so
+# only those are tried. Members are taken in increasing order: the empty set can only be the first
+# member, and every other member has a larger highest element than the member before it (for
+# disjoint non-empty sets this is the same as being larger as a bitmask)
+def disjoint_families(n, s, family = (), free = None, highest_index = -1):
+    if free is None:
+        free = (1 << n) - 1
+    cost = len(family)
+    # if the family has s members
+    if cost == s:
+        yield list(family)
+        return
+
+    # the empty set is disjoint from every set, including the other members
+    if cost == 0:
+        yield from disjoint_families(n, s, (0,), free, -1)
+
+    for index in range(highest_index + 1, n):
+        # the element index + 1 is the highest element of the next member, it has to be free
+        # and leave enough free elements above it for the highest elements of the later members
+        if not (free >> index) & 1:
+            continue
+        if bin(free >> (index + 1)).count('1') < s - cost - 1:
+            break
+        # the rest of the next member is any submask of the free elements below index
+        lower = free & ((1 << index) - 1)
+        submask = lower
+        while True:
+            member = submask | (1 << index)
+            yield from disjoint_families(n, s, family + (member,), free & ~member, index)
+            if submask == 0:
+                break
+            submask = (submask - 1) & lower
+
+
+# The following class defines an LP to solve the maximum size of an family F
+# of 2^{[n]} without s pairwise disjoint elements. The inputs of this class are n and s (by default 4).
+# Modify the class calls in Conjecture_3.10.py at the top of the repository to run the problem for various parameters.
+
+class LP:
+    def __init__(self, n, s = 4):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, s = admit('Conjecture_3.10', (n, s))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        # all the subset of [n], in the order of their strings of 0s and 1s read as binary numbers
+        # (see extremal/subsets.py)
+        binarystrings = list(all_subsets(n))
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.10', (n, s))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            # problem is a maximization problem
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n]
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            # the string of 0s and 1s corresponding with a bitmask, where bit index corresponds with
+            # the element index + 1
+            def to_string(mask):
+                return tuple((mask >> index) & 1 for index in range(n))
+
+            # CONSTRAINTS
+            # every family of s pairwise disjoint members of 2^[n] (a s-clique of the disjointness graph),
+            # at most s - 1 of them can be in the family
+            for family in disjoint_families(n, s):
+                model.addConstr(gp.quicksum(variables[to_string(mask)] for mask in family) <= s - 1)
+
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            for subset in binarystrings:
+                obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.10', (n, s))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.10')
+
+        # RUN
+        print('begun solve')
+        optimize(model)
+
+        formula = 480
+        print('Max size a family F of 2^{} without {} pairwise disjoint members is {} >= {}'.format(n, s, int(model.objVal), formula))
+        print('The elements of this max set are as follows.')
+        for theset in binarystrings:
+            if variables[theset].x == 1:
+                print(theset)
+
+
+# The following class bounds the same problem with the layer LP of extremal/layers.py, which has
+# n + 1 variables instead of 2^n, so that n can be 20 to 40. Its rows are the families of the
+# empty set and pairwise disjoint sets, of which at most s - 1 are in the family
+
+class Layers:
+    def __init__(self, n, s = 4):
+
+        bound, values, rows = layer_bound(n, [], disjoint_parts_separator(n, s))
+
+        print('Max size a family F of 2^{} without {} pairwise disjoint members is at most {} (layer LP, {} rows)'.format(n, s, bound, len(rows)))
+        print_layers(values)
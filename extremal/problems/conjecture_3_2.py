@@ -0,0 +1,181 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import all_subsets, subset_rank
+from extremal.sizes import admit
+from extremal.cuts import add_rows, built_cut_mode, check_cut_mode, lym_rows, row_separator, to_bitmask
+from extremal.cliques import cover_edges_with_cliques
+from extremal.shards import add_sharded_rows, generate_sharded, pairs_of
+from array import array
+import math
+import copy
+
+# function which lists, for i in [start, stop), the pairs (i, j), i < j, of positions of sets with
+# a symmetric difference larger than d, and the (l+1)-chains whose largest set is the set i as rows
+# of positions, the position of a set of 2^[n] being its rank (a shard of the conflicts and the
+# chain rows, see extremal/shards.py)
+def far_pairs_and_chains(start, stop, data):
+    binarystrings, masks, n, d, l = data
+    first = array('q')
+    second = array('q')
+    lengths = array('q')
+    positions = array('q')
+
+    # function to determine a chain of length l + 1 with the ref_base_set as the super set
+    def l_chain_free(chain, index, localstring, ref_base_set):
+        # if no more elements to add to the set
+        if index == n:
+            # check to see if the chain is an l chain
+            if len(chain) == l + 1:
+                # add the row of the chain
+                lengths.append(len(chain))
+                positions.extend(subset_rank(chainset) for chainset in chain)
+                return
+            # need check no further
+            return
+
+        # check to see if the chain is an l chain
+        if len(chain) == l + 1:
+            # add the row of the chain
+            lengths.append(len(chain))
+            positions.extend(subset_rank(chainset) for chainset in chain)
+            return
+
+        # check to see if the element is already assumed by the super set of the chain
+        if ref_base_set[index] == 0:
+            # proceed to the next hopeful for the chain
+            l_chain_free(chain, index + 1, localstring, ref_base_set)
+        # else the element corresponding with index + 1 is in the super set of the chain
+        else:
+            # there will be many recursive function calls
+            # make a copy of the string so that it can be handed in its current
+            # or new state to several recursions
+            newlocalstring = copy.deepcopy(localstring)
+            newchain = copy.deepcopy(chain)
+
+            # did not remove element corresponding to index + 1
+            l_chain_free(chain, index + 1, localstring, ref_base_set)
+
+            # removed element corresponding to index + 1
+            # all future chain members will not contain this element
+            newlocalstring[index] = 0
+
+            # first proceed as if this set is not in the chain
+            # note that this is a copy of the newlocalstring
+            # this is so that in the following function call nothing has changed in the string
+            l_chain_free(chain, index + 1, copy.deepcopy(newlocalstring), ref_base_set)
+
+            # this new set is considered in the chain
+            newchain.append(tuple(newlocalstring))
+            # reset the index back down to zero because we now consider
+            # subsets of this new set
+            l_chain_free(newchain, 0, newlocalstring, newlocalstring)
+
+    for i in range(start, stop):
+        # if we already check set corresponding to i against the set corresponding to j
+        # where i < j we need not check set j against set i later
+        for j in range(i + 1, len(masks)):
+            # if their symmetric difference is larger than d
+            if bin(masks[i] ^ masks[j]).count('1') > d:
+                first.append(i)
+                second.append(j)
+        # the plan is to consider all the possible l+1 chains where this set is the
+        # superset of the chain, remember that the empty set is always a subset
+        # hence we ask that the set as at least l elements rather than l+1
+        base_chain_set = binarystrings[i]
+        if sum(base_chain_set) >= l:
+            l_chain_free([base_chain_set], 0, list(base_chain_set), list(base_chain_set))
+    return first, second, lengths, positions
+
+
+# The following class defines an LP to solve the maximum size of a (l+1)-chain-free family
+# of 2^[n] with diameter less than or equal to d. The inputs of this class are n, d, and l. 
+# Modify the class calls in Conjecture_3.2.py at the top of the repository to run the problem for various values of n, d, and l.
+# With cuts = 'build' the l-fold LYM cuts of (l+1)-chain-free families (extremal/cuts.py) are added to the
+# model, with cuts = 'callback' they are added as cuts at the root node.
+
+class LP:
+    def __init__(self, n, d, l, cuts = None):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, d, l, cuts = admit('Conjecture_3.2', (n, d, l, cuts))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        check_cut_mode(cuts)
+
+        # all the subset of [n], in the order of their strings of 0s and 1s read as binary numbers
+        # (see extremal/subsets.py)
+        binarystrings = list(all_subsets(n))
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.2', (n, d, l, built_cut_mode(cuts)))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            # problem is a maximization problem
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            # CONFLICTS AND CHAINS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets have a
+            # symmetric difference larger than d, and the (l+1)-chains whose largest set is the set i,
+            # of which at most l sets can be in the family. They are generated in shards of i by a pool
+            # of processes (see extremal/shards.py)
+            masks = [to_bitmask(subset) for subset in binarystrings]
+            first, second, lengths, positions = generate_sharded(far_pairs_and_chains, len(binarystrings),
+                                                                 (binarystrings, masks, n, d, l))
+            conflicts = pairs_of(first, second)
+            add_sharded_rows(model, variables, binarystrings, lengths, positions, l)
+
+            # CONSTRAINTS
+            # the conflicting pairs are covered by cliques of the conflict graph (families of sets which are
+            # pairwise too far apart) and only one set of each clique can be in the family
+            for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+            # VALID INEQUALITIES
+            if cuts == 'build':
+                add_rows(model, variables, lym_rows(binarystrings, n, l))
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            for subset in binarystrings:
+                obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.2', (n, d, l, built_cut_mode(cuts)))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.2')
+
+        # RUN
+        separator = None
+        if cuts == 'callback':
+            separator = row_separator(model, variables, lym_rows(binarystrings, n, l))
+        optimize(model, separator)
+
+        #formula = int(math.factorial(n)/((math.factorial(n - math.floor(d/2))*math.factorial(math.floor(d/2)))))
+        print('Max size subset of 2^{} with diameter <= {} which is ({}+1)-chain-free is {}'.format(n, d, l, int(model.objVal)))
+        print('The elements of this max set are as follows.')
+        antichain = ""
+        for theset in reversed(binarystrings):
+            if variables[theset].x == 1:
+                print(theset)
+#                local_set = "\\{"
+#                for index in range(n):
+#                    if theset[index] == 1:
+#                        local_set += str(index + 1)
+#                        local_set += ", "
+#                lenthofstring = len(local_set)
+#                local_set = local_set[:lenthofstring - 2]
+#                local_set += "\\}, "
+#                antichain += local_set
+#        lengthofantichain = len(antichain)
+#        antichain = antichain[:lengthofantichain - 2]
+#        print(antichain)
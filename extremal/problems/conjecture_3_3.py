@@ -0,0 +1,111 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import k_subsets
+from extremal.sizes import admit
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, degree_rows
+import math
+
+# The following class defines an LP to solve the maximum diversity of an intersecting family
+# of ([n] choose k). The inputs of this class are n and k.
+# Modify the class calls in Conjecture_3.3.py at the top of the repository to run the problem for various values of n and k.
+
+class LP:
+    def __init__(self, n, k):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, k = admit('Conjecture_3.3', (n, k))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        # all the subset of [n] of size k, the sets with element 1 first (see extremal/subsets.py)
+        binarystrings = list(k_subsets(n, k))
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.3', (n, k))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            # problem is a maximization problem
+            # maximum diversity of an intersecting family of ([n] choose k)
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            # function to determine whether the intersection of the two sets is empty
+            def int_check(string1, string2):
+                for index in range(n):
+                    # if both subsets contain the element index + 1
+                    if (string1[index] + string2[index]) == 2:
+                        return 0
+                # the intersection of the two sets is empty 
+                return 1
+
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are disjoint
+            conflicts = []
+            # iterate through all subsets
+            for i in range(len(binarystrings)):
+                # if we already check set corresponding to i against the set corresponding to j
+                # where i < j we need not check set j against set i later
+                for j in range(i+1, len(binarystrings)):
+                    setone = binarystrings[i]
+                    settwo = binarystrings[j]
+                    if int_check(setone, settwo):
+                        # only one of them can be in the intersecting family
+                        conflicts.append((i, j))
+
+            # CONSTRAINTS
+            # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+            # disjoint sets) and only one set of each clique can be in the intersecting family
+            for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+            # ensure that the diversity is attained at the element 1
+            # i.e. |F(1)| >= |F(i)| for each i
+            # put another way |F(i)| - |F(1)| <= 0
+            # for each i not equal to 1 (i.e. not the zero index), read off the incidence matrix
+            incidence = Incidence(binarystrings, n)
+            add_block(model, variables, binarystrings, degree_rows(incidence, 0))
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            # sum over all variables which do not contain the element 1,  
+            # that is the zeroth index
+            for position in incidence.missing(0):
+                obj += variables[binarystrings[position]]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.3', (n, k))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.3')
+
+        # RUN
+        optimize(model)
+
+        # Conjecture bound
+        formula = int(math.factorial(n-3)/(math.factorial(k-2)*math.factorial((n-3)-(k-2))))
+
+        # delta (F) is defined as the max_i |F(i)| where F(i) = {f : i in f}
+        delta = 0
+        for i in range(n):
+            local_score = 0
+            for subset in binarystrings:
+                if list(subset)[i] == 1:
+                    local_score += int(variables[subset].x) 
+            if delta < local_score:
+                delta = local_score 
+        # diversity is defined as the size of the set less delta
+        diversity = int(sum(variables[subsets].x for subsets in binarystrings) ) - delta
+
+        print('Max diversity of an intersecting family F of ([{}] choose {}) is {} > binom{{n-3}}{{k-2}} = {}'.format(n, k, diversity, formula))
+        print('The elements of this set are as follows.')
+        for theset in binarystrings:
+            if variables[theset].x == 1:
+                print(theset)
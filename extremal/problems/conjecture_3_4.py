@@ -0,0 +1,129 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import all_subsets
+from extremal.sizes import admit
+from extremal.cuts import add_rows, built_cut_mode, check_cut_mode, intersecting_rows, row_separator
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, degree_rows
+import math
+
+# The following class defines an LP to solve the maximum diversity of an intersecting family
+# of 2^{[n]}. The input of this class is n and k. k is simply for they formula at the end.
+# Modify the class calls in Conjecture_3.4.py at the top of the repository to run the problem for various values of n.
+# With cuts = 'build' the shadow cuts of intersecting families (extremal/cuts.py) are added to the
+# model, with cuts = 'callback' they are added as cuts at the root node.
+
+class LP:
+    def __init__(self, n, k, cuts = None):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, k, cuts = admit('Conjecture_3.4', (n, k, cuts))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        check_cut_mode(cuts)
+
+        # all the subset of [n], in the order of their strings of 0s and 1s read as binary numbers
+        # (see extremal/subsets.py)
+        binarystrings = list(all_subsets(n))
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.4', (n, k, built_cut_mode(cuts)))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            # problem is a maximization problem
+            # maximum diversity of an intersecting family of the power set of [n]
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            # function to determine whether the intersection of the two sets is empty
+            def int_check(string1, string2):
+                for index in range(n):
+                    # if both subsets contain the element index + 1
+                    if (string1[index] + string2[index]) == 2:
+                        return 0
+                # the intersection of the two sets is empty 
+                return 1
+
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are disjoint
+            conflicts = []
+            # iterate through all subsets
+            for i in range(len(binarystrings)):
+                # if we already check set corresponding to i against the set corresponding to j
+                # where i < j we need not check set j against set i later
+                for j in range(i+1, len(binarystrings)):
+                    setone = binarystrings[i]
+                    settwo = binarystrings[j]
+                    if int_check(setone, settwo):
+                        # only one of them can be in the intersecting family
+                        conflicts.append((i, j))
+
+            # CONSTRAINTS
+            # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+            # disjoint sets) and only one set of each clique can be in the intersecting family
+            for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+            # ensure that the diversity is attained at the element 1
+            # i.e. |F(1)| >= |F(i)| for each i
+            # put another way |F(i)| - |F(1)| <= 0
+            # for each i not equal to 1 (i.e. not the zero index), read off the incidence matrix
+            incidence = Incidence(binarystrings, n)
+            add_block(model, variables, binarystrings, degree_rows(incidence, 0))
+
+            # VALID INEQUALITIES
+            if cuts == 'build':
+                add_rows(model, variables, intersecting_rows(binarystrings, n))
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            # sum over all variables which do not contain the element 1,  
+            # that is the zeroth index
+            for position in incidence.missing(0):
+                obj += variables[binarystrings[position]]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.4', (n, k, built_cut_mode(cuts)))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.4')
+
+        # RUN
+        separator = None
+        if cuts == 'callback':
+            separator = row_separator(model, variables, intersecting_rows(binarystrings, n))
+        optimize(model, separator)
+
+        # Conjecture bound
+        formula = 0
+        for i in range(k+1, 2*k+1):
+            formula += int(math.factorial(2*k)/(math.factorial(i)*math.factorial(2*k-i)))
+
+        # delta (F) is defined as the max_i |F(i)| where F(i) = {f : i in f}
+        delta = 0
+        for i in range(n):
+            local_score = 0
+            for subset in binarystrings:
+                if list(subset)[i] == 1:
+                    local_score += int(variables[subset].x) 
+            if delta < local_score:
+                delta = local_score 
+        # diversity is defined as the size of the set less delta
+        diversity = int(sum(variables[subsets].x for subsets in binarystrings) ) - delta
+
+        if diversity > formula:
+            print('Max diversity of an intersecting family F of 2^[{}] is {} > sum_{{i = k + 1}}^{{2k}} (2k choose i) = {}'.format(n, diversity, formula))
+            print('The elements of this set are as follows.')
+            for theset in binarystrings:
+                if variables[theset].x == 1:
+                    print(theset)
+        else:
+            print("Failed to find counter example.")
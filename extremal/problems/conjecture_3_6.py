@@ -0,0 +1,129 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import k_subsets
+from extremal.sizes import admit
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, missed_rows
+
+# function to determine whether the intersection of the two sets is empty
+def int_check(string1, string2):
+    for index in range(len(string1)):
+        # if both subsets contain the element index + 1
+        if (string1[index] + string2[index]) == 2:
+            return 0
+    # the intersection of the two sets is empty
+    return 1
+
+
+# function which lists the disjoint pairs (i, j) with i <= j of a list of subsets, i.e. the edges
+# of the Kneser graph on the subsets of X1 (or X2). A pair (i, i) is a loop and only appears for
+# the empty set, which is disjoint from itself
+def generate_disjoint_pairs(list_of_subsets_of_Xi):
+    disjoint_pairs = []
+    for i in range(len(list_of_subsets_of_Xi)):
+        for j in range(i, len(list_of_subsets_of_Xi)):
+            if int_check(list_of_subsets_of_Xi[i], list_of_subsets_of_Xi[j]):
+                disjoint_pairs.append((i, j))
+    return disjoint_pairs
+
+
+# function which lists the disjoint pairs (i, j), i < j, of the product family whose set at
+# position i1*len(X2_subsets) + i2 is X1_subsets[i1] + X2_subsets[i2]. Two sets of the product
+# family are disjoint exactly when both their parts in X1 and their parts in X2 are disjoint, so
+# the disjoint pairs are the edges of the tensor (Kronecker) product of the two Kneser graphs. We
+# read them off the factor edges instead of checking every pair of sets, so the work is
+# proportional to the number of conflicting pairs
+def product_disjoint_pairs(X1_subsets, X2_subsets):
+    X1_disjoint_pairs = generate_disjoint_pairs(X1_subsets)
+    X2_disjoint_pairs = generate_disjoint_pairs(X2_subsets)
+
+    # the set X1_subsets[i1] + X2_subsets[i2] is stored at this position
+    def product_index(i1, i2):
+        return i1*len(X2_subsets) + i2
+
+    conflicts = []
+    for (i1, j1) in X1_disjoint_pairs:
+        for (i2, j2) in X2_disjoint_pairs:
+            # both loops give the empty set paired with itself, which is not a constraint
+            if i1 == j1 and i2 == j2:
+                continue
+            # only one of them can be in the intersecting family
+            conflicts.append((product_index(i1, i2), product_index(j1, j2)))
+            # the crossed pair is a different edge unless one of the factor edges is a loop
+            if i1 != j1 and i2 != j2:
+                conflicts.append((product_index(i1, j2), product_index(j1, i2)))
+    return conflicts
+
+
+# The following class defines an LP to solve the maximum size of a non-trivial intersecting family
+# of (X_1, X_2 choose k, l). The inputs of this class are n_1, n,2, k, and l.
+# Modify the class calls in Conjecture_3.6.py at the top of the repository to run the problem for various parameters.
+
+class LP:
+    def __init__(self, n1, n2, k, l):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n1, n2, k, l = admit('Conjecture_3.6', (n1, n2, k, l))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        # all the subset of X1 and of X2, the sets with the first element first (see extremal/subsets.py)
+        X1_subsets = list(k_subsets(n1, k))
+        X2_subsets = list(k_subsets(n2, l))
+
+        # generate all the subsets that have the right intersection with X1 and X2
+        X1_union_X2_subsets = []
+        for setone in X1_subsets:
+            for settwo in X2_subsets:
+                X1_union_X2_subsets.append(setone + settwo)
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.6', (n1, n2, k, l))
+        if model is not None:
+            variables = model_variables(model, 'subsets', X1_union_X2_subsets)
+        else:
+            # problem is a maximization problem
+            model = gp.Model('')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n1 + n2 entries)] corresponds
+            # a subset of X1 union X2 with correct intersection size with X1 and X2
+            variables = model.addVars(X1_union_X2_subsets, name = 'subsets', vtype=GRB.BINARY)
+
+            # CONSTRAINTS
+            # the disjoint pairs of the product family, read off the factor Kneser graphs
+            conflicts = product_disjoint_pairs(X1_subsets, X2_subsets)
+
+            # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+            # disjoint sets) and only one set of each clique can be in the intersecting family
+            for clique in cover_edges_with_cliques(len(X1_union_X2_subsets), conflicts):
+                model.addConstr(gp.quicksum(variables[X1_union_X2_subsets[i]] for i in clique) <= 1)
+
+            # CONSTRAINTS
+            # every element of X1 union X2 is missed by some set of the family, the sets missing it
+            # are read off the incidence matrix of the family
+            incidence = Incidence(X1_union_X2_subsets, n1 + n2)
+            add_block(model, variables, X1_union_X2_subsets, missed_rows(incidence))
+
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            for subset in X1_union_X2_subsets:
+                obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.6', (n1, n2, k, l))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.6')
+
+        # RUN
+        optimize(model)
+
+        print('Max size of set is {}'.format(int(model.objVal)))
+        print('The elements of this max set are as follows.')
+        for theset in X1_union_X2_subsets:
+            if variables[theset].x == 1:
+                print(theset)
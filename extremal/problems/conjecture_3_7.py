@@ -0,0 +1,130 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import k_subsets
+from extremal.sizes import admit
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, missed_rows
+from extremal.problems.conjecture_3_6 import product_disjoint_pairs
+from extremal.subsets import popcount, to_bitmask
+import itertools
+
+# function which returns the positions of all the subsets of Xi of size desired_cost which contain
+# the set with bitmask query, given the position of each subset of Xi by bitmask. Only the missing
+# elements are chosen, from the complement of query, so the time is proportional to the number of
+# supersets returned
+def supersets_of_Xi(Xi_index, query, desired_cost, max_length):
+    missing = desired_cost - popcount(query)
+    if missing < 0:
+        return []
+    complement = [index for index in range(max_length) if not (query >> index) & 1]
+    supersets = []
+    for added in itertools.combinations(complement, missing):
+        mask = query
+        for index in added:
+            mask |= 1 << index
+        supersets.append(Xi_index[mask])
+    return supersets
+
+
+# function which yields, for every set of S in turn, the positions of its strict supersets in the
+# product family whose set at position i1*len(X2_subsets) + i2 is X1_subsets[i1] + X2_subsets[i2].
+# The supersets are the products of the supersets of its part in X1 and of its part in X2, found
+# with a superset index of each factor: the position of each subset looked up by its bitmask
+def strict_superset_positions(S, X1_subsets, X2_subsets, n1, n2, k, l):
+    X1_index = {to_bitmask(setone): i1 for i1, setone in enumerate(X1_subsets)}
+    X2_index = {to_bitmask(settwo): i2 for i2, settwo in enumerate(X2_subsets)}
+    for subset in S:
+        subset = tuple(subset)
+        X1_supersets = supersets_of_Xi(X1_index, to_bitmask(subset[:n1]), k, n1)
+        X2_supersets = supersets_of_Xi(X2_index, to_bitmask(subset[n1:]), l, n2)
+        positions = []
+        for i1 in X1_supersets:
+            for i2 in X2_supersets:
+                # if the superset is a strict superset of the set of S
+                if X1_subsets[i1] + X2_subsets[i2] != subset:
+                    positions.append(i1*len(X2_subsets) + i2)
+        yield positions
+
+
+# The following class defines an LP to solve the maximum size of a two-sided intersecting family
+# of (X_1, X_2 choose k, l). The inputs of this class are n_1, n,2, k, l, and S.
+# S is the fixed sets which we choose arbitrarily to make the output a two-sided family.
+# S can be a list of strings of 0s and 1s or any generator of them.
+# Modify the class calls in Conjecture_3.7.py at the top of the repository to run the problem for various parameters.
+
+class LP:
+    def __init__(self, n1, n2, k, l, S):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py). S may be a generator, it is turned into a list
+        # so that it also keys the cached model
+        n1, n2, k, l, S = admit('Conjecture_3.7', (n1, n2, k, l, [list(subset) for subset in S]))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        # all the subset of X1 and of X2, the sets with the first element first (see extremal/subsets.py)
+        X1_subsets = list(k_subsets(n1, k))
+        X2_subsets = list(k_subsets(n2, l))
+
+        # generate all the subsets that have the right intersection with X1 and X2
+        X1_union_X2_subsets = []
+        for setone in X1_subsets:
+            for settwo in X2_subsets:
+                X1_union_X2_subsets.append(setone + settwo)
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Conjecture_3.7', (n1, n2, k, l, S))
+        if model is not None:
+            variables = model_variables(model, 'subsets', X1_union_X2_subsets)
+        else:
+            # problem is a maximization problem
+            model = gp.Model('')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n1 + n2 entries)] corresponds
+            # a subset of X1 union X2 with correct intersection size with X1 and X2
+            variables = model.addVars(X1_union_X2_subsets, name = 'subsets', vtype=GRB.BINARY)
+
+            # CONSTRAINTS
+            # the disjoint pairs of the product family, read off the factor Kneser graphs as in
+            # Conjecture 3.6
+            conflicts = product_disjoint_pairs(X1_subsets, X2_subsets)
+
+            # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+            # disjoint sets) and only one set of each clique can be in the intersecting family
+            for clique in cover_edges_with_cliques(len(X1_union_X2_subsets), conflicts):
+                model.addConstr(gp.quicksum(variables[X1_union_X2_subsets[i]] for i in clique) <= 1)
+
+            # CONSTRAINTS
+            # every element of X1 union X2 is missed by some set of the family, the sets missing it
+            # are read off the incidence matrix of the family
+            incidence = Incidence(X1_union_X2_subsets, n1 + n2)
+            add_block(model, variables, X1_union_X2_subsets, missed_rows(incidence))
+
+            # CONSTRAINTS
+            # every set of S has a strict superset in the family. S may be any iterable of strings of
+            # 0s and 1s with n1 + n2 entries (for example a generator of all the pairs inside X1 or
+            # X2), it is only walked through once
+            for positions in strict_superset_positions(S, X1_subsets, X2_subsets, n1, n2, k, l):
+                model.addConstr(gp.quicksum(variables[X1_union_X2_subsets[position]] for position in positions) >= 1)
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            for subset in X1_union_X2_subsets:
+                obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Conjecture_3.7', (n1, n2, k, l, S))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Conjecture_3.7')
+
+        # RUN
+        optimize(model)
+
+        print('Max size of set is {}'.format(int(model.objVal)))
+        print('The elements of this max set are as follows.')
+        for theset in X1_union_X2_subsets:
+            if variables[theset].x == 1:
+                print(theset)
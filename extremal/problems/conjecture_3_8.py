@@ -0,0 +1,173 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.sizes import admit
+from extremal.cliques import cover_edges_with_cliques
+from extremal.mis import maximum_independent_set
+from extremal.shards import generate_sharded, pairs_of
+from extremal.subsets import to_bitmask
+from array import array
+import itertools
+
+# function which lists the pairs (i, j), i < j, of positions of disjoint sets, for i in
+# [start, stop). The sets disjoint from the set i are the k-subsets of its complement, only those
+# in position (the positions of the sets by bitmask) are in the conflict graph (a shard of the
+# conflicts, see extremal/shards.py)
+def disjoint_pairs(start, stop, data):
+    binarystrings, position, n, k = data
+    first = array('q')
+    second = array('q')
+    for i in range(start, stop):
+        complement = [index for index in range(n) if binarystrings[i][index] == 0]
+        for combination in itertools.combinations(complement, k):
+            mask = 0
+            for index in combination:
+                mask |= 1 << index
+            j = position.get(mask)
+            # if we already check set corresponding to i against the set corresponding to j
+            # where i < j we need not check set j against set i later
+            if j is not None and i < j:
+                first.append(i)
+                second.append(j)
+    return first, second
+
+
+# function which returns all the subsets of [n] of size k with at least partitions_size[i] elements
+# of the part partitions[i] for every i, as strings of 0s and 1s in the same order as when
+# enumerating element by element. Raises ValueError if the parts are not pairwise disjoint
+def partition_subsets(n, k, partitions, partitions_size):
+    # the parts X_i as lists of their elements, followed by the elements which are in none
+    # of the parts (from which a set may take any number of elements)
+    parts = []
+    covered = [0 for index in range(n)]
+    for partition in partitions:
+        parts.append([index for index in range(n) if partition[index] == 1])
+        for index in parts[-1]:
+            covered[index] += 1
+    if max(covered, default = 0) > 1:
+        raise ValueError('the parts of partitions must be pairwise disjoint')
+    parts.append([index for index in range(n) if covered[index] == 0])
+    minimum_sizes = list(partitions_size) + [0]
+
+    # the number of elements the parts from i onwards must at least receive, and can at most receive
+    min_remaining = [0 for i in range(len(parts) + 1)]
+    max_remaining = [0 for i in range(len(parts) + 1)]
+    for i in reversed(range(len(parts))):
+        min_remaining[i] = min_remaining[i + 1] + minimum_sizes[i]
+        max_remaining[i] = max_remaining[i + 1] + len(parts[i])
+
+    # generate all possible subset of [n] of size k with the correct intersection size with each part,
+    # one part at a time: the set takes count >= partitions_size[i] elements of part i in every possible
+    # way. A count is only tried if the remaining parts can still reach their minimum sizes and fill
+    # up the set to k elements, so only valid sets are ever built
+    def generate_all_possible_subsets_of_n_of_size_k(binarystrings, chosen, part_index, cost):
+        # considered all parts, the set has exactly k elements by the choice of count
+        if part_index == len(parts):
+            localstring = [0 for index in range(n)]
+            for index in chosen:
+                localstring[index] = 1
+            binarystrings.append(tuple(localstring))
+            return
+
+        lowest_count = max(minimum_sizes[part_index], k - cost - max_remaining[part_index + 1])
+        highest_count = min(len(parts[part_index]), k - cost - min_remaining[part_index + 1])
+        for count in range(lowest_count, highest_count + 1):
+            for combination in itertools.combinations(parts[part_index], count):
+                generate_all_possible_subsets_of_n_of_size_k(binarystrings, chosen + list(combination), part_index + 1, cost + count)
+
+    # all the subset of [n] of size k, in the same order as when enumerating element by element
+    binarystrings = []
+    generate_all_possible_subsets_of_n_of_size_k(binarystrings, [], 0, 0)
+    binarystrings.sort(reverse = True)
+    return binarystrings
+
+
+# The following class defines an LP to solve the maximum size of an intersecting family
+# of (n choose k) such that the intersection of said family with the partition is of
+# the right size (given by paritions_size). The parts in partitions must be pairwise disjoint.
+# Modify the class calls in Conjecture_3.8.py at the top of the repository to run the problem for various parameters.
+# With solver = 'mis' the problem is solved by the maximum independent set search of
+# extremal/mis.py instead of gurobi, e.g. to verify the result of gurobi.
+
+class LP:
+    def __init__(self, n, k, partitions, partitions_size, solver = 'gurobi'):
+
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, k, partitions, partitions_size = admit('Conjecture_3.8', (n, k, partitions, partitions_size))
+
+        if solver not in ('gurobi', 'mis'):
+            raise ValueError("solver must be 'gurobi' or 'mis', not {!r}".format(solver))
+
+        # all the subset of [n] of size k with the correct intersection size with each part
+        binarystrings = partition_subsets(n, k, partitions, partitions_size)
+
+        # position of each surviving set looked up by its bitmask
+        position = {to_bitmask(subset): i for i, subset in enumerate(binarystrings)}
+
+        # the gurobi model is read from the cache of extremal/cache.py if it was built before with
+        # these parameters, and then the conflicts are not needed
+        model = load_model('Conjecture_3.8', (n, k, partitions, partitions_size)) if solver == 'gurobi' else None
+        if model is None:
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are disjoint,
+            # only one of them can be in the intersecting family. They are generated in shards of i by
+            # a pool of processes (see extremal/shards.py)
+            conflicts = pairs_of(*generate_sharded(disjoint_pairs, len(binarystrings), (binarystrings, position, n, k)))
+
+        # SOLVE
+        if solver == 'mis':
+            # the intersecting family is a maximum independent set of the conflict graph
+            max_set = set(binarystrings[i] for i in maximum_independent_set(len(binarystrings), conflicts))
+        else:
+            import gurobipy as gp
+            from gurobipy import GRB
+
+            if model is not None:
+                variables = model_variables(model, 'subsets', binarystrings)
+            else:
+                # problem is a maximization problem
+                model = gp.Model('')
+
+                # BINARY VARIABLES
+                # variables[(some string of 0s and 1s with a total of n1 + n2 entries)] corresponds
+                # with a subset of the union of the partitions with the correct pair-wise intersection size
+                variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+                # CONSTRAINTS
+                # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+                # disjoint sets) and only one set of each clique can be in the intersecting family
+                for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                    model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+                # OBJECTIVE FUNCTION
+                obj = gp.LinExpr()
+                for subset in binarystrings:
+                    obj += variables[subset]
+                model.setObjective(obj, GRB.MAXIMIZE)
+                store_model(model, 'Conjecture_3.8', (n, k, partitions, partitions_size))
+            model.Params.LogToConsole = 0
+            # parameters tuned for this problem class by extremal/tuning.py, if any
+            apply_solver_params(model, 'Conjecture_3.8')
+
+            # RUN
+            optimize(model)
+            max_set = set(theset for theset in binarystrings if variables[theset].x == 1)
+
+        print('Max size of set is {}'.format(len(max_set)))
+        print('The elements of this max set are as follows.')
+        for theset in binarystrings:
+            if theset in max_set:
+                print(theset)
+#        antichain = ""
+#        for theset in (binarystrings):
+#            if theset in max_set:
+#                local_set = ""
+#                for index in range(n):
+#                    if theset[index] == 1:
+#                        local_set += str(index + 1)
+#                lenthofstring = len(local_set)
+#                local_set += ", "
+#                antichain += local_set
+#        lengthofantichain = len(antichain)
+#        antichain = antichain[:lengthofantichain - 2]
+#        print(antichain)
@@ -0,0 +1,149 @@
+import math
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import all_subsets
+from extremal.sizes import admit
+from extremal.cuts import add_rows, built_cut_mode, check_cut_mode, lym_rows, row_separator, to_bitmask
+from extremal.cliques import cover_edges_with_cliques
+from extremal.mis import maximum_independent_set
+from extremal.layers import chain_row, layer_bound, print_layers
+from extremal.shards import generate_sharded, pairs_of
+from array import array
+
+# function which lists the pairs (i, j) of positions such that the set i is a strict subset of the
+# set j, for i in [start, stop), given the sets as bitmasks, their positions and the bitmask of
+# [n] (a shard of the conflicts, see extremal/shards.py). The strict supersets of the set i are
+# the set i together with a non-empty submask of its complement, so only those are walked through
+# (3^n steps for all the sets instead of 4^n)
+def comparable_pairs(start, stop, data):
+    masks, position, everything = data
+    first = array('q')
+    second = array('q')
+    for i in range(start, stop):
+        rest = everything & ~masks[i]
+        supersets = []
+        submask = rest
+        while submask:
+            supersets.append(position[masks[i] | submask])
+            submask = (submask - 1) & rest
+        # the pairs of i in increasing order of j, as when every j was tried
+        supersets.sort()
+        for j in supersets:
+            first.append(i)
+            second.append(j)
+    return first, second
+
+
+# The following class defines an LP to solve the maximum size of an antichain
+# of 2^[n]. The input of this class is n. Modify the class calls in
+# Example_1.py at the top of the repository to run the problem for various values of n.
+# With solver = 'mis' the problem is solved by the maximum independent set search of
+# extremal/mis.py instead of gurobi, e.g. to verify the result of gurobi.
+# With cuts = 'build' the LYM cuts of antichains (extremal/cuts.py) are added to the
+# model, with cuts = 'callback' they are added as cuts at the root node.
+
+class LP:
+    def __init__(self, n, solver = 'gurobi', cuts = None):
+
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, cuts = admit('Example_1', (n, cuts))
+
+        if solver not in ('gurobi', 'mis'):
+            raise ValueError("solver must be 'gurobi' or 'mis', not {!r}".format(solver))
+        check_cut_mode(cuts)
+
+        # all the subset of [n], in the order of their strings of 0s and 1s read as binary numbers
+        # (see extremal/subsets.py)
+        binarystrings = list(all_subsets(n))
+
+        # the gurobi model is read from the cache of extremal/cache.py if it was built before with
+        # these parameters, and then the conflicts are not needed
+        model = load_model('Example_1', (n, built_cut_mode(cuts))) if solver == 'gurobi' else None
+        if model is None:
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are comparable,
+            # only one of them can be in the antichain. They are generated in shards of i by a pool of
+            # processes (see extremal/shards.py)
+            masks = [to_bitmask(subset) for subset in binarystrings]
+            position = {mask: index for index, mask in enumerate(masks)}
+            conflicts = pairs_of(*generate_sharded(comparable_pairs, len(binarystrings), (masks, position, (1 << n) - 1)))
+
+        # SOLVE
+        if solver == 'mis':
+            # the antichain is a maximum independent set of the conflict graph
+            max_set = set(binarystrings[i] for i in maximum_independent_set(len(binarystrings), conflicts))
+        else:
+            import gurobipy as gp
+            from gurobipy import GRB
+
+            if model is not None:
+                variables = model_variables(model, 'subsets', binarystrings)
+            else:
+                # problem is a maximization problem
+                model = gp.Model('LP')
+
+                # BINARY VARIABLES
+                # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+                #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+                variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+                # CONSTRAINTS
+                # the conflicting pairs are covered by cliques of the conflict graph (chains of 2^[n]) and
+                # only one set of each clique can be in the antichain
+                for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                    model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+                # VALID INEQUALITIES
+                if cuts == 'build':
+                    add_rows(model, variables, lym_rows(binarystrings, n))
+
+                # OBJECTIVE FUNCTION
+                obj = gp.LinExpr()
+                for subset in binarystrings:
+                    obj += variables[subset]
+                model.setObjective(obj, GRB.MAXIMIZE)
+                store_model(model, 'Example_1', (n, built_cut_mode(cuts)))
+            # suppress reporting of solver
+            model.Params.LogToConsole = 0
+            # parameters tuned for this problem class by extremal/tuning.py, if any
+            apply_solver_params(model, 'Example_1')
+
+            # RUN
+            separator = None
+            if cuts == 'callback':
+                separator = row_separator(model, variables, lym_rows(binarystrings, n))
+            optimize(model, separator)
+            max_set = set(theset for theset in binarystrings if variables[theset].x == 1)
+
+        # Printing some output
+        formula = int(math.factorial(n)/(math.factorial(n - math.floor(n/2))*math.factorial(math.floor(n/2))))
+        print('Max size of an antichain F of the power set of [{}] is {} = (n choose floor(n/2)) = {}'.format(n, len(max_set), formula))
+        print('The elements of this max set are as follows.')
+        antichain = ""
+        for theset in reversed(binarystrings):
+            if theset in max_set:
+                local_set = ""
+                for index in range(n):
+                    if theset[index] == 1:
+                        local_set += str(index + 1)
+                lenthofstring = len(local_set)
+                local_set += ", "
+                antichain += local_set
+        lengthofantichain = len(antichain)
+        antichain = antichain[:lengthofantichain - 2]
+        print(antichain)
+
+
+# The following class bounds the same problem with the layer LP of extremal/layers.py, which has
+# n + 1 variables instead of 2^n, so that n can be 20 to 40. The only row is the one of the
+# chains (the LYM inequality), whose bound is exactly (n choose floor(n/2))
+
+class Layers:
+    def __init__(self, n):
+
+        bound, values, rows = layer_bound(n, [chain_row(n)])
+
+        formula = math.comb(n, n//2)
+        print('Max size of an antichain F of the power set of [{}] is at most {} (layer LP, {} rows), (n choose floor(n/2)) = {}'.format(n, bound, len(rows), formula))
+        print_layers(values)
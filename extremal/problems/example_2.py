@@ -0,0 +1,186 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import k_subsets
+from extremal.sizes import admit
+from extremal.graphs import max_triangles
+from extremal.cuts import to_bitmask
+from extremal.lifting import lift_graph
+import itertools
+import math
+
+# function which returns the model of the graphs on n vertices and m edges, its triangle variables
+# and its edge variables. The number of edges is the constraint edge_count, whose right hand side
+# Curve changes to solve the same model for every m
+def triangle_model(n, m, triangle_list, edge_list):
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    # MODEL
+    # the model is read from the cache of extremal/cache.py if it was built before with these
+    # parameters, otherwise it is built and added to the cache
+    model = load_model('Example_2', (n, m))
+    if model is not None:
+        T = model_variables(model, 'triangles', triangle_list)
+        E = model_variables(model, 'edges', edge_list)
+        return model, T, E
+
+    # problem is a maximization problem
+    model = gp.Model('')
+
+    # BINARY VARIABLES
+    # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+    #For example variables[(0,1,1,1)] corresponds with the subset {2,3,4} of [4]
+    T = model.addVars(triangle_list, name = 'triangles', vtype=GRB.BINARY)
+
+    # BINARY VARIABLES
+    # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n] 
+    #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+    E = model.addVars(edge_list, name = 'edges', vtype=GRB.BINARY)
+
+    # CONSTRAINTS
+    # iterate through all triangles
+    for triangle in triangle_list:
+        # determine edges of the triangles in pairs of two
+        res = [idx for idx, val in enumerate(triangle) if val != 0] 
+        edge1 = list(triangle)
+        edge2 = list(triangle)
+        edge3 = list(triangle)
+        # delete one of the three edges from the triangle
+        edge1[res[0]] = 0
+        edge2[res[1]] = 0
+        edge3[res[2]] = 0
+        # if the triangle is present then so are the triangle edges
+        model.addConstr(E[(tuple(edge1))] + E[(tuple(edge2))] + E[(tuple(edge3))]>=3*T[triangle] )
+    # the number of edges is equal to m
+    model.addConstr(sum(E.select('*','*')) == m, name = 'edge_count')
+
+    # OBJECTIVE FUNCTION
+    model.setObjective(sum(T.select('*','*','*')), GRB.MAXIMIZE)
+    store_model(model, 'Example_2', (n, m))
+    return model, T, E
+
+
+# The following class defines an LP to construct the graph on n vertices
+# and m edges such that the graph has the maximum number of triangles
+
+class LP:
+    def __init__(self, n, m):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, m = admit('Example_2', (n, m))
+
+        # all subsets of [n] of size 3 and of size 2, the sets with element 1 first (see
+        # extremal/subsets.py)
+        triangle_list = list(k_subsets(n, 3))
+        edge_list = list(k_subsets(n, 2))
+
+        model, T, E = triangle_model(n, m, triangle_list, edge_list)
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Example_2')
+
+        # RUN
+        optimize(model)
+        # VALUE OF OBJECTIVE FUNCTION
+        print('Graph G on {} vertices and {} edges with the maximum number of triangles: {} <= {}'.format(n, m, int(model.objVal), int((n-2)*m/3)))
+        print('The triangles of this max set are as follows.')
+        for theset in triangle_list:
+            if T[theset].x == 1:
+                print(theset)
+# for LATEX
+#        for theedge in edge_list:
+#            if E[theedge].x == 1:
+#                verts = []
+#                for vert in range(n):
+#                    if theedge[vert] == 1:
+#                        verts.append(vert+1)
+#                print("(N-{}) edge (N-{})".format(verts[0], verts[1]))
+
+
+# The following class solves the same problem without a MIP solver: it enumerates the graphs on
+# n vertices up to isomorphism by canonical augmentation (see extremal/graphs.py) and prints the
+# result in the same format as LP, so that the two can be cross-checked. With
+# kruskal_katona = False the optimum is proven by the enumeration alone (only fast for small n)
+
+class Orderly:
+    def __init__(self, n, m, kruskal_katona = True):
+
+        num_triangles, edge_list = max_triangles(n, m, kruskal_katona)
+        edges = set(edge_list)
+
+        # the triangles of the graph as strings of 0s and 1s, in the same order as in LP
+        triangle_list = []
+        for (a, b, c) in itertools.combinations(range(n), 3):
+            if (a, b) in edges and (a, c) in edges and (b, c) in edges:
+                triangle_list.append(tuple(1 if vert in (a, b, c) else 0 for vert in range(n)))
+        triangle_list.sort(reverse = True)
+
+        print('Graph G on {} vertices and {} edges with the maximum number of triangles: {} <= {}'.format(n, m, num_triangles, int((n-2)*m/3)))
+        print('The triangles of this max set are as follows.')
+        for theset in triangle_list:
+            print(theset)
+
+
+# The following class solves the problem for every number of edges m from 0 to C(n,2) in one run
+# and prints the extremal curve, the maximum number of triangles of a graph on n vertices as a
+# function of m. The model of LP is built once and only the right hand side of the number of edges
+# changes with m: with mode = 'scenarios' every m is a scenario of one multi-scenario solve of
+# gurobi, with mode = 'incremental' the values of m are solved one after the other, each from the
+# optimal graph of the previous m with the edge closing the most triangles added as a MIP start
+# (see lift_graph in extremal/lifting.py). The curve is kept in self.curve, indexed by m.
+# It can be run with python -m extremal Example_2 --use Curve --params 7
+
+class Curve:
+    def __init__(self, n, mode = 'scenarios'):
+        # the model of every m has the size of the model of LP(n, 0)
+        n, m = admit('Example_2', (n, 0))
+
+        if mode not in ('scenarios', 'incremental'):
+            raise ValueError("mode must be 'scenarios' or 'incremental', not {!r}".format(mode))
+
+        triangle_list = list(k_subsets(n, 3))
+        edge_list = list(k_subsets(n, 2))
+
+        model, T, E = triangle_model(n, 0, triangle_list, edge_list)
+        edge_count = model.getConstrByName('edge_count')
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Example_2')
+
+        # RUN
+        # the largest number of triangles of every m and the bound of the solver on it, which is
+        # larger if the solve stopped before proving the optimum
+        self.curve = []
+        bounds = []
+        if mode == 'scenarios':
+            model.NumScenarios = len(edge_list) + 1
+            for m in range(len(edge_list) + 1):
+                model.Params.ScenarioNumber = m
+                edge_count.ScenNRHS = m
+            optimize(model)
+            for m in range(len(edge_list) + 1):
+                model.Params.ScenarioNumber = m
+                self.curve.append(int(round(model.ScenNObjVal)))
+                bounds.append(int(math.floor(model.ScenNObjBound + 1e-6)))
+        else:
+            edge_variables = [E[edge] for edge in edge_list]
+            triangle_variables = [T[triangle] for triangle in triangle_list]
+            edges = []
+            for m in range(len(edge_list) + 1):
+                edge_count.RHS = m
+                if m > 0:
+                    lifted = lift_graph('Example_2', edges, n, {'n': n, 'm': m})
+                    lifted_edges = set(lifted['edges'])
+                    lifted_triangles = set(lifted['triangles'])
+                    model.setAttr('Start', edge_variables, [1 if to_bitmask(edge) in lifted_edges else 0 for edge in edge_list])
+                    model.setAttr('Start', triangle_variables, [1 if to_bitmask(triangle) in lifted_triangles else 0 for triangle in triangle_list])
+                optimize(model)
+                values = model.getAttr('X', edge_variables)
+                edges = [to_bitmask(edge) for edge, value in zip(edge_list, values) if value > 0.5]
+                self.curve.append(int(round(model.objVal)))
+                bounds.append(int(math.floor(model.ObjBound + 1e-6)))
+
+        # VALUE OF OBJECTIVE FUNCTION
+        print('Graphs G on {} vertices and m edges with the maximum number of triangles, m = 0, ..., {}'.format(n, len(edge_list)))
+        for m, (num_triangles, bound) in enumerate(zip(self.curve, bounds)):
+            print('m = {}: {} <= {}{}'.format(m, num_triangles, int((n-2)*m/3), '' if bound == num_triangles else ' (not proven optimal, bound {})'.format(bound)))
@@ -0,0 +1,112 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.sizes import admit
+from extremal.cuts import to_bitmask
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, degree_rows, missed_rows, regularity_rows
+from extremal.shards import add_sharded_rows, generate_sharded, pairs_of
+from extremal.specs import (HIGHER_ORDER, PAIRWISE, chain_rows, conditions_of, conflicting_pairs, disjoint_rows,
+                            disjoint_triangle_rows, format_spec, ground_subsets, parse_spec, positions_of)
+
+# The following class defines an LP from a declarative specification of a family problem (see
+# extremal/specs.py), e.g. "intersecting & diameter <= 3 over 2^[7], maximize diversity". The
+# input of this class is the specification as a string.
+# Modify the class calls in Spec.py at the top of the repository to run the problem for various specifications.
+
+class LP:
+    def __init__(self, spec):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # specification alone (see extremal/sizes.py). The specification is kept in its normal
+        # form, so that the same problem written another way is read from the cache
+        text, = admit('Spec', (format_spec(parse_spec(spec)),))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        spec = parse_spec(text)
+        n = spec['n']
+
+        # the sets of the ground family, in the order of extremal/subsets.py
+        binarystrings = ground_subsets(spec)
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with this
+        # specification, otherwise it is built and added to the cache
+        model = load_model('Spec', (text,))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n]
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            masks = [to_bitmask(subset) for subset in binarystrings]
+            position = positions_of(masks)
+
+            # PAIRWISE CONDITIONS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets violate a
+            # pairwise condition together, generated in shards of i by a pool of processes (see
+            # extremal/shards.py). They are covered by cliques of the conflict graph and only one set
+            # of each clique can be in the family
+            pairwise = conditions_of(spec, PAIRWISE)
+            if pairwise:
+                conflicts = pairs_of(*generate_sharded(conflicting_pairs, len(binarystrings), (masks, pairwise)))
+                for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                    model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+                # the empty set is disjoint from itself
+                if ('intersecting',) in pairwise and 0 in position:
+                    variables[binarystrings[position[0]]].UB = 0
+
+            # HIGHER ORDER CONDITIONS
+            # the forbidden configurations of s sets, of which at most s - 1 can be in the family,
+            # generated in shards of their first set
+            for name, parameter in conditions_of(spec, HIGHER_ORDER):
+                if name == 'chain_free':
+                    lengths, positions = generate_sharded(chain_rows, len(binarystrings), (masks, position, parameter))
+                    add_sharded_rows(model, variables, binarystrings, lengths, positions, parameter)
+                elif name == 'no_disjoint':
+                    lengths, positions = generate_sharded(disjoint_rows, len(binarystrings), (masks, position, n, parameter))
+                    add_sharded_rows(model, variables, binarystrings, lengths, positions, parameter - 1)
+                else:
+                    triangles = [(1 << u) | (1 << v) | (1 << w) for w in range(n) for v in range(w) for u in range(v)]
+                    triangles.sort()
+                    lengths, positions = generate_sharded(disjoint_triangle_rows, len(triangles), (triangles, position, parameter))
+                    add_sharded_rows(model, variables, binarystrings, lengths, positions, 3*parameter - 1)
+
+            # INCIDENCE CONDITIONS
+            # read off the incidence matrix of the family (see extremal/incidence.py)
+            incidence = Incidence(binarystrings, n)
+            for condition in spec['conditions']:
+                if condition[0] == 'covering':
+                    add_block(model, variables, binarystrings, missed_rows(incidence))
+                elif condition[0] == 'regular':
+                    add_block(model, variables, binarystrings, regularity_rows(incidence, condition[1]))
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            if spec['objective'] == 'diversity':
+                # the largest degree is attained at the element 1, i.e. |F(i)| - |F(1)| <= 0 for each
+                # i, and the diversity is the number of sets which do not contain the element 1
+                add_block(model, variables, binarystrings, degree_rows(incidence, 0))
+                for index in incidence.missing(0):
+                    obj += variables[binarystrings[index]]
+            else:
+                for subset in binarystrings:
+                    obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Spec', (text,))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Spec')
+
+        # RUN
+        optimize(model)
+
+        print('Max {} of a family of "{}" is {}'.format(spec['objective'], text, int(round(model.objVal))))
+        print('The elements of this max set are as follows.')
+        for theset in binarystrings:
+            if variables[theset].x > 0.5:
+                print(theset)
@@ -0,0 +1,116 @@
+from extremal.params import apply_solver_params, optimize
+from extremal.cache import load_model, model_variables, store_model
+from extremal.subsets import k_subsets
+from extremal.sizes import admit
+from extremal.cliques import cover_edges_with_cliques
+from extremal.incidence import Incidence, add_block, regularity_rows
+import math
+
+# the following class defines an LP which determines the maximum size of
+# a s-subset-regular k-uniform intersecting family F of [n].
+# the inputs for this class are n,k,s
+
+class LP:
+    def __init__(self, n, k, s):
+        # refuse to build a model which does not fit in memory, the estimate is computed from the
+        # parameters alone (see extremal/sizes.py)
+        n, k, s = admit('Theorem_3.9', (n, k, s))
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        # all the subset of [n] of size k, the sets with element 1 first (see extremal/subsets.py)
+        binarystrings = list(k_subsets(n, k))
+
+        # MODEL
+        # the model is read from the cache of extremal/cache.py if it was built before with these
+        # parameters, otherwise it is built and added to the cache
+        model = load_model('Theorem_3.9', (n, k, s))
+        if model is not None:
+            variables = model_variables(model, 'subsets', binarystrings)
+        else:
+            # problem is a maximization problem
+            model = gp.Model('LP')
+
+            # BINARY VARIABLES
+            # variables[(some string of 0s and 1s with a total of n entries)] corresponds to the subset of [n]
+            #For example variables[(0,1,1)] corresponds with the subset {2,3} of [3]
+            variables = model.addVars(binarystrings, name = 'subsets', vtype=GRB.BINARY)
+
+            # function to determine whether the intersection of the two sets is empty
+            def int_check(string1, string2):
+                for index in range(n):
+                    # if both subsets contain the element index + 1
+                    if (string1[index] + string2[index]) == 2:
+                        return 0
+                # the intersection of the two sets is empty
+                return 1
+
+            # CONFLICTS
+            # pairs (i, j) of positions in binarystrings such that the corresponding sets are disjoint
+            conflicts = []
+            # iterate through all subsets
+            for i in range(len(binarystrings)):
+                # if we already check set corresponding to i against the set corresponding to j
+                # where i < j we need not check set j against set i later
+                for j in range(i+1, len(binarystrings)):
+                    setone = binarystrings[i]
+                    settwo = binarystrings[j]
+                    if int_check(setone, settwo):
+                        # only one of them can be in the intersecting family
+                        conflicts.append((i, j))
+
+            # CONSTRAINTS
+            # the conflicting pairs are covered by cliques of the conflict graph (families of pairwise
+            # disjoint sets) and only one set of each clique can be in the intersecting family
+            for clique in cover_edges_with_cliques(len(binarystrings), conflicts):
+                model.addConstr(gp.quicksum(variables[binarystrings[i]] for i in clique) <= 1)
+
+            # all subsets of size s have to be contained in the same number of elements of the
+            # max set. Therefore, the sum of the variables which contain the set of rank 0,
+            # i.e. {1,...,s}, must be the same as the sum of the variables which contain
+            # all sets of size s. Note that we could replace the set of rank 0 with any
+            # other set of size s, it does not matter. The sets containing each s-set are read off
+            # the incidence matrix of the family (see extremal/incidence.py)
+            incidence = Incidence(binarystrings, n)
+            add_block(model, variables, binarystrings, regularity_rows(incidence, s))
+
+            # OBJECTIVE FUNCTION
+            obj = gp.LinExpr()
+            for subset in binarystrings:
+                obj += variables[subset]
+            model.setObjective(obj, GRB.MAXIMIZE)
+            store_model(model, 'Theorem_3.9', (n, k, s))
+        model.Params.LogToConsole = 0
+        # parameters tuned for this problem class by extremal/tuning.py, if any
+        apply_solver_params(model, 'Theorem_3.9')
+
+        # RUN
+        optimize(model)
+
+        # Conjecture bound
+        formula = int((math.factorial(n)/(math.factorial(k)*math.factorial((n-k))))/( 1 + (math.factorial(n-k)/(math.factorial(k)*math.factorial((n-2*k))))/(math.factorial(n-k-s-2)/(math.factorial(k-s-2)*math.factorial((n-2*k))))))
+
+        if formula == int(model.objVal):
+            print('Found example which is tight with the bound')
+            print('Max {}-subset-regular {}-uniform intersecting family F of ([{}] choose {}) is {} = (n choose k)/( 1 + (n-k choose k)(n-k-s-2 choose k-s-2)) = {}'.format(s, k, n, k, int(model.objVal), formula))
+            print('The elements of this set are as follows.')
+            antichain = ""
+            for theset in binarystrings:
+                if variables[theset].x == 1:
+                    print(theset)
+# for LATEX
+#                    local_set = "\\{"
+#                    for index in range(n):
+#                        if theset[index] == 1:
+#                            local_set += str(index + 1)
+#                            local_set += ", "
+#                    lenthofstring = len(local_set)
+#                    local_set = local_set[:lenthofstring - 2]
+#                    local_set += "\\}, "
+#                    antichain += local_set
+#            lengthofantichain = len(antichain)
+#            antichain = antichain[:lengthofantichain - 2]
+#            print(antichain)        
+        else:
+            print('Could not find example which is tight with the bound')
@@ -0,0 +1,222 @@
+# The following runs a race: the same instance of a problem class is solved in several processes
+# at once, each with its own configuration (gurobi parameters such as the seed, or another
+# backend such as solver = 'mis'). The racers share the best incumbent found so far: every new
+# incumbent is published, and the other gurobi racers inject it into their own search at the
+# next node. The first racer which proves optimality wins, the others are stopped, and the
+# timeline of all the racers is reported. Run it from the top of the repository, e.g.
+#
+#     python -m extremal.racing Conjecture_3.10 --params 9 --configs racers.json --time-limit 3600
+#     python -m extremal.racing Example_1 --params 6 cuts=callback
+#
+# where racers.json is a list of configurations of the form
+#
+#     [{"name": "seed1", "params": {"Seed": 1}}, {"name": "mis", "kwargs": {"solver": "mis"}}]
+#
+# "params" are gurobi parameters set on the models of the racer and "kwargs" are keyword
+# arguments of the LP class of the script, which replace those of the instance. The racers split
+# the cores: each one runs with Threads = cores/racers unless its "params" set Threads. The
+# parameters of the instance are given as in python -m extremal, in order or as name=value.
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import queue
+import time
+
+import extremal.params as params
+from extremal.problems import bind_arguments, load_problem, parse_params, problem_name
+
+# the configurations raced when none are given
+DEFAULT_CONFIGS = [
+    {'name': 'seed0', 'params': {'Seed': 0}},
+    {'name': 'feasibility', 'params': {'Seed': 1, 'MIPFocus': 1}},
+    {'name': 'optimality', 'params': {'Seed': 2, 'MIPFocus': 2}},
+    {'name': 'bound', 'params': {'Seed': 3, 'MIPFocus': 3}},
+]
+
+
+# function which returns the gurobi callback of a racer. shared holds the best incumbent of the
+# race ('objective', 'solution', 'source'), version counts its updates so that a racer only reads
+# it when it changed, and the models of all racers have the same variables in the same order
+# since they are built by the same script. The variables and the sense of a model are those kept
+# on it by optimize of extremal/params.py before the solve
+def make_callback(name, shared, version, lock, stop, events, start):
+    from gurobipy import GRB
+
+    seen_version = [0]
+
+    def callback(model, where):
+        if stop.is_set():
+            model.terminate()
+            return
+        variables = model._variables
+        # the objective of a maximization problem is larger for better solutions
+        sense = -model._sense
+
+        if where == GRB.Callback.MIPSOL:
+            objective = model.cbGet(GRB.Callback.MIPSOL_OBJ)
+            with lock:
+                if 'objective' not in shared or sense*objective > sense*shared['objective']:
+                    shared['solution'] = model.cbGetSolution(variables)
+                    shared['objective'] = objective
+                    shared['source'] = name
+                    version.value += 1
+                    seen_version[0] = version.value
+                    events.put((time.time() - start, name, 'incumbent', objective))
+
+        elif where == GRB.Callback.MIPNODE and model.cbGet(GRB.Callback.MIPNODE_STATUS) == GRB.OPTIMAL:
+            if version.value == seen_version[0]:
+                return
+            with lock:
+                seen_version[0] = version.value
+                objective = shared['objective']
+                solution = shared['solution']
+                source = shared['source']
+            if source != name and sense*objective > sense*model.cbGet(GRB.Callback.MIPNODE_OBJBST):
+                model.cbSetSolution(variables, solution)
+                model.cbUseSolution()
+                events.put((time.time() - start, name, 'imported', '{} from {}'.format(objective, source)))
+
+    return callback
+
+
+# function which runs one racer in its own process and reports to events
+def run_racer(problem, arguments, kwargs, config, threads, shared, version, lock, stop, events, start):
+    name = config['name']
+    events.put((time.time() - start, name, 'start', config))
+
+    output = io.StringIO()
+    try:
+        # the racers share the cores of the machine, unless a configuration sets its own threads
+        params.overrides = dict({'Threads': threads}, **config.get('params', {}))
+        params.callback = make_callback(name, shared, version, lock, stop, events, start)
+        params.recorded_models = []
+        LP = load_problem(problem)
+        with contextlib.redirect_stdout(output):
+            LP(*arguments, **dict(kwargs, **config.get('kwargs', {})))
+    except Exception as error:
+        events.put((time.time() - start, name, 'failed', repr(error)))
+        return
+
+    # status 2 is GRB.OPTIMAL. A racer without gurobi models used an exact backend
+    models = params.recorded_models
+    result = {
+        'optimal': all(model.Status == 2 for model in models),
+        'objective': models[-1].ObjVal if models and models[-1].SolCount > 0 else None,
+        'output': output.getvalue(),
+    }
+    events.put((time.time() - start, name, 'finished', result))
+
+
+# function which races the configurations on LP(*arguments, **kwargs) of the problem class, the
+# keyword arguments of a configuration replacing those of kwargs. Returns
+# (winner, timeline): winner is the 'finished' event of the first racer to prove optimality (None
+# if there is none before the time limit) and timeline the list of events of all the racers as
+# (seconds since the start, racer, kind, detail) in order of time
+def race(problem, arguments, configs = None, time_limit = None, kwargs = None):
+    configs = configs or DEFAULT_CONFIGS
+    kwargs = dict(kwargs or {})
+    names = [config['name'] for config in configs]
+    if len(set(names)) != len(names):
+        raise ValueError('the racers need distinct names, got {}'.format(names))
+
+    context = multiprocessing.get_context()
+    with context.Manager() as manager:
+        shared = manager.dict()
+        version = context.Value('i', 0)
+        lock = context.Lock()
+        stop = context.Event()
+        events = context.Queue()
+        start = time.time()
+
+        threads = max(1, (os.cpu_count() or 1)//len(configs))
+        processes = [context.Process(target = run_racer, args = (problem, arguments, kwargs, config, threads, shared, version, lock, stop, events, start))
+                     for config in configs]
+        for process in processes:
+            process.start()
+
+        timeline = []
+        winner = None
+        running = len(processes)
+        while running > 0 and winner is None:
+            if time_limit is None:
+                timeout = None
+            else:
+                timeout = start + time_limit - time.time()
+                if timeout <= 0:
+                    break
+            try:
+                event = events.get(timeout = timeout)
+            except queue.Empty:
+                break
+            timeline.append(event)
+            if event[2] in ('finished', 'failed'):
+                running -= 1
+            if event[2] == 'finished' and event[3]['optimal']:
+                winner = event
+
+        # stop the other racers, give them a moment to stop their solve and report
+        stop.set()
+        deadline = time.time() + 5
+        while any(process.is_alive() for process in processes) and time.time() < deadline:
+            try:
+                timeline.append(events.get(timeout = 0.1))
+            except queue.Empty:
+                pass
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        while True:
+            try:
+                timeline.append(events.get_nowait())
+            except queue.Empty:
+                break
+
+    timeline.sort(key = lambda event: event[0])
+    return winner, timeline
+
+
+# function which prints the timeline of a race
+def print_timeline(timeline):
+    for (seconds, name, kind, detail) in timeline:
+        if kind == 'finished':
+            detail = 'optimal' if detail['optimal'] else 'not optimal (objective {})'.format(detail['objective'])
+        print('{:10.2f}s  {:<15} {:<10} {}'.format(seconds, name, kind, detail))
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m extremal.racing', description = 'Race several solver configurations on the same instance.')
+    parser.add_argument('problem', help = 'problem class, i.e. the name of the script (e.g. Conjecture_3.10)')
+    parser.add_argument('--params', nargs = '*', default = [], help = 'parameters of the LP class, in order or as name=value')
+    parser.add_argument('--configs', help = 'json file with the list of configurations to race')
+    parser.add_argument('--time-limit', type = float, help = 'time limit of the race in seconds')
+    args = parser.parse_args(argv)
+
+    try:
+        problem = problem_name(args.problem)
+        positional, keyword_params = parse_params(args.params)
+        # all the parameters are passed by name, so that the keyword arguments of a configuration
+        # replace them
+        arguments = bind_arguments(problem, positional, keyword_params)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+    configs = None
+    if args.configs:
+        with open(args.configs) as f:
+            configs = json.load(f)
+
+    winner, timeline = race(problem, (), configs, args.time_limit, arguments)
+    print_timeline(timeline)
+    if winner is None:
+        print('No racer proved optimality.')
+    else:
+        print('Winner: {} after {:.2f}s'.format(winner[1], winner[0]))
+        print(winner[3]['output'], end = '')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+# The following runs a sweep of instances of mixed sizes (e.g. Conjecture_3.2 LP(6,5,2), which is
+# solved in seconds, next to LP(8,7,2), which runs for hours) on the cores of one machine, from a
+# prediction of the cost of every instance. Run it from the top of the repository, e.g.
+#
+#     python -m extremal.scheduler Conjecture_3.2 Example_2 --cores 16
+#     python -m extremal.scheduler --jobs sweep.json --dry-run
+#
+# where the instances are the benchmark ladders of the problem classes (see extremal/tuning.py) or
+# a json file of the form [{"problem": "Conjecture_3.2", "params": [8, 7, 2]}, ...].
+#
+# The cost model predicts the seconds of an instance from the size of its model estimated from the
+# parameters (extremal/sizes.py), as seconds = a*size^b/threads^SPEEDUP_EXPONENT with size the
+# number of variables, nonzeros and conflicts. a and b are fitted for every problem class by least
+# squares on the logarithms of its past runs, which are kept in history.jsonl in the cache
+# directory (see extremal/cache.py); a class with a single run keeps the exponent of all the runs,
+# and a class without runs the defaults. Every finished instance (of the scheduler or of the job
+# server of extremal/server.py) is added to the history, and the scheduler refits the model and
+# predicts the waiting instances again after each of them.
+#
+# The schedule is longest predicted first: an instance whose prediction is larger than the fair
+# share of the whole sweep (the total predicted work over the cores) gets as many threads as it has
+# shares, up to all the cores, and the others one thread each. An instance starts as soon as its
+# threads are free and the estimated memory of the running instances stays within
+# EXTREMAL_MAX_MEMORY; while the next large instance waits for its threads, the small ones behind
+# it fill the free cores. Every instance runs in its own process, as a job of extremal/server.py.
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+
+from extremal.cache import CACHE_DIR, REPOSITORY
+from extremal.problems import bind_arguments, model_arguments, problem_name
+from extremal.sizes import MAX_MEMORY, estimate, memory
+
+# file with the past runs
+HISTORY_FILE = os.path.join(CACHE_DIR, 'history.jsonl')
+
+# the seconds of an instance on t threads are those on one thread over t^SPEEDUP_EXPONENT
+SPEEDUP_EXPONENT = 0.5
+
+# the cost model of a problem class without runs: a*size^b seconds
+DEFAULT_COEFFICIENT = 1e-5
+DEFAULT_EXPONENT = 1.2
+
+
+# function which returns the size of the model of an instance, the variable of the cost model
+def model_size(problem, args = (), kwargs = None):
+    size = estimate(problem, model_arguments(problem, args, kwargs))
+    return size['variables'] + size['nonzeros'] + size['conflicts']
+
+
+# function which returns the past runs of the history file, a list of dictionaries with the
+# problem, the arguments, the size of the model, the threads and the seconds
+def load_history(history_file = None):
+    history_file = history_file or HISTORY_FILE
+    if not os.path.exists(history_file):
+        return []
+    runs = []
+    with open(history_file) as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except ValueError:
+                continue
+    return runs
+
+
+# function which adds a finished run to the history file
+def record_run(problem, args, kwargs, threads, seconds, history_file = None):
+    history_file = history_file or HISTORY_FILE
+    os.makedirs(os.path.dirname(history_file), exist_ok = True)
+    run = {'problem': problem, 'arguments': list(bind_arguments(problem, args, kwargs).values()),
+           'size': model_size(problem, args, kwargs), 'threads': threads or 1, 'seconds': seconds}
+    with open(history_file, 'a') as f:
+        f.write(json.dumps(run) + '\n')
+
+
+# function which fits log(seconds on one thread) = log(a) + b*log(size) by least squares, and
+# returns (a, b). The exponent is fixed when given, or when the sizes are all the same
+def fit(runs, exponent = None):
+    points = [(math.log(max(run['size'], 1)), math.log(max(run['seconds'], 1e-3)*run['threads']**SPEEDUP_EXPONENT))
+              for run in runs]
+    mean_x = sum(x for x, y in points)/len(points)
+    mean_y = sum(y for x, y in points)/len(points)
+    spread = sum((x - mean_x)**2 for x, y in points)
+    if exponent is None:
+        exponent = sum((x - mean_x)*(y - mean_y) for x, y in points)/spread if spread > 0 else DEFAULT_EXPONENT
+    return math.exp(mean_y - exponent*mean_x), exponent
+
+
+# The following class is the cost model: the fitted (a, b) of every problem class with runs
+class CostModel:
+    def __init__(self, runs):
+        self.refit(runs)
+
+    def refit(self, runs):
+        self.exponent = fit(runs)[1] if runs else DEFAULT_EXPONENT
+        by_problem = {}
+        for run in runs:
+            by_problem.setdefault(run['problem'], []).append(run)
+        self.fits = {}
+        for problem, problem_runs in by_problem.items():
+            # a few runs of similar sizes say little about the exponent, take that of all the runs
+            distinct = len(set(run['size'] for run in problem_runs))
+            self.fits[problem] = fit(problem_runs, None if distinct >= 3 else self.exponent)
+
+    # the predicted seconds of a model of the given size on the given threads
+    def predict(self, problem, size, threads = 1):
+        a, b = self.fits.get(problem, (DEFAULT_COEFFICIENT, DEFAULT_EXPONENT))
+        return a*max(size, 1)**b/threads**SPEEDUP_EXPONENT
+
+
+# The following class is an instance of the sweep, with its predicted seconds on one thread, the
+# threads it is given and the estimated memory of its model
+class Job:
+    def __init__(self, problem, args = (), kwargs = None):
+        self.problem = problem_name(problem)
+        self.args = list(args)
+        self.kwargs = dict(kwargs or {})
+        self.arguments = bind_arguments(self.problem, self.args, self.kwargs)
+        self.size = model_size(self.problem, self.args, self.kwargs)
+        self.memory = memory(estimate(self.problem, model_arguments(self.problem, self.args, self.kwargs)))
+        self.predicted = None
+        self.threads = 1
+
+    def __str__(self):
+        return '{}({})'.format(self.problem, ', '.join('{} = {!r}'.format(name, value) for name, value in self.arguments.items()))
+
+
+# function which predicts the jobs with the cost model, gives threads to the large ones and sorts
+# them longest predicted first. The fair share counts the work of the running jobs too, so that the
+# last jobs of a sweep are not given the cores of the jobs still running
+def plan(jobs, cost_model, cores, running = ()):
+    for job in jobs:
+        job.predicted = cost_model.predict(job.problem, job.size)
+    share = sum(job.predicted for job in list(jobs) + list(running))/cores
+    for job in jobs:
+        job.threads = max(1, min(cores, int(job.predicted//share))) if share > 0 else 1
+    jobs.sort(key = lambda job: job.predicted, reverse = True)
+    return jobs
+
+
+# function which runs a job in its own process with its threads and returns its result (see
+# run_job of extremal/server.py)
+async def run(job):
+    command = [sys.executable, '-m', 'extremal.server', '--run-job',
+               json.dumps({'problem': job.problem, 'kwargs': job.arguments}), '--threads', str(job.threads)]
+    process = await asyncio.create_subprocess_exec(*command, cwd = REPOSITORY, stdout = asyncio.subprocess.PIPE)
+    result = {'error': 'the job process exited without a result'}
+    async for line in process.stdout:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if event['event'] == 'result':
+            result = event['result']
+        elif event['event'] == 'error':
+            result = event
+    await process.wait()
+    return result
+
+
+# function which runs the jobs on the cores as described above and returns the list of (job,
+# result, seconds) in the order they finished. report is called with every finished job
+async def schedule(jobs, cores, memory_limit = MAX_MEMORY, history_file = None, report = None):
+    cost_model = CostModel(load_history(history_file))
+    waiting = plan(list(jobs), cost_model, cores)
+    running = {}
+    free = cores
+    finished = []
+    while waiting or running:
+        # start every waiting job which fits, in order: a large job which waits for its threads
+        # lets the smaller ones behind it use the free cores
+        used_memory = sum(job.memory for job in running.values())
+        for job in list(waiting):
+            if job.threads <= free and (not memory_limit or not running or used_memory + job.memory <= memory_limit):
+                waiting.remove(job)
+                free -= job.threads
+                used_memory += job.memory
+                task = asyncio.ensure_future(run(job))
+                running[task] = job
+                job.start = time.time()
+        if not running:
+            # a job which does not fit even alone is run alone
+            job = waiting.pop(0)
+            job.threads = min(job.threads, cores)
+            task = asyncio.ensure_future(run(job))
+            running[task] = job
+            free -= job.threads
+            job.start = time.time()
+        done, pending = await asyncio.wait(running, return_when = asyncio.FIRST_COMPLETED)
+        for task in done:
+            job = running.pop(task)
+            free += job.threads
+            seconds = time.time() - job.start
+            result = task.result()
+            finished.append((job, result, seconds))
+            if 'error' not in result:
+                record_run(job.problem, job.args, job.kwargs, job.threads, seconds, history_file)
+            if report is not None:
+                report(job, result, seconds)
+        # the new runs refine the predictions of the waiting jobs
+        if done and waiting:
+            cost_model.refit(load_history(history_file))
+            waiting = plan(waiting, cost_model, cores, running.values())
+    return finished
+
+
+# function which returns the jobs of the benchmark ladders of the problem classes
+def ladder_jobs(problems):
+    from extremal.tuning import LADDERS
+    jobs = []
+    for problem in problems:
+        problem = problem_name(problem)
+        if problem not in LADDERS:
+            raise ValueError('{} has no benchmark ladder, give its instances with --jobs'.format(problem))
+        jobs.extend(Job(problem, arguments) for arguments in LADDERS[problem])
+    return jobs
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = 'python -m extremal.scheduler', description = 'Run a sweep of instances longest predicted first on the cores of this machine.')
+    parser.add_argument('problems', nargs = '*', help = 'problem classes whose benchmark ladders are run')
+    parser.add_argument('--jobs', help = 'json file with the list of instances {"problem", "params", "kwargs"}')
+    parser.add_argument('--cores', type = int, default = os.cpu_count() or 1, help = 'cores used by the sweep (default: all)')
+    parser.add_argument('--dry-run', action = 'store_true', help = 'only print the plan with the predicted seconds')
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = ladder_jobs(args.problems)
+        if args.jobs:
+            with open(args.jobs) as f:
+                jobs.extend(Job(job['problem'], job.get('params', []), job.get('kwargs', {})) for job in json.load(f))
+    except (ValueError, TypeError, KeyError) as error:
+        parser.error(str(error))
+    if not jobs:
+        parser.error('no instances, give problem classes or --jobs')
+
+    if args.dry_run:
+        for job in plan(jobs, CostModel(load_history()), args.cores):
+            print('{:>12.1f}s  {:>2} threads  {}'.format(job.predicted/job.threads**SPEEDUP_EXPONENT, job.threads, job))
+        return
+
+    def report(job, result, seconds):
+        if 'error' in result:
+            print('{:>10.1f}s  {}: failed, {}'.format(seconds, job, result['error']))
+        else:
+            print('{:>10.1f}s  {} on {} threads (predicted {:.1f}s): objective {}, optimal {}'.format(
+                seconds, job, job.threads, job.predicted/job.threads**SPEEDUP_EXPONENT, result['objective'], result['optimal']))
+        sys.stdout.flush()
+
+    start = time.time()
+    asyncio.run(schedule(jobs, args.cores, report = report))
+    print('sweep of {} instances on {} cores in {:.1f}s'.format(len(jobs), args.cores, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+# The following is a small local job server for the problem classes, so that the instances
+# submitted by several people share a fixed number of solver license tokens. Start it from the top
+# of the repository with
+#
+#     python -m extremal.server --tokens 2 --threads 8
+#
+# and submit instances with
+#
+#     python -m extremal.server --submit Conjecture_3.10 --params 9
+#
+# The server listens on a unix socket (.model_cache/server.sock, or --socket) or on a local TCP
+# port (--port). A client sends one json line {"problem": ..., "params": [...], "kwargs": {...}}
+# with the parameters of the LP class, and receives json lines with an "event":
+#
+#   - "queued": the job (its key) and the number of jobs waiting for a token before it,
+#   - "started": the token the job runs with,
+#   - "progress": the seconds since the start, best objective and bound of the solve,
+#   - "result": the structured result of the job (objective, bound, optimal, runtime, output),
+#   - "error": the job or the request failed.
+#
+# A job whose optimal result is stored (see the results of extremal/cache.py) is answered at once,
+# a job stopped by a limit is not stored and is solved again, and a job which is the same as one
+# queued or running is joined instead of solved again. Every job runs in its own process, with
+# one token of the pool for as long as it runs and at most --threads gurobi threads. The tokens of
+# --tokens n are local stand-ins named local-0, ..., local-(n-1); --tokens a,b,c names them, e.g.
+# after the tokens of a license server. The job process gets its token in the environment
+# variable EXTREMAL_LICENSE_TOKEN.
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+from extremal.cache import CACHE_DIR, REPOSITORY, load_result, store_result
+from extremal.problems import bind_arguments, load_problem, problem_name
+from extremal.scheduler import record_run
+
+# default location of the socket of the server
+SOCKET = os.path.join(CACHE_DIR, 'server.sock')
+
+# seconds between two progress events of a solve
+PROGRESS_INTERVAL = 1.0
+
+
+# The following class is the pool of solver license tokens: a job takes a token before it starts
+# and gives it back when it is done, so at most as many jobs as tokens run at once
+class TokenPool:
+    def __init__(self, tokens):
+        self.tokens = asyncio.Queue()
+        for token in tokens:
+            self.tokens.put_nowait(token)
+
+    async def acquire(self):
+        return await self.tokens.get()
+
+    def release(self, token):
+        self.tokens.put_nowait(token)
+
+    def available(self):
+        return self.tokens.qsize()
+
+
+# The following class is a job: one instance of a problem class, with the events sent so far (so
+# that a client joining the job late gets them too) and the queues of the clients following it
+class Job:
+    def __init__(self, key, problem, arguments):
+        self.key = key
+        self.problem = problem
+        self.arguments = arguments
+        self.events = []
+        self.followers = []
+        self.done = False
+
+    def publish(self, event):
+        self.events.append(event)
+        for follower in self.followers:
+            follower.put_nowait(event)
+
+    def follow(self):
+        follower = asyncio.Queue()
+        for event in self.events:
+            follower.put_nowait(event)
+        self.followers.append(follower)
+        return follower
+
+
+# function which returns the key of a job: the problem class and all the parameters of its LP
+# class, in order
+def job_key(problem, arguments):
+    return json.dumps([problem, list(arguments.values())])
+
+
+# The following class is the server: it accepts jobs, answers them from the stored results,
+# joins the same jobs together and runs the others with a token of the pool
+class JobServer:
+    def __init__(self, tokens, threads = None):
+        self.pool = TokenPool(tokens)
+        self.threads = threads
+        self.jobs = {}
+        self.waiting = 0
+
+    # function which returns the job of a request, a new one or the same one already queued or
+    # running. Raises ValueError or TypeError if the request is not a valid instance
+    def submit(self, request):
+        problem = problem_name(request['problem'])
+        arguments = bind_arguments(problem, request.get('params', []), request.get('kwargs', {}))
+        key = job_key(problem, arguments)
+        if key in self.jobs:
+            return self.jobs[key]
+
+        job = Job(key, problem, arguments)
+        result = load_result(problem, tuple(arguments.values()))
+        if result is not None:
+            result['cached'] = True
+            job.publish({'event': 'result', 'job': key, 'result': result})
+            job.done = True
+            return job
+
+        self.jobs[key] = job
+        job.publish({'event': 'queued', 'job': key, 'waiting': self.waiting})
+        asyncio.ensure_future(self.run(job))
+        return job
+
+    # function which runs a job in its own process once it has a token, and publishes its events
+    async def run(self, job):
+        self.waiting += 1
+        token = await self.pool.acquire()
+        self.waiting -= 1
+        try:
+            job.publish({'event': 'started', 'job': job.key, 'token': token})
+            command = [sys.executable, '-m', 'extremal.server', '--run-job',
+                       json.dumps({'problem': job.problem, 'kwargs': job.arguments})]
+            if self.threads:
+                command += ['--threads', str(self.threads)]
+            environment = dict(os.environ, EXTREMAL_LICENSE_TOKEN = str(token))
+            process = await asyncio.create_subprocess_exec(*command, cwd = REPOSITORY, env = environment,
+                                                           stdout = asyncio.subprocess.PIPE,
+                                                           stderr = asyncio.subprocess.PIPE)
+            # stderr is read while the events are, a job which writes more than a pipe buffer of
+            # warnings would otherwise block
+            errors = asyncio.ensure_future(process.stderr.read())
+            finished = False
+            async for line in process.stdout:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                event['job'] = job.key
+                if event['event'] == 'result':
+                    event['result']['token'] = token
+                    # only a proven optimum is the answer of every later identical job, a solve
+                    # stopped by a limit is solved again
+                    if event['result']['optimal']:
+                        store_result(event['result'], job.problem, tuple(job.arguments.values()))
+                    # the run refines the cost model of the sweeps (see extremal/scheduler.py)
+                    record_run(job.problem, (), job.arguments, event['result']['threads'], event['result']['seconds'])
+                    finished = True
+                elif event['event'] == 'error':
+                    finished = True
+                job.publish(event)
+            errors = await errors
+            await process.wait()
+            if not finished:
+                job.publish({'event': 'error', 'job': job.key,
+                             'error': 'the job process exited with code {}: {}'.format(process.returncode, errors.decode()[-2000:])})
+        except Exception as error:
+            job.publish({'event': 'error', 'job': job.key, 'error': repr(error)})
+        finally:
+            self.pool.release(token)
+            job.done = True
+            del self.jobs[job.key]
+            job.publish(None)
+
+    # function which serves one client: reads its request and writes the events of its job until
+    # the result
+    async def handle(self, reader, writer):
+        try:
+            line = await reader.readline()
+            try:
+                job = self.submit(json.loads(line))
+            except (ValueError, TypeError, KeyError) as error:
+                writer.write((json.dumps({'event': 'error', 'error': str(error)}) + '\n').encode())
+                return
+            if job.done:
+                for event in job.events:
+                    writer.write((json.dumps(event) + '\n').encode())
+                return
+            follower = job.follow()
+            while True:
+                event = await follower.get()
+                if event is None:
+                    break
+                writer.write((json.dumps(event) + '\n').encode())
+                await writer.drain()
+                if event['event'] in ('result', 'error'):
+                    break
+        finally:
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+            writer.close()
+
+
+# function which runs the server until it is interrupted
+async def serve(tokens, threads = None, socket = SOCKET, port = None):
+    server = JobServer(tokens, threads)
+    if port is not None:
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', port)
+        print('serving on 127.0.0.1:{} with the tokens {}'.format(port, ', '.join(map(str, tokens))))
+    else:
+        os.makedirs(os.path.dirname(socket), exist_ok = True)
+        if os.path.exists(socket):
+            os.remove(socket)
+        listener = await asyncio.start_unix_server(server.handle, socket)
+        print('serving on {} with the tokens {}'.format(socket, ', '.join(map(str, tokens))))
+    sys.stdout.flush()
+    async with listener:
+        await listener.serve_forever()
+
+
+# function which submits a job to the server and yields its events as they come, the last one
+# being the result or the error
+async def submit(problem, params = (), kwargs = None, socket = SOCKET, port = None):
+    if port is not None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(socket)
+    request = {'problem': problem, 'params': list(params), 'kwargs': kwargs or {}}
+    writer.write((json.dumps(request) + '\n').encode())
+    await writer.drain()
+    try:
+        async for line in reader:
+            yield json.loads(line)
+    finally:
+        writer.close()
+
+
+# function which returns the gurobi callback of a job process, which writes a progress event to
+# output at most every PROGRESS_INTERVAL seconds
+def progress_callback(output, start):
+    from gurobipy import GRB
+
+    last = [0.0]
+
+    def callback(model, where):
+        if where != GRB.Callback.MIP or time.time() - last[0] < PROGRESS_INTERVAL:
+            return
+        last[0] = time.time()
+        event = {'event': 'progress', 'seconds': round(time.time() - start, 2),
+                 'objective': model.cbGet(GRB.Callback.MIP_OBJBST), 'bound': model.cbGet(GRB.Callback.MIP_OBJBND),
+                 'nodes': model.cbGet(GRB.Callback.MIP_NODCNT)}
+        output.write(json.dumps(event) + '\n')
+        output.flush()
+
+    return callback
+
+
+# function which runs a job in this process and writes its events as json lines to output: the
+# LP class of the problem is run with the arguments, its printed output is kept for the result
+def run_job(request, threads = None, output = None):
+    import extremal.params as params
+
+    output = output or sys.stdout
+    start = time.time()
+    printed = io.StringIO()
+    try:
+        problem = problem_name(request['problem'])
+        params.recorded_models = []
+        if threads:
+            params.overrides = {'Threads': threads}
+        try:
+            params.callback = progress_callback(output, start)
+        except ImportError:
+            # an exact backend (solver = 'mis') runs without gurobi
+            params.callback = None
+        with contextlib.redirect_stdout(printed):
+            load_problem(problem)(**request['kwargs'])
+    except Exception as error:
+        output.write(json.dumps({'event': 'error', 'error': repr(error), 'output': printed.getvalue()}) + '\n')
+        return
+
+    # status 2 is GRB.OPTIMAL. A job without gurobi models used an exact backend
+    models = params.recorded_models
+    last = models[-1] if models else None
+    result = {
+        'problem': problem,
+        'arguments': request['kwargs'],
+        'objective': last.ObjVal if last is not None and last.SolCount > 0 else None,
+        'bound': last.ObjBound if last is not None and last.SolCount > 0 else None,
+        'optimal': all(model.Status == 2 for model in models),
+        'runtime': sum(model.Runtime for model in models),
+        # the threads the solver used, all the cores when Threads is left at 0, and one for an
+        # exact backend
+        'threads': (max(model.Params.Threads for model in models) or os.cpu_count() or 1) if models else 1,
+        'seconds': round(time.time() - start, 2),
+        'output': printed.getvalue(),
+    }
+    output.write(json.dumps({'event': 'result', 'result': result}) + '\n')
+    output.flush()
+
+
+# function which returns the tokens of the --tokens option: a number of local stand-ins, or the
+# names of the tokens separated by commas
+def parse_tokens(tokens):
+    if tokens.isdigit():
+        return ['local-{}'.format(i) for i in range(int(tokens))]
+    return [token for token in tokens.split(',') if token]
+
+
+def main(argv = None):
+    from extremal.problems import parse_params
+
+    parser = argparse.ArgumentParser(prog = 'python -m extremal.server', description = 'Local job server for the problem classes.')
+    parser.add_argument('--tokens', default = '1', help = 'number of local license tokens, or their names separated by commas')
+    parser.add_argument('--threads', type = int, help = 'gurobi threads of every job')
+    parser.add_argument('--socket', default = SOCKET, help = 'unix socket of the server')
+    parser.add_argument('--port', type = int, help = 'local TCP port of the server instead of the unix socket')
+    parser.add_argument('--submit', metavar = 'PROBLEM', help = 'submit an instance of the problem class to the server')
+    parser.add_argument('--params', nargs = '*', default = [], help = 'parameters of the submitted LP class, in order or as name=value')
+    parser.add_argument('--run-job', help = argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_job:
+        run_job(json.loads(args.run_job), args.threads)
+        return
+    if args.submit:
+        try:
+            params, keyword_params = parse_params(args.params)
+        except ValueError as error:
+            parser.error(str(error))
+
+        async def follow():
+            async for event in submit(args.submit, params, keyword_params, args.socket, args.port):
+                if event['event'] == 'result':
+                    print(event['result']['output'], end = '')
+                    print('objective {objective}, optimal {optimal}, {seconds}s'.format(**event['result'])
+                          + (' (stored result)' if event['result'].get('cached') else ''))
+                else:
+                    print(json.dumps(event), flush = True)
+        asyncio.run(follow())
+        return
+    try:
+        asyncio.run(serve(parse_tokens(args.tokens), args.threads, args.socket, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# The following functions split the generation of the rows and conflicts of a model into shards
+# which are generated in a pool of processes and merged, in order, into the lists the model is
+# built from, so that the build is the same as the serial one but uses every core.
+#
+# A shard is a range [start, stop) of positions of the first set of a pair, chain or family (the
+# rank of the first set in the list of subsets of a script), and is generated by a function
+# generate(start, stop, data) defined at the top level of the module of a problem class. It
+# returns its block as a tuple of columns (array('q') of integers), in one of two forms:
+#
+#   - pairs: (first, second), the pairs (first[i], second[i]) of positions in COO form,
+#   - rows: (lengths, positions), the rows one after the other, a row being the next lengths[r]
+#     positions, each with coefficient 1.
+#
+# The processes are forked, so data (e.g. the list of subsets) is shared with them as it is
+# instead of being pickled, and every block is handed back through shared memory. With one
+# worker (EXTREMAL_WORKERS=1), on systems which cannot fork, or for small models the shards are
+# generated in this process.
+
+import multiprocessing
+import os
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+# number of processes generating shards, by default one per core
+WORKERS = int(os.environ.get('EXTREMAL_WORKERS', os.cpu_count() or 1))
+# shards per worker, so that a worker which gets the cheap shards takes more of them
+SHARDS_PER_WORKER = 8
+# fewer first sets than this are generated in this process
+MIN_SHARDED_COUNT = 256
+
+# the function and data of the current generation, read by the forked workers
+current = [None, None]
+
+
+# function which returns the shards of range(count), at most shards of them
+def shard_ranges(count, shards):
+    shards = max(1, min(shards, count))
+    bounds = [count*i//shards for i in range(shards + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(shards) if bounds[i] < bounds[i + 1]]
+
+
+# function which generates one shard in a worker and returns the names and lengths of the shared
+# memory blocks holding its columns
+def generate_shard(bounds):
+    generate, data = current
+    blocks = []
+    for column in generate(bounds[0], bounds[1], data):
+        if len(column) == 0:
+            blocks.append((None, 0))
+            continue
+        block = shared_memory.SharedMemory(create = True, size = len(column)*column.itemsize)
+        block.buf[:len(column)*column.itemsize] = column.tobytes()
+        blocks.append((block.name, len(column)))
+        block.close()
+    return blocks
+
+
+# function which reads (and frees) a column handed back by a worker
+def read_column(name, length):
+    column = array('q')
+    if name is None:
+        return column
+    block = shared_memory.SharedMemory(name = name)
+    column.frombytes(bytes(block.buf[:length*column.itemsize]))
+    block.close()
+    block.unlink()
+    return column
+
+
+# function which generates all the shards of range(count) with generate and returns the merged
+# columns, in the order of the shards
+def generate_sharded(generate, count, data, workers = None):
+    workers = WORKERS if workers is None else workers
+    if workers <= 1 or count < MIN_SHARDED_COUNT or 'fork' not in multiprocessing.get_all_start_methods():
+        return tuple(generate(0, count, data))
+
+    current[0], current[1] = generate, data
+    # the workers share the resource tracker of this process, which frees the blocks they create
+    # once they are read here
+    resource_tracker.ensure_running()
+    merged = None
+    try:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            for blocks in pool.imap(generate_shard, shard_ranges(count, workers*SHARDS_PER_WORKER)):
+                columns = [read_column(name, length) for name, length in blocks]
+                if merged is None:
+                    merged = columns
+                else:
+                    for column, part in zip(merged, columns):
+                        column.extend(part)
+    finally:
+        current[0], current[1] = None, None
+    return tuple(merged)
+
+
+# function which returns the pairs of a pairs block as a list of tuples
+def pairs_of(first, second):
+    return list(zip(first, second))
+
+
+# function which returns the rows of a rows block as a list of lists of positions
+def rows_of(lengths, positions):
+    rows = []
+    start = 0
+    for length in lengths:
+        rows.append(list(positions[start:start + length]))
+        start += length
+    return rows
+
+
+# function which adds the rows of a rows block to the model as constraints sum <= rhs, where
+# subsets lists the keys of the variables by position
+def add_sharded_rows(model, variables, subsets, lengths, positions, rhs):
+    import gurobipy as gp
+    from gurobipy import GRB
+    for row in rows_of(lengths, positions):
+        model.addLConstr(gp.LinExpr([1]*len(row), [variables[subsets[position]] for position in row]), GRB.LESS_EQUAL, rhs)
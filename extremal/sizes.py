@@ -0,0 +1,356 @@
+# The following functions predict the size of the model of a problem class from its parameters,
+# before anything is built, so that a model which does not fit in memory is refused up front
+# instead of failing hours into the build. The counts are closed forms (or small recursions)
+# mirroring the loops of extremal/problems:
+#
+#   - variables and conflicts (the pairs listed while building) are exact,
+#   - the clique rows covering the conflicts are bounded by the number of conflicts (a clique
+#     with c sets covers c(c-1)/2 pairs with c nonzeros), so constraints and nonzeros are upper
+#     bounds for the models which cover conflicts with cliques, and exact for the others.
+#
+# The memory is a rough estimate from the counts (python objects of the build plus the model in
+# gurobi), meant to tell a model which fits from one which is orders of magnitude too large.
+# It is compared with EXTREMAL_MAX_MEMORY (in bytes, by default 80% of the physical memory, 0
+# disables the check) by admit, which every problem class calls before building its model:
+# when the rows of cuts = 'build' do not fit they are separated from a callback instead (see
+# extremal/cuts.py), otherwise a MemoryError is raised. Run
+#
+#     python -m extremal Conjecture_3.10 --params 10 --estimate
+#
+# to print the estimate of a model without building it.
+
+import functools
+import inspect
+import math
+import os
+
+# bytes per variable, constraint, nonzero and listed conflict, and per bit of the adjacency of
+# the conflict graph in extremal/cliques.py
+BYTES_PER_VARIABLE = 300
+BYTES_PER_CONSTRAINT = 200
+BYTES_PER_NONZERO = 40
+BYTES_PER_CONFLICT = 120
+
+
+# function which returns the default memory limit, 80% of the physical memory (None if it is
+# unknown)
+def physical_memory_limit():
+    try:
+        return int(0.8*os.sysconf('SC_PHYS_PAGES')*os.sysconf('SC_PAGE_SIZE'))
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+MAX_MEMORY = int(os.environ['EXTREMAL_MAX_MEMORY']) if 'EXTREMAL_MAX_MEMORY' in os.environ else physical_memory_limit()
+
+
+# function which returns the size of a model as a dictionary
+def sizes(variables, constraints, nonzeros, conflicts = 0):
+    return {'variables': variables, 'constraints': constraints, 'nonzeros': nonzeros, 'conflicts': conflicts}
+
+
+# function which adds the rows of a covering of the conflicts by cliques, at most one row and two
+# nonzeros per conflict
+def with_cliques(size):
+    size['constraints'] += size['conflicts']
+    size['nonzeros'] += 2*size['conflicts']
+    return size
+
+
+# number of unordered pairs of distinct sets of 2^[n] at symmetric difference more than d
+def far_pairs(n, d):
+    return 2**n*sum(math.comb(n, t) for t in range(d + 1, n + 1))//2
+
+
+# number of pairs A < B of 2^[n] with |B - A| more than d (comparable and far apart)
+def far_comparable_pairs(n, d):
+    return sum(math.comb(n, t)*2**(n - t) for t in range(d + 1, n + 1))
+
+
+# number of (unordered) families of s distinct pairwise disjoint non-empty subsets of [n], i.e. of
+# ordered partitions of [n] into s non-empty parts and one possibly empty part, up to order
+def disjoint_families(n, s):
+    return sum((-1)**j*math.comb(s, j)*(s + 1 - j)**n for j in range(s + 1))//math.factorial(s)
+
+
+# number of LYM rows of extremal/cuts.py, at most one per interval [{}, D] and [C, [n]], and their
+# nonzeros (every set is in the intervals of its supersets and subsets)
+def lym_sizes(n):
+    return sizes(0, 2*2**n, 2*3**n)
+
+
+# number of shadow rows of extremal/cuts.py and their nonzeros
+def shadow_sizes(n):
+    constraints = 0
+    nonzeros = 0
+    for k in range(1, n//2 + 1):
+        constraints += 1
+        nonzeros += math.comb(n, k)
+    for k in range(1, n):
+        for l in range(k + 1, n - k + 1):
+            constraints += 1
+            nonzeros += math.comb(n, k) + math.comb(n, l)
+    return sizes(0, constraints, nonzeros)
+
+
+# function which adds the rows of the cuts parameter to a size
+def with_cuts(size, cut_sizes, cuts):
+    if cuts == 'build':
+        size['constraints'] += cut_sizes['constraints']
+        size['nonzeros'] += cut_sizes['nonzeros']
+    return size
+
+
+def example_1(n, cuts = None):
+    size = with_cliques(sizes(2**n, 0, 0, 3**n - 2**n))
+    return with_cuts(size, lym_sizes(n), cuts)
+
+
+def example_2(n, m):
+    triangles = math.comb(n, 3)
+    edges = math.comb(n, 2)
+    return sizes(triangles + edges, triangles + 1, 4*triangles + edges)
+
+
+def conjecture_3_1(n, d, cuts = None):
+    conflicts = 3**n - 2**n + far_pairs(n, d) - far_comparable_pairs(n, d)
+    size = with_cliques(sizes(2**n, 0, 0, conflicts))
+    return with_cuts(size, lym_sizes(n), cuts)
+
+
+# number of rows written by the chain recursion of Conjecture_3.2 from a set whose remaining
+# elements (at or after the current index) are remaining, in a chain of length length whose
+# smallest set has size elements
+@functools.lru_cache(maxsize = None)
+def chain_rows(length, remaining, elements, l):
+    if length == l + 1:
+        return 1
+    if remaining == 0:
+        return 0
+    return (chain_rows(length, remaining - 1, elements, l) + chain_rows(length, remaining - 1, elements - 1, l)
+            + chain_rows(length + 1, elements - 1, elements - 1, l))
+
+
+def conjecture_3_2(n, d, l, cuts = None):
+    chains = sum(math.comb(n, m)*chain_rows(1, m, m, l) for m in range(l, n + 1))
+    size = with_cliques(sizes(2**n, chains, (l + 1)*chains, far_pairs(n, d)))
+    return with_cuts(size, lym_sizes(n), cuts)
+
+
+def conjecture_3_3(n, k):
+    variables = math.comb(n, k)
+    degree_nonzeros = (n - 1)*2*math.comb(n - 2, k - 1) if n >= 2 and k >= 1 else 0
+    size = sizes(variables, n - 1, degree_nonzeros, variables*math.comb(n - k, k)//2)
+    return with_cliques(size)
+
+
+def conjecture_3_4(n, k, cuts = None):
+    degree_nonzeros = (n - 1)*2*2**(n - 2) if n >= 2 else 0
+    size = with_cliques(sizes(2**n, n - 1, degree_nonzeros, (3**n - 1)//2))
+    return with_cuts(size, shadow_sizes(n), cuts)
+
+
+def conjecture_3_5(n, k, cuts = None):
+    return conjecture_3_4(n, k, cuts)
+
+
+# number of ordered pairs of disjoint k-subsets of an m-set (the empty set with itself included)
+def disjoint_ordered_pairs(m, k):
+    return math.comb(m, k)*math.comb(m - k, k)
+
+
+def conjecture_3_6(n1, n2, k, l):
+    variables = math.comb(n1, k)*math.comb(n2, l)
+    conflicts = (disjoint_ordered_pairs(n1, k)*disjoint_ordered_pairs(n2, l) - (1 if k == 0 and l == 0 else 0))//2
+    missed = n1*math.comb(n1 - 1, k)*math.comb(n2, l) + n2*math.comb(n1, k)*math.comb(n2 - 1, l)
+    return with_cliques(sizes(variables, n1 + n2, missed, conflicts))
+
+
+def conjecture_3_7(n1, n2, k, l, S):
+    size = conjecture_3_6(n1, n2, k, l)
+    for subset in S:
+        a = sum(subset[:n1])
+        b = sum(subset[n1:])
+        size['constraints'] += 1
+        size['nonzeros'] += math.comb(n1 - a, k - a)*math.comb(n2 - b, l - b) if a <= k and b <= l else 0
+    return size
+
+
+def conjecture_3_8(n, k, partitions, partitions_size):
+    # the sets take at least partitions_size[i] elements of the part i and any number of the
+    # elements in none of the parts, counted part by part
+    part_sizes = [sum(partition) for partition in partitions] + [n - sum(sum(partition) for partition in partitions)]
+    minimum_sizes = list(partitions_size) + [0]
+    ways = [1] + [0 for cost in range(k)]
+    for part_size, minimum in zip(part_sizes, minimum_sizes):
+        ways = [sum(ways[cost - count]*math.comb(part_size, count) for count in range(minimum, cost + 1))
+                for cost in range(k + 1)]
+    variables = ways[k]
+    # every set is disjoint from at most (n - k choose k) of the others
+    return with_cliques(sizes(variables, 0, 0, variables*math.comb(n - k, k)//2))
+
+
+def theorem_3_9(n, k, s):
+    variables = math.comb(n, k)
+    regularity_nonzeros = (math.comb(n, s) - 1)*2*math.comb(n - s, k - s) if k >= s else 0
+    size = sizes(variables, math.comb(n, s) - 1, regularity_nonzeros, variables*math.comb(n - k, k)//2)
+    return with_cliques(size)
+
+
+def conjecture_3_10(n, s = 4):
+    families = disjoint_families(n, s) + disjoint_families(n, s - 1)
+    return sizes(2**n, families, s*families)
+
+
+# number of families of k vertex disjoint triangles of the complete multipartite graph with parts
+# of the given sizes (a sorted tuple), counted as sequences and divided by k!
+@functools.lru_cache(maxsize = None)
+def triangle_sequences(part_sizes, k):
+    if k == 0:
+        return 1
+    total = 0
+    for i in range(len(part_sizes)):
+        for j in range(i + 1, len(part_sizes)):
+            for h in range(j + 1, len(part_sizes)):
+                if part_sizes[i] and part_sizes[j] and part_sizes[h]:
+                    remaining = list(part_sizes)
+                    for part in (i, j, h):
+                        remaining[part] -= 1
+                    total += part_sizes[i]*part_sizes[j]*part_sizes[h]*triangle_sequences(tuple(sorted(remaining)), k - 1)
+    return total
+
+
+def theorem_3_11(n, k, K_sizes):
+    vertices = sum(K_sizes)
+    edges = (vertices**2 - sum(size**2 for size in K_sizes))//2
+    families = triangle_sequences(tuple(sorted(K_sizes)), k)//math.factorial(k)
+    return sizes(edges, families, 3*k*families)
+
+
+# number of chains of l + 1 distinct nested sets of 2^[n]: the element x enters the chain at the
+# set i (or never), and every set but the first has an element entering it
+def nested_chains(n, l):
+    return sum((-1)**j*math.comb(l, j)*(l + 2 - j)**n for j in range(l + 1))
+
+
+# number of ordered tuples of s pairwise disjoint k-subsets of an m-set
+def disjoint_tuples(m, k, s):
+    if s*k > m:
+        return 0
+    return math.factorial(m)//(math.factorial(k)**s*math.factorial(m - s*k))
+
+
+# the model of a specification (extremal/specs.py). The conflicts of the conditions are counted
+# one by one over 2^[n] and added up, an upper bound when they overlap, and bounded by the number
+# of pairs of sets over the other ground families; the other counts are exact except for the
+# incidence rows, which are bounded by the sets of the ground family containing an s-set
+def spec(spec):
+    from extremal.specs import parse_spec
+    parsed = parse_spec(spec)
+    ground = parsed['ground']
+    n = parsed['n']
+    if ground[0] == 'power':
+        variables = 2**n
+    elif ground[0] == 'uniform':
+        variables = math.comb(n, ground[2])
+    else:
+        variables = math.comb(ground[1], ground[3])*math.comb(ground[2], ground[4])
+    size = sizes(variables, 0, 0)
+
+    pairwise = [condition for condition in parsed['conditions'] if condition[0] in ('antichain', 'intersecting', 'diameter')]
+    if pairwise:
+        conflicts = variables*(variables - 1)//2
+        if ground[0] == 'power':
+            counts = {'antichain': 3**n - 2**n, 'intersecting': (3**n - 1)//2}
+            conflicts = min(conflicts, sum(counts[condition[0]] if condition[0] in counts else far_pairs(n, condition[1])
+                                           for condition in pairwise))
+        size['conflicts'] = conflicts
+        with_cliques(size)
+
+    for condition in parsed['conditions']:
+        name = condition[0]
+        if condition in pairwise:
+            continue
+        if name == 'chain_free':
+            rows, width = (nested_chains(n, condition[1]) if ground[0] == 'power' else 0), condition[1] + 1
+        elif name == 'no_disjoint':
+            s = condition[1]
+            if ground[0] == 'power':
+                rows = disjoint_families(n, s) + disjoint_families(n, s - 1)
+            elif ground[0] == 'uniform':
+                rows = disjoint_tuples(n, ground[2], s)//math.factorial(s)
+            else:
+                rows = disjoint_tuples(ground[1], ground[3], s)*disjoint_tuples(ground[2], ground[4], s)//math.factorial(s)
+            width = s
+        elif name == 'no_disjoint_triangles':
+            rows, width = triangle_sequences(tuple(1 for vertex in range(n)), condition[1])//math.factorial(condition[1]), 3*condition[1]
+        elif name == 'covering':
+            rows, width = n, variables
+        elif name == 'regular':
+            rows, width = math.comb(n, condition[1]) - 1, 2*variables
+        size['constraints'] += rows
+        size['nonzeros'] += rows*width
+    if parsed['objective'] == 'diversity':
+        size['constraints'] += n - 1
+        size['nonzeros'] += 2*(n - 1)*variables
+    return size
+
+
+ESTIMATORS = {
+    'Example_1': example_1,
+    'Example_2': example_2,
+    'Conjecture_3.1': conjecture_3_1,
+    'Conjecture_3.2': conjecture_3_2,
+    'Conjecture_3.3': conjecture_3_3,
+    'Conjecture_3.4': conjecture_3_4,
+    'Conjecture_3.5': conjecture_3_5,
+    'Conjecture_3.6': conjecture_3_6,
+    'Conjecture_3.7': conjecture_3_7,
+    'Conjecture_3.8': conjecture_3_8,
+    'Theorem_3.9': theorem_3_9,
+    'Conjecture_3.10': conjecture_3_10,
+    'Theorem_3.11': theorem_3_11,
+    'Spec': spec,
+}
+
+
+# function which returns the size of the model of a problem class, given the parameters under
+# which it is cached (see extremal/cache.py)
+def estimate(problem, arguments):
+    return ESTIMATORS[problem](*arguments)
+
+
+# function which returns the estimated memory (in bytes) of building a model of the given size
+def memory(size):
+    return (size['variables']*BYTES_PER_VARIABLE + size['constraints']*BYTES_PER_CONSTRAINT
+            + size['nonzeros']*BYTES_PER_NONZERO + size['conflicts']*BYTES_PER_CONFLICT
+            # the adjacency bitmasks of the conflict graph
+            + (size['variables']**2//8 if size['conflicts'] else 0))
+
+
+# function which returns the size and the estimated memory of a model as a line of text
+def describe(size):
+    return '{variables} variables, at most {constraints} constraints and {nonzeros} nonzeros, {conflicts} conflicts, about {gib:.2f} GiB'.format(
+        gib = memory(size)/2**30, **size)
+
+
+# function which checks that the model of a problem class fits in memory before it is built, and
+# returns the parameters to build it with: the same, or with cuts = 'callback' instead of 'build'
+# when only the rows of the cuts do not fit. Raises MemoryError if the model does not fit
+def admit(problem, arguments, limit = None):
+    limit = MAX_MEMORY if limit is None else limit
+    if not limit:
+        return arguments
+    size = estimate(problem, arguments)
+    if memory(size) <= limit:
+        return arguments
+    names = list(inspect.signature(ESTIMATORS[problem]).parameters)
+    if 'cuts' in names and arguments[names.index('cuts')] == 'build':
+        lazy = list(arguments)
+        lazy[names.index('cuts')] = 'callback'
+        lazy = tuple(lazy)
+        if memory(estimate(problem, lazy)) <= limit:
+            print('{}{}: the cut rows do not fit in memory, they are separated from a callback instead'.format(problem, arguments))
+            return lazy
+    raise MemoryError('{}{} needs {} but the limit is {:.2f} GiB (EXTREMAL_MAX_MEMORY)'.format(
+        problem, arguments, describe(size), limit/2**30))
@@ -0,0 +1,250 @@
+# The following compiles a declarative specification of a family problem into the blocks of its
+# model, so that a new conjecture can be tested without writing another script. A specification
+# reads
+#
+#     <conditions> over <ground family>, maximize <objective>
+#
+# e.g. "intersecting & diameter <= 3 over 2^[7], maximize diversity", and is run as the problem
+# class Spec (extremal/problems/spec.py):
+#
+#     python -m extremal Spec --params "antichain & diameter <= 4 over 2^[8], maximize size"
+#
+# The ingredients are those the scripts are made of:
+#
+#   - ground families: 2^[n], ([n] choose k) and ([n1] choose k) x ([n2] choose l) (the sets of
+#     the product take k elements of the first n1 and l of the last n2, as in Conjecture 3.6),
+#   - pairwise conditions: antichain, intersecting, diameter <= d,
+#   - higher order conditions: chain_free l (no chain of l + 1 sets), no_disjoint s (no s
+#     pairwise disjoint sets) and, over ([n] choose 2), no_disjoint_triangles k (the edges of a
+#     graph without k vertex disjoint triangles),
+#   - incidence conditions: covering (every element is missed by a set of the family) and
+#     regular s (every s-set is in the same number of sets),
+#   - objectives: size and diversity (the size less the largest degree, which is put at the
+#     element 1 as in Conjectures 3.3 to 3.5, so only over 2^[n] and ([n] choose k)),
+#
+# joined by & (or "and"). The conditions are named as in extremal/certificates.py, which checks
+# the families of a specification. Every ingredient is compiled to the fastest generator of the
+# repository: the pairwise conditions to one pass over the pairs of bitmasks in shards (see
+# extremal/shards.py) covered by cliques (extremal/cliques.py), the higher order conditions to
+# submask enumerations in shards, and the incidence conditions and the diversity to the sparse
+# incidence matrix (extremal/incidence.py).
+
+import re
+from array import array
+
+from extremal.subsets import all_subsets, k_subsets, product_subsets
+
+# the conditions of each kind, and whether they take a parameter
+PAIRWISE = {'antichain': False, 'intersecting': False, 'diameter': True}
+HIGHER_ORDER = {'chain_free': True, 'no_disjoint': True, 'no_disjoint_triangles': True}
+INCIDENCE = {'covering': False, 'regular': True}
+OBJECTIVES = ('size', 'diversity')
+
+
+# function which returns the parsed ground family of a specification as a tuple: ('power', n),
+# ('uniform', n, k) or ('product', n1, n2, k, l)
+def parse_ground(text):
+    text = text.strip()
+    power = re.match(r'^2\s*\^\s*\[\s*(\d+)\s*\]$', text)
+    if power:
+        return ('power', int(power.group(1)))
+    uniform = r'\(\s*\[\s*(\d+)\s*\]\s*choose\s*(\d+)\s*\)'
+    match = re.match(r'^' + uniform + r'$', text)
+    if match:
+        n, k = int(match.group(1)), int(match.group(2))
+        if k > n:
+            raise ValueError('([{}] choose {}) is empty'.format(n, k))
+        return ('uniform', n, k)
+    match = re.match(r'^' + uniform + r'\s*[x×]\s*' + uniform + r'$', text)
+    if match:
+        n1, k, n2, l = (int(group) for group in match.groups())
+        if k > n1 or l > n2:
+            raise ValueError('the product family {} is empty'.format(text))
+        return ('product', n1, n2, k, l)
+    raise ValueError('unknown ground family {!r}, use 2^[n], ([n] choose k) or ([n1] choose k) x ([n2] choose l)'.format(text))
+
+
+# function which returns a parsed condition as a tuple (name,) or (name, parameter)
+def parse_condition(text):
+    text = text.strip()
+    match = re.match(r'^([a-z_]+)\s*(?:<=)?\s*(\d+)?$', text)
+    if not match:
+        raise ValueError('cannot read the condition {!r}'.format(text))
+    name, parameter = match.group(1), match.group(2)
+    takes = {**PAIRWISE, **HIGHER_ORDER, **INCIDENCE}
+    if name not in takes:
+        raise ValueError('unknown condition {!r}, choose from {}'.format(name, ', '.join(takes)))
+    if takes[name] != (parameter is not None):
+        raise ValueError('the condition {} {} a parameter'.format(name, 'takes' if takes[name] else 'takes no'))
+    return (name, int(parameter)) if parameter is not None else (name,)
+
+
+# function which parses a specification into a dictionary with its ground family, conditions
+# (in the order given, without repetitions) and objective. Raises ValueError if it cannot be read
+def parse_spec(text):
+    text = text.replace('∧', '&').replace('≤', '<=')
+    match = re.match(r'^\s*(?:(.*?)\s+)?over\s+(.*?)\s*,\s*maximize\s+(\w+)\s*$', text)
+    if not match:
+        raise ValueError('a specification reads "<conditions> over <ground family>, maximize <objective>", not {!r}'.format(text))
+    conditions = []
+    if match.group(1):
+        for part in re.split(r'\s*&\s*|\s+and\s+', match.group(1).strip()):
+            condition = parse_condition(part)
+            if condition not in conditions:
+                conditions.append(condition)
+    ground = parse_ground(match.group(2))
+    objective = match.group(3)
+    if objective not in OBJECTIVES:
+        raise ValueError('unknown objective {!r}, choose from {}'.format(objective, ', '.join(OBJECTIVES)))
+    if any(condition[0] == 'no_disjoint_triangles' for condition in conditions) and ground[:1] + ground[2:] != ('uniform', 2):
+        raise ValueError('no_disjoint_triangles is a condition on the edges of a graph, over ([n] choose 2)')
+    # the diversity puts the largest degree at the element 1, which is only valid if the ground
+    # family is invariant under the permutations of [n]
+    if objective == 'diversity' and ground[0] == 'product':
+        raise ValueError('the diversity is only defined over 2^[n] and ([n] choose k), the elements of a product family are not interchangeable')
+    return {'ground': ground, 'n': ground[1] + ground[2] if ground[0] == 'product' else ground[1],
+            'conditions': conditions, 'objective': objective}
+
+
+# function which writes a parsed specification back in its normal form, e.g. the key of its model
+# in the cache of extremal/cache.py
+def format_spec(spec):
+    ground = spec['ground']
+    if ground[0] == 'power':
+        ground_text = '2^[{}]'.format(ground[1])
+    elif ground[0] == 'uniform':
+        ground_text = '([{}] choose {})'.format(ground[1], ground[2])
+    else:
+        ground_text = '([{}] choose {}) x ([{}] choose {})'.format(ground[1], ground[3], ground[2], ground[4])
+    conditions = ' & '.join('diameter <= {}'.format(condition[1]) if condition[0] == 'diameter' else ' '.join(str(part) for part in condition)
+                            for condition in spec['conditions'])
+    return '{}over {}, maximize {}'.format(conditions + ' ' if conditions else '', ground_text, spec['objective'])
+
+
+# function which returns the sets of the ground family as strings of 0s and 1s, in the order of
+# extremal/subsets.py
+def ground_subsets(spec):
+    ground = spec['ground']
+    if ground[0] == 'power':
+        return list(all_subsets(ground[1]))
+    if ground[0] == 'uniform':
+        return list(k_subsets(ground[1], ground[2]))
+    return list(product_subsets(*ground[1:]))
+
+
+# function which returns the conditions of a specification of one kind
+def conditions_of(spec, kind):
+    return [condition for condition in spec['conditions'] if condition[0] in kind]
+
+
+# GENERATORS
+# The shards of extremal/shards.py, defined at the top level so that the forked workers run them.
+# masks lists the sets of the ground family as bitmasks (bit i for the element i + 1) and position
+# maps a bitmask to its position in the list
+
+# function which lists, for i in [start, stop), the pairs (i, j), i < j, of positions of sets which
+# violate a pairwise condition together: comparable sets of an antichain, disjoint sets of an
+# intersecting family or sets too far apart
+def conflicting_pairs(start, stop, data):
+    masks, conditions = data
+    antichain = ('antichain',) in conditions
+    intersecting = ('intersecting',) in conditions
+    diameters = [condition[1] for condition in conditions if condition[0] == 'diameter']
+    diameter = min(diameters) if diameters else None
+    first = array('q')
+    second = array('q')
+    for i in range(start, stop):
+        mask = masks[i]
+        for j in range(i + 1, len(masks)):
+            other = masks[j]
+            union = mask | other
+            if ((antichain and (union == mask or union == other)) or (intersecting and not mask & other)
+                    or (diameter is not None and bin(mask ^ other).count('1') > diameter)):
+                first.append(i)
+                second.append(j)
+    return first, second
+
+
+# function which lists, for i in [start, stop), the chains of l + 1 sets of the ground family
+# whose largest set is the set i as rows of positions, by walking down the submasks
+def chain_rows(start, stop, data):
+    masks, position, l = data
+    lengths = array('q')
+    positions = array('q')
+
+    def extend(chain, mask):
+        if len(chain) == l + 1:
+            lengths.append(len(chain))
+            positions.extend(chain)
+            return
+        # the proper submasks of mask, from the largest
+        sub = (mask - 1) & mask
+        while mask:
+            if sub in position:
+                extend(chain + [position[sub]], sub)
+            if sub == 0:
+                break
+            sub = (sub - 1) & mask
+
+    for i in range(start, stop):
+        extend([i], masks[i])
+    return lengths, positions
+
+
+# function which lists, for i in [start, stop), the families of s pairwise disjoint sets of the
+# ground family whose smallest set (as a bitmask) is the set i as rows of positions. The other
+# members are larger submasks of the elements no member has so far
+def disjoint_rows(start, stop, data):
+    masks, position, n, s = data
+    full = (1 << n) - 1
+    lengths = array('q')
+    positions = array('q')
+
+    def extend(family, free, last):
+        if len(family) == s:
+            lengths.append(s)
+            positions.extend(family)
+            return
+        sub = free
+        while sub > last:
+            if sub in position:
+                extend(family + [position[sub]], free & ~sub, sub)
+            sub = (sub - 1) & free
+
+    for i in range(start, stop):
+        extend([i], full & ~masks[i], masks[i])
+    return lengths, positions
+
+
+# function which lists, for i in [start, stop), the families of k vertex disjoint triangles of
+# K_n whose smallest triangle (as a bitmask of its vertices) is triangles[i] as rows of the
+# positions of their 3k edges in the ground family ([n] choose 2)
+def disjoint_triangle_rows(start, stop, data):
+    triangles, position, k = data
+    lengths = array('q')
+    positions = array('q')
+
+    def edges(triangle):
+        vertices = [triangle & -triangle]
+        vertices.append((triangle ^ vertices[0]) & -(triangle ^ vertices[0]))
+        vertices.append(triangle ^ vertices[0] ^ vertices[1])
+        return [position[vertices[0] | vertices[1]], position[vertices[0] | vertices[2]], position[vertices[1] | vertices[2]]]
+
+    def extend(family, used, index):
+        if len(family) == k:
+            lengths.append(3*k)
+            for triangle in family:
+                positions.extend(edges(triangle))
+            return
+        for next_index in range(index + 1, len(triangles)):
+            if not triangles[next_index] & used:
+                extend(family + [triangles[next_index]], used | triangles[next_index], next_index)
+
+    for i in range(start, stop):
+        extend([triangles[i]], triangles[i], i)
+    return lengths, positions
+
+
+# function which returns the position of every set of the ground family by bitmask
+def positions_of(masks):
+    return {mask: index for index, mask in enumerate(masks)}
@@ -0,0 +1,170 @@
+# The following functions enumerate the families of subsets the scripts build their models on,
+# as iterators which can start at any position, and map a set to its position (rank) and back
+# (unrank) without the list of the family or a dictionary:
+#
+#   - 2^[n] in the order of generate_all_possible_subsets: the string of 0s and 1s of a set read
+#     as a binary number (its code, element 1 being the most significant digit) is its position,
+#   - ([n] choose k) in the order of generate_all_possible_subsets_of_n_of_size_k, which puts the
+#     sets with element 1 first (the codes in decreasing order): the complements of the sets come
+#     in increasing order of their codes, i.e. in colex order, so the position of a set is the rank
+#     of its complement in the combinatorial number system, and the next set is found by Gosper's
+#     hack (the next larger integer with the same number of 1 bits),
+#   - the product families (X_1 choose k) x (X_2 choose l) of Conjectures 3.6 and 3.7, where the set
+#     X1_subsets[i1] + X2_subsets[i2] is at position i1*(n2 choose l) + i2.
+#
+# Ranks and unranks take O(n) arithmetic operations and every step of an iterator O(n) (to build
+# the string of 0s and 1s), so a worker of extremal/shards.py can start at any position.
+
+import math
+
+
+# function which returns the code of a string of 0s and 1s, element 1 being the most significant
+# digit
+def code_of(subset):
+    code = 0
+    for bit in subset:
+        code = (code << 1) | bit
+    return code
+
+
+# function which returns the string of 0s and 1s with n entries of a code
+def subset_of(code, n):
+    return tuple((code >> (n - 1 - index)) & 1 for index in range(n))
+
+
+# function which turns a string of 0s and 1s into a bitmask, where bit index corresponds with the
+# element index + 1. Bitmasks are returned unchanged
+def to_bitmask(subset):
+    if isinstance(subset, int):
+        return subset
+    mask = 0
+    for index in range(len(subset)):
+        if subset[index] == 1:
+            mask |= 1 << index
+    return mask
+
+
+# function to determine the number of set bits of a bitmask
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+# function which returns the code of a bitmask where bit index corresponds with the element
+# index + 1 (as made by to_bitmask)
+def code_of_bitmask(mask, n):
+    return int(format(mask, '0{}b'.format(n))[::-1], 2) if n else 0
+
+
+# the next larger integer with the same number of 1 bits as x > 0 (Gosper's hack)
+def gosper(x):
+    lowest = x & -x
+    ripple = x + lowest
+    return (((ripple ^ x) >> 2)//lowest) | ripple
+
+
+# rank of a set of integers (the positions of the 1 bits of a code) in the combinatorial number
+# system, i.e. its position among the sets of the same size in colex order
+def colex_rank(code):
+    rank = 0
+    i = 0
+    position = 0
+    while code:
+        if code & 1:
+            i += 1
+            rank += math.comb(position, i)
+        code >>= 1
+        position += 1
+    return rank
+
+
+# the code of the set of size m of integers below n of position rank in colex order, its elements
+# chosen greedily from the largest
+def colex_unrank(rank, m, n):
+    code = 0
+    position = n - 1
+    for i in range(m, 0, -1):
+        # the largest position whose (position choose i) is at most the remaining rank
+        while math.comb(position, i) > rank:
+            position -= 1
+        rank -= math.comb(position, i)
+        code |= 1 << position
+        position -= 1
+    return code
+
+
+# POWER SET
+
+# position of a set in 2^[n]
+def subset_rank(subset):
+    return code_of(subset)
+
+
+# the set of 2^[n] at a position
+def subset_unrank(rank, n):
+    return subset_of(rank, n)
+
+
+# iterator over the sets of 2^[n] from position start up to (not including) stop
+def all_subsets(n, start = 0, stop = None):
+    stop = 2**n if stop is None else stop
+    for code in range(start, stop):
+        yield subset_of(code, n)
+
+
+# SETS OF SIZE K
+
+# position of a set of size k in ([n] choose k)
+def k_subset_rank(subset):
+    n = len(subset)
+    return colex_rank(((1 << n) - 1) ^ code_of(subset))
+
+
+# the set of ([n] choose k) at a position
+def k_subset_unrank(rank, n, k):
+    return subset_of(((1 << n) - 1) ^ colex_unrank(rank, n - k, n), n)
+
+
+# iterator over the sets of ([n] choose k) from position start up to (not including) stop
+def k_subsets(n, k, start = 0, stop = None):
+    if not 0 <= k <= n:
+        return
+    stop = math.comb(n, k) if stop is None else min(stop, math.comb(n, k))
+    full = (1 << n) - 1
+    complement = colex_unrank(start, n - k, n)
+    for rank in range(start, stop):
+        yield subset_of(full ^ complement, n)
+        if complement:
+            complement = gosper(complement)
+
+
+# PRODUCT FAMILIES
+
+# position of a set of (X_1 choose k) x (X_2 choose l), X_1 being the first n1 elements
+def product_rank(subset, n1):
+    subset = tuple(subset)
+    n2 = len(subset) - n1
+    return k_subset_rank(subset[:n1])*math.comb(n2, sum(subset[n1:])) + k_subset_rank(subset[n1:])
+
+
+# the set of (X_1 choose k) x (X_2 choose l) at a position
+def product_unrank(rank, n1, n2, k, l):
+    i1, i2 = divmod(rank, math.comb(n2, l))
+    return k_subset_unrank(i1, n1, k) + k_subset_unrank(i2, n2, l)
+
+
+# iterator over the sets of (X_1 choose k) x (X_2 choose l) from position start up to (not
+# including) stop
+def product_subsets(n1, n2, k, l, start = 0, stop = None):
+    size2 = math.comb(n2, l)
+    stop = math.comb(n1, k)*size2 if stop is None else stop
+    if start >= stop:
+        return
+    i1, i2 = divmod(start, size2)
+    rank = start
+    for setone in k_subsets(n1, k, i1):
+        for settwo in k_subsets(n2, l, i2):
+            if rank == stop:
+                return
+            yield setone + settwo
+            rank += 1
+        i2 = 0
@@ -0,0 +1,133 @@
+# The following harness tunes the gurobi parameters of each problem class (script) and stores
+# the best setting in the file read by extremal/params.py, so that every later model of the class
+# uses it automatically. Run it from the top of the repository, e.g.
+#
+#     python -m extremal.tuning Example_1 Conjecture_3.2 --time-limit 600
+#
+# Every class has a benchmark ladder: a few instances, from small to large, listed in LADDERS. The
+# ladders are chosen for tuning and are not the calls of the scripts: an instance solved in a
+# fraction of a second says nothing about a setting (e.g. LP(3) of Example_1), and one which
+# runs for hours cannot be solved for every candidate value (e.g. LP(11,5,3) of Theorem_3.9), so
+# a ladder takes the instances in between, some of them from the script. A setting is scored by
+# the total runtime of the ladder, where an instance which is not solved to optimality counts
+# twice the time limit. The search is a coordinate descent: starting from the current tuned
+# setting (or the defaults), every value of every parameter in CANDIDATE_VALUES is tried in turn,
+# and a value is kept when it lowers the score.
+
+import argparse
+import contextlib
+import io
+import json
+
+import extremal.params as params
+from extremal.problems import load_problem
+
+# the gurobi parameters which are tuned and the values tried for each (the first value is the default)
+CANDIDATE_VALUES = {
+    'MIPFocus': [0, 1, 2, 3],
+    'Cuts': [-1, 0, 1, 2, 3],
+    'Symmetry': [-1, 0, 1, 2],
+    'Presolve': [-1, 0, 1, 2],
+    'Heuristics': [0.05, 0.0, 0.2, 0.5],
+}
+
+# the benchmark ladder of every problem class, the arguments of the LP class of its script. These
+# are kept by hand, see above
+LADDERS = {
+    'Example_1': [(4,), (5,), (6,)],
+    'Example_2': [(6, 7), (7, 8), (8, 14), (9, 18)],
+    'Conjecture_3.1': [(8, 5), (8, 7), (10, 3)],
+    'Conjecture_3.2': [(6, 5, 2), (7, 5, 2), (8, 5, 2)],
+    'Conjecture_3.3': [(7, 3), (8, 3)],
+    'Conjecture_3.4': [(5, 2), (7, 3)],
+    'Conjecture_3.5': [(6, 3), (8, 4)],
+    'Conjecture_3.6': [(4, 4, 2, 2), (5, 5, 2, 2)],
+    'Conjecture_3.7': [(5, 5, 2, 2, [[1,1,0,0,0,0,0,0,0,0], [0,0,1,1,0,0,0,0,0,0], [0,0,0,0,0,0,1,1,0,0], [0,0,0,0,0,0,0,0,1,1]])],
+    'Conjecture_3.8': [(7, 4, [[1,1,1,0,0,0,0], [0,0,0,1,1,1,1]], [1,2]), (8, 4, [[1,1,1,1,0,0,0,0], [0,0,0,0,1,1,1,1]], [2,1])],
+    'Theorem_3.9': [(7, 3, 1), (9, 4, 1)],
+    'Conjecture_3.10': [(6,), (7,)],
+    'Theorem_3.11': [(3, 2, [3,3,3]), (3, 2, [3,3,3,3])],
+}
+
+
+# function which solves every instance of the ladder with the given setting and returns the score
+# (total runtime in seconds, twice the time limit for an instance which is not solved)
+def score_setting(problem, setting, time_limit):
+    LP = load_problem(problem)
+    params.overrides = dict(setting, TimeLimit = time_limit)
+    score = 0.0
+    try:
+        for arguments in LADDERS[problem]:
+            params.recorded_models = []
+            # the scripts print their families, which is not of interest here
+            with contextlib.redirect_stdout(io.StringIO()):
+                LP(*arguments)
+            for model in params.recorded_models:
+                # status 2 is GRB.OPTIMAL
+                if model.Status == 2:
+                    score += model.Runtime
+                else:
+                    score += 2*time_limit
+    finally:
+        params.overrides = {}
+        params.recorded_models = None
+    return score
+
+
+# function which tunes one problem class by coordinate descent and returns (setting, score)
+def tune(problem, time_limit, rounds = 2):
+    best_setting = params.load_params(problem)
+    best_score = score_setting(problem, best_setting, time_limit)
+    print('{}: start {} with score {:.2f}s'.format(problem, best_setting, best_score))
+    for i in range(rounds):
+        improved = False
+        for name, values in CANDIDATE_VALUES.items():
+            for value in values:
+                setting = dict(best_setting)
+                # the first candidate value is the default, which is the same as not setting it
+                if value == values[0]:
+                    setting.pop(name, None)
+                else:
+                    setting[name] = value
+                if setting == best_setting:
+                    continue
+                score = score_setting(problem, setting, time_limit)
+                print('{}: {} scored {:.2f}s'.format(problem, setting, score))
+                if score < best_score:
+                    best_setting = setting
+                    best_score = score
+                    improved = True
+        if not improved:
+            break
+    return best_setting, best_score
+
+
+# function which stores the tuned setting of a problem class in the parameter file, keeping
+# the settings of the other classes
+def save_params(problem, setting, params_file = None):
+    params_file = params_file or params.PARAMS_FILE
+    all_params = params.load_all_params(params_file)
+    all_params[problem] = setting
+    with open(params_file, 'w') as f:
+        json.dump(all_params, f, indent = 4, sort_keys = True)
+        f.write('\n')
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = 'Tune the gurobi parameters of each problem class on its benchmark ladder.')
+    parser.add_argument('problems', nargs = '*', default = sorted(LADDERS), help = 'problem classes to tune (default: all)')
+    parser.add_argument('--time-limit', type = float, default = 600, help = 'time limit of every solve in seconds')
+    parser.add_argument('--rounds', type = int, default = 2, help = 'maximum number of coordinate descent rounds')
+    args = parser.parse_args(argv)
+
+    for problem in args.problems:
+        if problem not in LADDERS:
+            parser.error('unknown problem class {!r}, choose from {}'.format(problem, ', '.join(sorted(LADDERS))))
+    for problem in args.problems:
+        setting, score = tune(problem, args.time_limit, args.rounds)
+        save_params(problem, setting)
+        print('{}: best {} with score {:.2f}s, saved to {}'.format(problem, setting, score, params.PARAMS_FILE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Checks of the family checker of extremal/certificates.py against the definitions of the
+# conditions, tested pair by pair (or chain by chain) on random families, and of its witnesses
+
+import itertools
+import random
+
+import pytest
+
+from extremal.certificates import check_family, to_bitmask, triangles_of
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+# the longest chain of members, by the sizes of the sets
+def longest_chain(family):
+    family = sorted(family, key = popcount)
+    length = {}
+    for mask in family:
+        length[mask] = 1 + max((length[other] for other in length if other != mask and other & ~mask == 0), default = 0)
+    return max(length.values(), default = 0)
+
+
+# whether the family has s pairwise disjoint members
+def has_disjoint_members(family, s, used = 0, start = 0):
+    if s == 0:
+        return True
+    for index in range(start, len(family)):
+        if not family[index] & used:
+            if has_disjoint_members(family, s - 1, used | family[index], index + 1):
+                return True
+    return False
+
+
+# whether the family violates the condition, straight from its definition
+def violates(family, n, condition):
+    name = condition[0]
+    if name == 'antichain':
+        return any(a != b and a & ~b == 0 for a in family for b in family)
+    if name == 'intersecting':
+        return any(a & b == 0 for a in family for b in family)
+    if name == 'diameter':
+        return any(popcount(a ^ b) > condition[1] for a in family for b in family)
+    if name == 'chain_free':
+        return longest_chain(family) > condition[1]
+    if name == 'no_disjoint':
+        return has_disjoint_members(sorted(family), condition[1])
+    if name == 'no_disjoint_triangles':
+        return has_disjoint_members(triangles_of(family), condition[1])
+    raise ValueError(name)
+
+
+def random_family(n, size, generator):
+    return generator.sample(range(1 << n), min(size, 1 << n))
+
+
+CONDITIONS = [('antichain',), ('intersecting',), ('diameter', 1), ('diameter', 3), ('chain_free', 1), ('chain_free', 2),
+              ('no_disjoint', 2), ('no_disjoint', 3), ('no_disjoint', 4)]
+
+
+@pytest.mark.parametrize('n', [1, 3, 4, 5])
+@pytest.mark.parametrize('condition', CONDITIONS)
+def test_conditions(n, condition):
+    generator = random.Random(n)
+    for trial in range(60):
+        family = random_family(n, generator.randint(0, 10), generator)
+        result = check_family(family, n, [condition])
+        assert (result is not None) == violates(family, n, condition)
+        if result is not None:
+            # the witness is made of members of the family which violate the condition by
+            # themselves
+            witness = [to_bitmask(subset) for subset in result[1]]
+            assert result[0] == condition
+            assert set(witness) <= set(family)
+            assert violates(witness, n, condition)
+
+
+# a large ground set and family, where the disjoint unions are built by splitting off the top element
+@pytest.mark.parametrize('s', [3, 4, 5])
+def test_disjoint_large(s):
+    generator = random.Random(s)
+    n = 16
+    family = [mask for mask in random_family(n, 3000, generator) if 4 <= popcount(mask) <= 5][:300]
+    result = check_family(family, n, [('no_disjoint', s)])
+    assert (result is not None) == violates(family, n, ('no_disjoint', s))
+    if result is not None:
+        witness = [to_bitmask(subset) for subset in result[1]]
+        assert len(witness) == s and set(witness) <= set(family) and violates(witness, n, ('no_disjoint', s))
+
+
+@pytest.mark.parametrize('n, k', [(6, 2), (7, 2), (9, 3)])
+def test_disjoint_triangles(n, k):
+    generator = random.Random(n)
+    edges = [(1 << u) | (1 << v) for u, v in itertools.combinations(range(n), 2)]
+    for trial in range(40):
+        graph = generator.sample(edges, generator.randint(0, len(edges)))
+        result = check_family(graph, n, [('no_disjoint_triangles', k)])
+        assert (result is not None) == violates(graph, n, ('no_disjoint_triangles', k))
+        if result is not None:
+            triangles = [to_bitmask(subset) for subset in result[1]]
+            assert set(triangles) <= set(triangles_of(graph)) and violates(triangles, n, ('no_disjoint', k))
+
+
+def test_strings_and_bitmasks():
+    # the sets can be given as strings of 0s and 1s, {1} and {1, 2} form a chain
+    assert check_family([(1, 0, 0), (1, 1, 0)], 3, [('antichain',)]) == (('antichain',), [(1, 0, 0), (1, 1, 0)])
+    assert check_family([(1, 0, 0), (0, 1, 0)], 3, [('antichain',)]) is None
+    with pytest.raises(ValueError):
+        check_family([], 3, [('unknown',)])
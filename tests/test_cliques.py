@@ -0,0 +1,69 @@
+# Checks of the clique aggregation of extremal/cliques.py: every conflicting pair is in some clique
+# and every clique is a clique of the conflict graph, so the clique rows allow exactly the families
+# the pairwise rows x_A + x_B <= 1 allowed, for random graphs and for conflict graphs of the scripts
+
+import random
+
+import pytest
+
+from extremal.cliques import cover_edges_with_cliques
+from extremal.problems.conjecture_3_6 import product_disjoint_pairs
+from extremal.problems.example_1 import comparable_pairs
+from extremal.shards import pairs_of
+from extremal.subsets import all_subsets, k_subsets, to_bitmask
+
+
+# function which checks that the cliques cover exactly the edges of the graph
+def check_cover(num_vertices, edges, cliques):
+    edges = set((min(u, v), max(u, v)) for u, v in edges if u != v)
+    covered = set()
+    for clique in cliques:
+        assert len(set(clique)) == len(clique)
+        assert all(0 <= v < num_vertices for v in clique)
+        for i in range(len(clique)):
+            for j in range(i + 1, len(clique)):
+                pair = (min(clique[i], clique[j]), max(clique[i], clique[j]))
+                # every pair of a clique conflicts
+                assert pair in edges
+                covered.add(pair)
+    # every conflict is in a clique
+    assert covered == edges
+
+
+@pytest.mark.parametrize('num_vertices, density', [(1, 0.5), (8, 0.0), (8, 1.0), (12, 0.3), (20, 0.5), (30, 0.8)])
+def test_random_graphs(num_vertices, density):
+    generator = random.Random(num_vertices)
+    for trial in range(10):
+        edges = [(u, v) for u in range(num_vertices) for v in range(u + 1, num_vertices) if generator.random() < density]
+        # repeated and reversed edges and loops are allowed
+        edges += [(v, u) for u, v in edges[:3]] + [(0, 0)]
+        check_cover(num_vertices, edges, cover_edges_with_cliques(num_vertices, edges))
+
+
+@pytest.mark.parametrize('n', [2, 3, 4, 5])
+def test_comparability_graph(n):
+    # the conflicts of Example_1
+    masks = [to_bitmask(subset) for subset in all_subsets(n)]
+    position = {mask: index for index, mask in enumerate(masks)}
+    edges = pairs_of(*comparable_pairs(0, len(masks), (masks, position, (1 << n) - 1)))
+    check_cover(len(masks), edges, cover_edges_with_cliques(len(masks), edges))
+
+
+@pytest.mark.parametrize('n1, n2, k, l', [(3, 3, 1, 1), (4, 4, 2, 1), (5, 5, 2, 2)])
+def test_disjointness_graph(n1, n2, k, l):
+    # the conflicts of Conjecture 3.6
+    X1_subsets = list(k_subsets(n1, k))
+    X2_subsets = list(k_subsets(n2, l))
+    num_vertices = len(X1_subsets)*len(X2_subsets)
+    edges = product_disjoint_pairs(X1_subsets, X2_subsets)
+    check_cover(num_vertices, edges, cover_edges_with_cliques(num_vertices, edges))
+
+
+def test_seed_cliques():
+    edges = [(0, 1), (0, 2), (1, 2), (2, 3)]
+    cliques = cover_edges_with_cliques(4, edges, seed_cliques = [(0, 1, 2)])
+    assert cliques[0] == [0, 1, 2]
+    check_cover(4, edges, cliques)
+    # a seed which is not a clique is refused
+    with pytest.raises(ValueError):
+        cover_edges_with_cliques(4, edges, seed_cliques = [(0, 1, 3)])
@@ -0,0 +1,23 @@
+# Checks of the rows of Conjecture 3.10 in extremal/problems/conjecture_3_10.py: the families
+# walked through by submasks of the free elements are exactly the families of s distinct pairwise
+# disjoint members of 2^[n] found by testing every s sets, as the script did before, each once
+
+import itertools
+
+import pytest
+
+from extremal.problems.conjecture_3_10 import disjoint_families
+
+
+# the families of s distinct pairwise disjoint members of 2^[n], every s sets tested
+def families_by_testing(n, s):
+    return [family for family in itertools.combinations(range(1 << n), s)
+            if all(a & b == 0 for a, b in itertools.combinations(family, 2))]
+
+
+@pytest.mark.parametrize('n, s', [(1, 1), (2, 2), (3, 2), (3, 3), (4, 2), (4, 3), (4, 4), (5, 3), (5, 4), (4, 6), (3, 0)])
+def test_disjoint_families(n, s):
+    found = [tuple(sorted(family)) for family in disjoint_families(n, s)]
+    # every family once
+    assert len(set(found)) == len(found)
+    assert sorted(found) == families_by_testing(n, s)
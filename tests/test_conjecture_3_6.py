@@ -0,0 +1,40 @@
+# Checks of the conflicts of Conjectures 3.6 and 3.7 in extremal/problems/conjecture_3_6.py: the
+# pairs read off the factor Kneser graphs are exactly the disjoint pairs of the product family
+# found by testing every pair, as the scripts did before
+
+import pytest
+
+from extremal.problems.conjecture_3_6 import generate_disjoint_pairs, product_disjoint_pairs
+from extremal.subsets import k_subsets
+
+
+# the disjoint pairs (i, j), i < j, of a list of subsets, every pair tested element by element
+def pairwise_disjoint_pairs(subsets):
+    pairs = set()
+    for i in range(len(subsets)):
+        for j in range(i + 1, len(subsets)):
+            if not any(a + b == 2 for a, b in zip(subsets[i], subsets[j])):
+                pairs.add((i, j))
+    return pairs
+
+
+@pytest.mark.parametrize('n1, n2, k, l', [(1, 1, 0, 0), (2, 3, 0, 1), (3, 3, 1, 1), (4, 4, 2, 2), (5, 5, 2, 2),
+                                          (5, 4, 2, 1), (6, 5, 3, 2), (6, 6, 2, 3), (4, 5, 0, 2), (3, 2, 3, 2)])
+def test_product_disjoint_pairs(n1, n2, k, l):
+    X1_subsets = list(k_subsets(n1, k))
+    X2_subsets = list(k_subsets(n2, l))
+    product = [setone + settwo for setone in X1_subsets for settwo in X2_subsets]
+    conflicts = product_disjoint_pairs(X1_subsets, X2_subsets)
+    # every pair once, the smaller position first
+    assert all(i < j for i, j in conflicts)
+    assert len(set(conflicts)) == len(conflicts)
+    assert set(conflicts) == pairwise_disjoint_pairs(product)
+
+
+@pytest.mark.parametrize('n, k', [(1, 0), (3, 0), (4, 1), (5, 2), (6, 3)])
+def test_kneser_pairs(n, k):
+    subsets = list(k_subsets(n, k))
+    pairs = generate_disjoint_pairs(subsets)
+    # the empty set is disjoint from itself, every other pair is an edge of the Kneser graph
+    loops = {(i, i) for i in range(len(subsets)) if not any(subsets[i])}
+    assert set(pairs) == pairwise_disjoint_pairs(subsets) | loops
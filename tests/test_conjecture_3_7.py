@@ -0,0 +1,50 @@
+# Checks of the covering rows of Conjecture 3.7 in extremal/problems/conjecture_3_7.py: the strict
+# supersets found with the superset index of each factor are exactly those found by testing every
+# set of the product family, as the script did before
+
+import itertools
+import random
+
+import pytest
+
+from extremal.problems.conjecture_3_7 import strict_superset_positions
+from extremal.subsets import k_subsets
+
+
+# the positions of the strict supersets of subset in the product family, every set tested element
+# by element. The script compared a tuple of the family with a list of S, so a set of S which is in
+# the family counted as its own superset, here it does not (the rows are the same for the sets of
+# S outside the family, e.g. those of Conjecture_3.7.py)
+def superset_positions_by_testing(subset, product):
+    return [position for position, given_set in enumerate(product)
+            if given_set != tuple(subset) and all(a <= b for a, b in zip(subset, given_set))]
+
+
+@pytest.mark.parametrize('n1, n2, k, l', [(3, 3, 1, 1), (4, 4, 2, 2), (5, 5, 2, 2), (5, 4, 3, 1), (4, 5, 0, 2), (3, 3, 3, 3)])
+def test_strict_superset_positions(n1, n2, k, l):
+    X1_subsets = list(k_subsets(n1, k))
+    X2_subsets = list(k_subsets(n2, l))
+    product = [setone + settwo for setone in X1_subsets for settwo in X2_subsets]
+    # every set of the product family itself, and random sets of any size, including sets which
+    # have no superset in the family
+    generator = random.Random(n1*n2 + k + l)
+    S = list(product) + [tuple(generator.randint(0, 1) for index in range(n1 + n2)) for trial in range(40)]
+    found = list(strict_superset_positions(S, X1_subsets, X2_subsets, n1, n2, k, l))
+    assert len(found) == len(S)
+    for subset, positions in zip(S, found):
+        assert sorted(positions) == superset_positions_by_testing(subset, product)
+
+
+def test_generator_of_sets():
+    # S may be a generator, here all the pairs inside X1 or inside X2 as in Conjecture_3.7.py
+    n1, n2, k, l = 5, 5, 2, 2
+    X1_subsets = list(k_subsets(n1, k))
+    X2_subsets = list(k_subsets(n2, l))
+    product = [setone + settwo for setone in X1_subsets for settwo in X2_subsets]
+    pairs = list(itertools.chain(itertools.combinations(range(5), 2), itertools.combinations(range(5, 10), 2)))
+    S = ([1 if index in pair else 0 for index in range(10)] for pair in pairs)
+    found = list(strict_superset_positions(S, X1_subsets, X2_subsets, n1, n2, k, l))
+    assert len(found) == len(pairs)
+    for pair, positions in zip(pairs, found):
+        subset = [1 if index in pair else 0 for index in range(10)]
+        assert sorted(positions) == superset_positions_by_testing(subset, product)
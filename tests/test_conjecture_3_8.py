@@ -0,0 +1,70 @@
+# Checks of the sets and conflicts of Conjecture 3.8 in extremal/problems/conjecture_3_8.py: the
+# sets built part by part are exactly those the script kept from all the k-subsets of [n], in the
+# same order, and the disjoint pairs are those found by testing every pair
+
+import pytest
+
+from extremal.problems.conjecture_3_8 import disjoint_pairs, partition_subsets
+from extremal.subsets import to_bitmask
+
+
+# all the k-subsets of [n] element by element, as the script generated them, keeping those with at
+# least partitions_size[i] elements of every part
+def filtered_subsets(n, k, partitions, partitions_size):
+    binarystrings = []
+
+    def generate(localstring, index, cost):
+        if cost == k:
+            for i in range(len(partitions)):
+                num_intersected = sum(1 for index in range(n) if localstring[index] + partitions[i][index] == 2)
+                if num_intersected < partitions_size[i]:
+                    return
+            binarystrings.append(tuple(localstring))
+            return
+        if index == n:
+            return
+        localstring[index] = 1
+        generate(localstring, index + 1, cost + 1)
+        localstring[index] = 0
+        generate(localstring, index + 1, cost)
+
+    generate([0 for i in range(n)], 0, 0)
+    return binarystrings
+
+
+# the part of [n] given by its elements (indices) as a string of 0s and 1s
+def part(n, indices):
+    return [1 if index in indices else 0 for index in range(n)]
+
+
+CASES = [
+    (7, 4, [part(7, [0, 1, 2]), part(7, [3, 4, 5, 6])], [1, 2]),
+    (8, 4, [part(8, [0, 1, 2, 3]), part(8, [4, 5, 6, 7])], [2, 1]),
+    (8, 3, [part(8, [0, 1, 2]), part(8, [5, 6])], [1, 1]),
+    (9, 4, [part(9, [0, 1, 2]), part(9, [3, 4, 5]), part(9, [6, 7, 8])], [2, 1, 1]),
+    (6, 3, [part(6, [1, 3])], [2]),
+    (6, 2, [part(6, [0, 1, 2])], [3]),
+    (5, 2, [], []),
+    (6, 0, [part(6, [0])], [0]),
+]
+
+
+@pytest.mark.parametrize('n, k, partitions, partitions_size', CASES)
+def test_partition_subsets(n, k, partitions, partitions_size):
+    assert partition_subsets(n, k, partitions, partitions_size) == filtered_subsets(n, k, partitions, partitions_size)
+
+
+@pytest.mark.parametrize('n, k, partitions, partitions_size', CASES)
+def test_disjoint_pairs(n, k, partitions, partitions_size):
+    binarystrings = partition_subsets(n, k, partitions, partitions_size)
+    position = {to_bitmask(subset): i for i, subset in enumerate(binarystrings)}
+    first, second = disjoint_pairs(0, len(binarystrings), (binarystrings, position, n, k))
+    expected = [(i, j) for i in range(len(binarystrings)) for j in range(i + 1, len(binarystrings))
+                if not any(a + b == 2 for a, b in zip(binarystrings[i], binarystrings[j]))]
+    assert list(zip(first, second)) == expected
+
+
+def test_overlapping_parts():
+    # the element 3 is in both parts
+    with pytest.raises(ValueError):
+        partition_subsets(7, 4, [part(7, [0, 1, 2]), part(7, [2, 3, 4])], [1, 1])
@@ -0,0 +1,79 @@
+# Checks of the constraint blocks of extremal/incidence.py: the degree dominance, covering and
+# regularity rows built from the columns of the incidence matrix have the same coefficients as the
+# rows the scripts built by testing every set of the family, as they did before
+
+import random
+
+import pytest
+
+from extremal.incidence import Incidence, degree_rows, missed_rows, rank, regularity_rows
+from extremal.subsets import k_subsets
+
+
+# the coefficients of a row as a dictionary from the positions, without the sets which cancel out
+def coefficients(terms):
+    row = {}
+    for position, coefficient in terms:
+        row[position] = row.get(position, 0) + coefficient
+    return {position: coefficient for position, coefficient in row.items() if coefficient != 0}
+
+
+# the families of the tests: all the k-subsets of [n], a random part of them and random sets of
+# any size
+def families():
+    generator = random.Random(3)
+    for n, k in [(4, 2), (5, 2), (6, 3), (7, 3)]:
+        subsets = list(k_subsets(n, k))
+        yield n, subsets
+        yield n, [subset for subset in subsets if generator.random() < 0.5]
+        yield n, [tuple(generator.randint(0, 1) for index in range(n)) for trial in range(20)]
+
+
+FAMILIES = list(families())
+
+
+@pytest.mark.parametrize('n, subsets', FAMILIES)
+def test_degree_rows(n, subsets):
+    # |F(i)| - |F(1)| <= 0 for every element i other than 1, as in Conjecture_3.3.py
+    expected = []
+    for i in range(1, n):
+        terms = []
+        for position, subset in enumerate(subsets):
+            if subset[0] != 0:
+                terms.append((position, -1))
+            if subset[i] != 0:
+                terms.append((position, 1))
+        expected.append((coefficients(terms), '<', 0))
+    rows = degree_rows(Incidence(subsets, n), 0)
+    assert [(coefficients(terms), sense, rhs) for terms, sense, rhs in rows] == expected
+
+
+@pytest.mark.parametrize('n, subsets', FAMILIES)
+def test_missed_rows(n, subsets):
+    # for every element, the sets missing it, as in Conjecture_3.6.py
+    expected = [({position: 1 for position, given_set in enumerate(subsets) if given_set[index] == 0}, '>', 1)
+                for index in range(n)]
+    rows = missed_rows(Incidence(subsets, n))
+    assert [(coefficients(terms), sense, rhs) for terms, sense, rhs in rows] == expected
+
+
+@pytest.mark.parametrize('n, subsets', FAMILIES)
+@pytest.mark.parametrize('s', [1, 2])
+def test_regularity_rows(n, subsets, s):
+    # the sets containing {1, ..., s} less those containing the s-set, as in Theorem_3.9.py, for
+    # every s-set by its rank. The row of {1, ..., s} itself is 0 = 0 and is left out
+    first = list(k_subsets(n, s))[0]
+    expected = {}
+    for setone in k_subsets(n, s):
+        terms = []
+        for position, settwo in enumerate(subsets):
+            if all(a <= b for a, b in zip(first, settwo)):
+                terms.append((position, 1))
+            if all(a <= b for a, b in zip(setone, settwo)):
+                terms.append((position, -1))
+        elements = [index for index in range(n) if setone[index]]
+        expected[rank(elements)] = coefficients(terms)
+    assert expected.pop(0) == {}
+    rows = regularity_rows(Incidence(subsets, n), s)
+    assert all(sense == '=' and rhs == 0 for terms, sense, rhs in rows)
+    assert {r + 1: coefficients(terms) for r, (terms, sense, rhs) in enumerate(rows)} == expected
@@ -0,0 +1,90 @@
+# Checks of the canonical forms and orbits of extremal/isomorphism.py against the brute force over
+# all the permutations of [n], for all the families of 2^[3] and random families at n = 4 and 5
+
+import itertools
+import random
+
+import pytest
+
+from extremal.isomorphism import canonical_form, certificate, orbit, permute_family, sorted_family
+
+
+# the smallest image of a family over all the permutations, equal exactly for isomorphic families
+def brute_force_form(family, n):
+    return min(permute_family(family, permutation) for permutation in itertools.permutations(range(n)))
+
+
+# the set of all the images of a family
+def brute_force_orbit(family, n):
+    return {permute_family(family, permutation) for permutation in itertools.permutations(range(n))}
+
+
+# random families of one or two groups of subsets of [n]
+def random_families(n, count, seed):
+    generator = random.Random(seed)
+    families = []
+    for index in range(count):
+        groups = 1 + index % 2
+        families.append(tuple(generator.sample(range(1 << n), generator.randint(0, min(8, 1 << n)))
+                              for group in range(groups)))
+    return families
+
+
+def test_all_families_of_small_ground_set():
+    n = 3
+    families = [([mask for mask in range(1 << n) if (bits >> mask) & 1],) for bits in range(1 << (1 << n))]
+    by_certificate = {}
+    by_brute_force = {}
+    for index, family in enumerate(families):
+        by_certificate.setdefault(certificate(family, n), set()).add(index)
+        by_brute_force.setdefault(brute_force_form(family, n), set()).add(index)
+    # the certificates split the families into the isomorphism classes
+    assert sorted(map(sorted, by_certificate.values())) == sorted(map(sorted, by_brute_force.values()))
+
+
+@pytest.mark.parametrize('n', [4, 5])
+def test_relabellings_have_the_same_certificate(n):
+    generator = random.Random(n)
+    for family in random_families(n, 60, n):
+        form, permutation = canonical_form(family, n)
+        # the certificate is the image of the family under the returned permutation
+        assert permute_family(family, permutation) == form
+        for trial in range(5):
+            relabelling = list(range(n))
+            generator.shuffle(relabelling)
+            assert certificate(permute_family(family, relabelling), n) == form
+
+
+@pytest.mark.parametrize('n', [4, 5])
+def test_certificates_separate_non_isomorphic_families(n):
+    generator = random.Random(n)
+    families = random_families(n, 50, 10 + n)
+    # relabelled copies, so that there are isomorphic pairs among them
+    for family in families[:25]:
+        relabelling = list(range(n))
+        generator.shuffle(relabelling)
+        families.append(permute_family(family, relabelling))
+    for first, second in itertools.combinations(families, 2):
+        if len(first) != len(second):
+            continue
+        isomorphic = brute_force_form(first, n) == brute_force_form(second, n)
+        assert (certificate(first, n) == certificate(second, n)) == isomorphic
+
+
+# very symmetric families, where the swap pruning skips most of the search
+@pytest.mark.parametrize('n', [4, 5, 6])
+def test_symmetric_families(n):
+    layer = [mask for mask in range(1 << n) if bin(mask).count('1') == 2]
+    star = [mask for mask in range(1 << n) if mask & 1]
+    for family in [(layer,), (star,), (layer, star), ([],), (list(range(1 << n)),)]:
+        relabelling = list(reversed(range(n)))
+        assert certificate(family, n) == certificate(permute_family(family, relabelling), n)
+    assert certificate((star,), n) != certificate(([mask for mask in range(1 << n) if mask & 2 and mask != 2],), n)
+
+
+@pytest.mark.parametrize('n', [3, 4])
+def test_orbit(n):
+    for family in random_families(n, 30, 20 + n):
+        assert set(orbit(family, n)) == brute_force_orbit(sorted_family(family), n)
+    family = random_families(n, 1, 30)[0]
+    assert len(orbit(family, n, 2)) <= 2
@@ -0,0 +1,97 @@
+# Checks of the layer LP of extremal/layers.py without a solver: the rows of the separators hold
+# for every feasible family of 2^[4] (found by brute force), and the certified bound of any duals
+# is at least the largest feasible family
+
+import itertools
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from extremal.layers import best_multiset, certified_bound, chain_row, disjoint_parts_separator, far_parts_separator
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+# all the families of 2^[n] (as lists of bitmasks) in which no two members, or a member with
+# itself, are in conflict
+def feasible_families(n, conflict):
+    sets = range(1 << n)
+    conflicts = [sum(1 << b for b in sets if conflict(a, b)) for a in sets]
+    families = []
+    for bits in range(1 << (1 << n)):
+        members = [a for a in sets if (bits >> a) & 1]
+        if all(not conflicts[a] & bits for a in members):
+            families.append(members)
+    return families
+
+
+# the fractions y_k of the layers taken by a family
+def layer_fractions(family, n):
+    return [Fraction(sum(1 for mask in family if popcount(mask) == k), math.comb(n, k)) for k in range(n + 1)]
+
+
+def holds(row, family, n):
+    coefficients, rhs = row
+    y = layer_fractions(family, n)
+    return sum(coefficient*y[k] for k, coefficient in coefficients.items()) <= rhs
+
+
+@pytest.mark.parametrize('budget', range(0, 9))
+def test_best_multiset(budget):
+    values = [0.0, 0.3, 0.7, 0.9, 1.3, 1.0]
+    sizes = range(1, 6)
+    value, counts = best_multiset(values, sizes, budget)
+    # every multiset of sizes with total at most budget is worth at most value
+    best = 0.0
+    for combination in itertools.chain.from_iterable(itertools.combinations_with_replacement(sizes, m) for m in range(budget + 1)):
+        if sum(combination) <= budget:
+            best = max(best, sum(values[k] for k in combination))
+    assert value == pytest.approx(best)
+    assert sum(k*count for k, count in counts.items()) <= budget
+    assert sum(values[k]*count for k, count in counts.items()) == pytest.approx(value)
+
+
+# the LYM inequality: the chain row with dual (n choose n/2) certifies Sperner's bound
+@pytest.mark.parametrize('n', range(1, 12))
+def test_chain_row(n):
+    assert certified_bound(n, [chain_row(n)], [math.comb(n, n//2)]) == math.comb(n, n//2)
+    # without rows the bound is the whole power set, and negative duals are ignored
+    assert certified_bound(n, [chain_row(n)], [0]) == 2**n
+    assert certified_bound(n, [chain_row(n)], [-1]) == 2**n
+
+
+# Conjecture_3.10 with s = 2 (intersecting families) and s = 3, and Conjecture_3.1 with d = 2
+@pytest.mark.parametrize('name, separator, conflict, rows', [
+    ('no 2 disjoint', disjoint_parts_separator(4, 2), lambda a, b: a & b == 0, []),
+    ('no 3 disjoint', disjoint_parts_separator(4, 3), None, []),
+    ('antichain of diameter 2', far_parts_separator(4, 2), lambda a, b: a != b and (a & ~b == 0 or b & ~a == 0 or popcount(a ^ b) > 2),
+     [chain_row(4)]),
+])
+def test_separator_rows_and_bounds(name, separator, conflict, rows):
+    n = 4
+    if conflict is None:
+        # no 3 pairwise disjoint members, which is not a pairwise condition
+        def has_three_disjoint(family):
+            return any(not a & b and not a & c and not b & c for a, b, c in itertools.combinations(family, 3))
+        families = [[a for a in range(1 << n) if (bits >> a) & 1] for bits in range(1 << (1 << n))]
+        families = [family for family in families if not has_three_disjoint(family)]
+    else:
+        families = feasible_families(n, conflict)
+    largest = max(len(family) for family in families)
+
+    generator = random.Random(name)
+    rows = list(rows)
+    for trial in range(20):
+        values = [generator.random() for k in range(n + 1)]
+        rows.extend(separator(values))
+    # the rows hold for every feasible family
+    for row in rows:
+        assert all(holds(row, family, n) for family in families)
+    # any duals certify a bound on the largest feasible family
+    for trial in range(20):
+        duals = [Fraction(generator.randint(0, 8), generator.randint(1, 4)) for row in rows]
+        assert certified_bound(n, rows, duals) >= largest
@@ -0,0 +1,53 @@
+# Checks of the maximum clique and maximum independent set search of extremal/mis.py against
+# exhaustive search on random graphs and on the conflict graphs of Example_1
+
+import itertools
+import math
+import random
+
+import pytest
+
+from extremal.mis import maximum_clique, maximum_independent_set
+
+
+# the size of a largest independent set, by trying every set of vertices
+def brute_force_independence_number(num_vertices, edges):
+    adjacent = set(edges) | {(v, u) for u, v in edges}
+    best = 0
+    for mask in range(1 << num_vertices):
+        vertices = [v for v in range(num_vertices) if (mask >> v) & 1]
+        if len(vertices) > best and not any((u, v) in adjacent for u, v in itertools.combinations(vertices, 2)):
+            best = len(vertices)
+    return best
+
+
+def random_graph(num_vertices, density, seed):
+    generator = random.Random(seed)
+    return [(u, v) for u, v in itertools.combinations(range(num_vertices), 2) if generator.random() < density]
+
+
+@pytest.mark.parametrize('num_vertices', [0, 1, 2, 5, 9, 13])
+@pytest.mark.parametrize('density', [0.0, 0.2, 0.5, 0.8, 1.0])
+def test_maximum_independent_set(num_vertices, density):
+    for seed in range(4):
+        edges = random_graph(num_vertices, density, seed)
+        independent = maximum_independent_set(num_vertices, edges)
+        # the set is independent and as large as the largest one
+        assert independent == sorted(set(independent))
+        assert not any((u, v) in set(edges) for u, v in itertools.combinations(independent, 2))
+        assert len(independent) == brute_force_independence_number(num_vertices, edges)
+
+
+# the antichains of 2^[n] are the independent sets of the comparability graph, the largest one is
+# a middle layer (Sperner)
+@pytest.mark.parametrize('n', [2, 3, 4])
+def test_sperner(n):
+    edges = [(a, b) for a, b in itertools.combinations(range(1 << n), 2) if a & b == a or a & b == b]
+    assert len(maximum_independent_set(1 << n, edges)) == math.comb(n, n//2)
+
+
+def test_lower_bound():
+    # the triangle has no clique larger than 3
+    adjacency = [0b110, 0b101, 0b011]
+    assert maximum_clique(adjacency) == [0, 1, 2]
+    assert maximum_clique(adjacency, 3) == []
@@ -0,0 +1,82 @@
+# Checks of the sharded generation of extremal/shards.py: the blocks generated by a pool of
+# processes and merged are the blocks generated in this process, the pairs and rows read off the
+# merged columns are those of the generators, and the comparable pairs of Example_1 found by
+# walking through the supersets are those found by testing every pair
+
+from array import array
+
+import pytest
+
+from extremal.problems.conjecture_3_2 import far_pairs_and_chains
+from extremal.problems.example_1 import comparable_pairs
+from extremal.shards import MIN_SHARDED_COUNT, generate_sharded, pairs_of, rows_of, shard_ranges
+from extremal.specs import chain_rows
+from extremal.subsets import all_subsets, to_bitmask
+
+
+# the bitmasks of all the subsets of [n] and their positions
+def masks_of(n):
+    masks = [to_bitmask(subset) for subset in all_subsets(n)]
+    return masks, {mask: index for index, mask in enumerate(masks)}
+
+
+@pytest.mark.parametrize('count, shards', [(1, 8), (10, 3), (100, 7), (5, 5), (7, 100)])
+def test_shard_ranges(count, shards):
+    ranges = shard_ranges(count, shards)
+    assert len(ranges) <= shards
+    # the shards are consecutive, non-empty and cover range(count)
+    assert ranges[0][0] == 0 and ranges[-1][1] == count
+    assert all(start < stop for start, stop in ranges)
+    assert all(ranges[i][1] == ranges[i + 1][0] for i in range(len(ranges) - 1))
+
+
+def test_pairs_and_rows_of():
+    assert pairs_of(array('q', [0, 0, 2]), array('q', [1, 3, 3])) == [(0, 1), (0, 3), (2, 3)]
+    assert pairs_of(array('q'), array('q')) == []
+    assert rows_of(array('q', [2, 3, 1]), array('q', [4, 5, 0, 1, 2, 7])) == [[4, 5], [0, 1, 2], [7]]
+    assert rows_of(array('q'), array('q')) == []
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 4, 5, 6])
+def test_comparable_pairs(n):
+    masks, position = masks_of(n)
+    first, second = comparable_pairs(0, len(masks), (masks, position, (1 << n) - 1))
+    expected = [(i, j) for i in range(len(masks)) for j in range(len(masks))
+                if i != j and masks[i] & masks[j] == masks[i]]
+    assert pairs_of(first, second) == expected
+
+
+def test_sharded_pairs():
+    n = 9
+    masks, position = masks_of(n)
+    assert len(masks) >= MIN_SHARDED_COUNT
+    data = (masks, position, (1 << n) - 1)
+    serial = generate_sharded(comparable_pairs, len(masks), data, workers = 1)
+    sharded = generate_sharded(comparable_pairs, len(masks), data, workers = 4)
+    assert pairs_of(*sharded) == pairs_of(*serial)
+
+
+def test_sharded_rows():
+    n, l = 8, 2
+    masks, position = masks_of(n)
+    serial = generate_sharded(chain_rows, len(masks), (masks, position, l), workers = 1)
+    sharded = generate_sharded(chain_rows, len(masks), (masks, position, l), workers = 3)
+    assert rows_of(*sharded) == rows_of(*serial)
+    # every row is a chain of l + 1 sets
+    for row in rows_of(*sharded):
+        assert len(row) == l + 1
+        chain = sorted((masks[p] for p in row), key = lambda mask: bin(mask).count('1'))
+        assert all(chain[i] & chain[i + 1] == chain[i] != chain[i + 1] for i in range(l))
+
+
+def test_sharded_pairs_and_rows():
+    # a block of four columns, the pairs and the rows of Conjecture 3.2
+    n, d, l = 8, 3, 2
+    binarystrings = list(all_subsets(n))
+    masks = [to_bitmask(subset) for subset in binarystrings]
+    data = (binarystrings, masks, n, d, l)
+    serial = generate_sharded(far_pairs_and_chains, len(binarystrings), data, workers = 1)
+    sharded = generate_sharded(far_pairs_and_chains, len(binarystrings), data, workers = 4)
+    assert len(sharded) == 4
+    assert pairs_of(*sharded[:2]) == pairs_of(*serial[:2])
+    assert rows_of(*sharded[2:]) == rows_of(*serial[2:])
@@ -0,0 +1,117 @@
+# Checks of the specifications of extremal/specs.py: parsing, and the generators of the rows
+# compared with the configurations found by brute force over all the tuples of sets
+
+import itertools
+
+import pytest
+
+from extremal.cuts import to_bitmask
+from extremal.specs import (chain_rows, conflicting_pairs, disjoint_rows, disjoint_triangle_rows, format_spec,
+                            ground_subsets, parse_spec, positions_of)
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+# the rows of a generator as a set of sorted tuples of positions, generated in two shards
+def rows_of(generator, size, data):
+    rows = set()
+    for start, stop in [(0, size//3), (size//3, size)]:
+        lengths, positions = generator(start, stop, data)
+        offset = 0
+        for length in lengths:
+            row = tuple(sorted(positions[offset:offset + length]))
+            # every configuration is listed once
+            assert row not in rows
+            rows.add(row)
+            offset += length
+        assert offset == len(positions)
+    return rows
+
+
+def masks_of(text):
+    return [to_bitmask(subset) for subset in ground_subsets(parse_spec(text))]
+
+
+@pytest.mark.parametrize('text', [
+    'antichain & diameter <= 3 over 2^[5], maximize size',
+    'intersecting and regular 1 over ([6] choose 3), maximize diversity',
+    'no_disjoint_triangles 2 over ([7] choose 2), maximize size',
+    'covering over ([3] choose 1) x ([4] choose 2), maximize size',
+    'over 2^[3], maximize size',
+])
+def test_normal_form(text):
+    spec = parse_spec(text)
+    assert parse_spec(format_spec(spec)) == spec
+
+
+@pytest.mark.parametrize('text', [
+    'antichain over 2^[n], maximize size',
+    'intersecting over ([3] choose 4), maximize size',
+    'diameter over 2^[4], maximize size',
+    'antichain 2 over 2^[4], maximize size',
+    'unknown over 2^[4], maximize size',
+    'antichain over 2^[4], maximize weight',
+    'no_disjoint_triangles 2 over 2^[4], maximize size',
+    'over ([3] choose 1) x ([2] choose 1), maximize diversity',
+])
+def test_invalid_specifications(text):
+    with pytest.raises(ValueError):
+        parse_spec(text)
+
+
+@pytest.mark.parametrize('conditions', [[('antichain',)], [('intersecting',)], [('diameter', 2)],
+                                        [('antichain',), ('diameter', 3)], [('intersecting',), ('diameter', 1)]])
+@pytest.mark.parametrize('text', ['over 2^[5], maximize size', 'over ([6] choose 3), maximize size'])
+def test_conflicting_pairs(conditions, text):
+    masks = masks_of(text)
+    first, second = conflicting_pairs(0, len(masks), (masks, conditions))
+    found = set(zip(first, second))
+    expected = set()
+    for i, j in itertools.combinations(range(len(masks)), 2):
+        a, b = masks[i], masks[j]
+        for condition in conditions:
+            if ((condition[0] == 'antichain' and (a & ~b == 0 or b & ~a == 0)) or (condition[0] == 'intersecting' and not a & b)
+                    or (condition[0] == 'diameter' and popcount(a ^ b) > condition[1])):
+                expected.add((i, j))
+    assert found == expected
+
+
+@pytest.mark.parametrize('n, l', [(4, 1), (4, 2), (5, 2), (5, 3)])
+def test_chain_rows(n, l):
+    masks = masks_of('over 2^[{}], maximize size'.format(n))
+    position = positions_of(masks)
+    expected = set()
+    for chain in itertools.combinations(range(len(masks)), l + 1):
+        ordered = sorted(chain, key = lambda i: popcount(masks[i]))
+        if all(masks[a] != masks[b] and masks[a] & ~masks[b] == 0 for a, b in zip(ordered, ordered[1:])):
+            expected.add(tuple(sorted(chain)))
+    assert rows_of(chain_rows, len(masks), (masks, position, l)) == expected
+
+
+@pytest.mark.parametrize('text, s', [('over 2^[4], maximize size', 2), ('over 2^[4], maximize size', 3),
+                                     ('over 2^[5], maximize size', 3), ('over ([6] choose 2), maximize size', 3),
+                                     ('over ([2] choose 1) x ([3] choose 1), maximize size', 2)])
+def test_disjoint_rows(text, s):
+    spec = parse_spec(text)
+    masks = masks_of(text)
+    position = positions_of(masks)
+    expected = set()
+    for members in itertools.combinations(range(len(masks)), s):
+        if all(not masks[a] & masks[b] for a, b in itertools.combinations(members, 2)):
+            expected.add(members)
+    assert rows_of(disjoint_rows, len(masks), (masks, position, spec['n'], s)) == expected
+
+
+@pytest.mark.parametrize('n, k', [(6, 2), (7, 2), (9, 3)])
+def test_disjoint_triangle_rows(n, k):
+    masks = masks_of('over ([{}] choose 2), maximize size'.format(n))
+    position = positions_of(masks)
+    triangles = sorted((1 << u) | (1 << v) | (1 << w) for u, v, w in itertools.combinations(range(n), 3))
+    expected = set()
+    for family in itertools.combinations(triangles, k):
+        if all(not a & b for a, b in itertools.combinations(family, 2)):
+            edges = [position[triangle & ~(1 << vertex)] for triangle in family for vertex in range(n) if (triangle >> vertex) & 1]
+            expected.add(tuple(sorted(edges)))
+    assert rows_of(disjoint_triangle_rows, len(triangles), (triangles, position, k)) == expected
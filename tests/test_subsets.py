@@ -0,0 +1,97 @@
+# Checks of the iterators and the rank/unrank functions of extremal/subsets.py against the
+# recursive generators the scripts used before, for all the small parameters. Run them from the
+# top of the repository with python -m pytest tests
+
+import itertools
+import math
+
+import pytest
+
+from extremal.subsets import (all_subsets, gosper, k_subset_rank, k_subset_unrank, k_subsets, product_rank,
+                              product_subsets, product_unrank, subset_rank, subset_unrank)
+
+
+# the generator of 2^[n] of the original scripts (e.g. Conjecture_3.1.py)
+def recursive_subsets(n):
+    binarystrings = []
+
+    def generate_all_possible_subsets(localstring, index):
+        if index == n:
+            binarystrings.append(tuple(localstring))
+            return
+        localstring[index] = 0
+        generate_all_possible_subsets(localstring, index + 1)
+        localstring[index] = 1
+        generate_all_possible_subsets(localstring, index + 1)
+
+    generate_all_possible_subsets([0 for i in range(n)], 0)
+    return binarystrings
+
+
+# the generator of ([n] choose k) of the original scripts (e.g. Conjecture_3.3.py)
+def recursive_k_subsets(n, k):
+    binarystrings = []
+
+    def generate_all_possible_subsets_of_n_of_size_k(localstring, index, cost):
+        if cost == k:
+            binarystrings.append(tuple(localstring))
+            return
+        if index == n:
+            return
+        localstring[index] = 1
+        generate_all_possible_subsets_of_n_of_size_k(localstring, index + 1, cost + 1)
+        localstring[index] = 0
+        generate_all_possible_subsets_of_n_of_size_k(localstring, index + 1, cost)
+
+    generate_all_possible_subsets_of_n_of_size_k([0 for i in range(n)], 0, 0)
+    return binarystrings
+
+
+@pytest.mark.parametrize('n', range(0, 9))
+def test_all_subsets(n):
+    expected = recursive_subsets(n)
+    assert list(all_subsets(n)) == expected
+    for rank, subset in enumerate(expected):
+        assert subset_rank(subset) == rank
+        assert subset_unrank(rank, n) == subset
+    # an iterator started in the middle continues in the same order
+    assert list(all_subsets(n, len(expected)//3, 2*len(expected)//3)) == expected[len(expected)//3:2*len(expected)//3]
+
+
+@pytest.mark.parametrize('n, k', [(n, k) for n in range(0, 10) for k in range(0, n + 1)])
+def test_k_subsets(n, k):
+    expected = recursive_k_subsets(n, k)
+    assert list(k_subsets(n, k)) == expected
+    for rank, subset in enumerate(expected):
+        assert k_subset_rank(subset) == rank
+        assert k_subset_unrank(rank, n, k) == subset
+    for start in range(len(expected)):
+        assert list(k_subsets(n, k, start, start + 3)) == expected[start:start + 3]
+
+
+def test_k_subsets_out_of_range():
+    assert list(k_subsets(3, 4)) == []
+    assert list(k_subsets(3, -1)) == []
+
+
+@pytest.mark.parametrize('n1, n2, k, l', [(3, 3, 1, 2), (4, 2, 2, 1), (4, 4, 2, 2), (2, 5, 0, 3)])
+def test_product_subsets(n1, n2, k, l):
+    expected = [setone + settwo for setone in recursive_k_subsets(n1, k) for settwo in recursive_k_subsets(n2, l)]
+    assert list(product_subsets(n1, n2, k, l)) == expected
+    for rank, subset in enumerate(expected):
+        assert product_rank(subset, n1) == rank
+        assert product_unrank(rank, n1, n2, k, l) == subset
+    for start in range(0, len(expected), 5):
+        assert list(product_subsets(n1, n2, k, l, start, start + 7)) == expected[start:start + 7]
+
+
+# Gosper's hack gives the integers with the same number of 1 bits in increasing order
+@pytest.mark.parametrize('m', range(1, 6))
+def test_gosper(m):
+    codes = sorted(sum(1 << i for i in positions) for positions in itertools.combinations(range(8), m))
+    x = codes[0]
+    found = [x]
+    for step in range(math.comb(8, m) - 1):
+        x = gosper(x)
+        found.append(x)
+    assert found == codes